@@ -1,7 +1,81 @@
 class GeneralConstants:
     # Task statuses
     TASK_STATUSES = ["todo", "in_progress", "review", "done"]
+
+    # Bulk task operations
+    BULK_TASK_LIMIT = 500
+
+    # Kanban board
+    BOARD_COLUMN_LIMIT = 100
+
+    # Delta sync
+    TASK_CHANGES_LIMIT = 500
+
+    # Task detail cache (seconds); version markers outlive entries they guard
+    TASK_CACHE_TTL = 300
+    TASK_VERSION_MARKER_TTL = 600
+
+    # Task export
+    EXPORT_FORMATS = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+    EXPORT_BATCH_SIZE = 1000
+
+    # Task import: rows are validated and copied in chunks; progress records expire after a day
+    IMPORT_CHUNK_SIZE = 1000
+    IMPORT_MAX_ROWS = 100000
+    IMPORT_MAX_ERRORS = 50
+    IMPORT_JOB_TTL = 86400
+
+    # Subtasks: levels of ancestors a task may have, and page size for subtree listings
+    TASK_MAX_DEPTH = 10
+    SUBTASK_LIST_LIMIT = 500
+
+    # Due date reminders: sent this long before a task is due, claimed in batches every poll
+    TASK_REMINDER_LEAD_SECONDS = 3600
+    REMINDER_BATCH_SIZE = 500
+    REMINDER_POLL_INTERVAL_SECONDS = 30
+
+    # Revision history: a full snapshot at least every N versions, history pages of up to M entries
+    TASK_REVISION_SNAPSHOT_INTERVAL = 20
+    TASK_REVISION_PAGE_LIMIT = 100
+
+    # Manual ordering: a column is renumbered once a rank grows past this length
+    TASK_RANK_REBALANCE_LENGTH = 32
     
+    # Activity writer: journaled events are inserted every N events or M milliseconds, and at most
+    # this many are held in memory while Redis is unreachable. A batch failing this many times is
+    # retried one event at a time and events that still fail are dead-lettered. The flush lock
+    # keeps workers from inserting the same batch, and expires in case its holder dies
+    ACTIVITY_FLUSH_BATCH_SIZE = 200
+    ACTIVITY_FLUSH_INTERVAL_MS = 250
+    ACTIVITY_BUFFER_LIMIT = 10000
+    ACTIVITY_MAX_ATTEMPTS = 5
+    ACTIVITY_FLUSH_LOCK_SECONDS = 10
+
+    # Activity retention: days of history an organization keeps (its own setting within the bounds,
+    # or the default), monthly partitions created ahead of time, and how often partitions are maintained
+    ACTIVITY_RETENTION_DAYS = 365
+    ACTIVITY_RETENTION_MIN_DAYS = 30
+    ACTIVITY_RETENTION_MAX_DAYS = 1825
+    ACTIVITY_PARTITIONS_AHEAD = 3
+    ACTIVITY_MAINTENANCE_INTERVAL_SECONDS = 3600
+
+    # Entity display names: entries in the per-process LRU, how long they are trusted
+    # without asking Redis, and how long the Redis hashes live
+    ENTITY_NAME_LOCAL_SIZE = 10000
+    ENTITY_NAME_LOCAL_TTL = 60
+    ENTITY_NAME_CACHE_TTL = 3600
+
+    # Activity time series: default and longest range in days
+    ACTIVITY_TIMESERIES_DEFAULT_DAYS = 30
+    ACTIVITY_TIMESERIES_MAX_DAYS = 366
+
+    # Task counters: projects recounted per reconciliation batch, and how often counters are reconciled
+    TASK_COUNTER_RECONCILE_BATCH_SIZE = 500
+    TASK_COUNTER_RECONCILE_INTERVAL_SECONDS = 3600
+
+    # Dashboard analytics cache (seconds); writes expire it sooner through organization versions
+    DASHBOARD_CACHE_TTL = 300
+
     # Activity limits
     DEFAULT_ACTIVITY_LIMIT = 50
     ORG_ACTIVITY_LIMIT = 100
@@ -21,6 +95,25 @@ class ErrorMessages:
     TASK_NOT_IN_PROJECT = "Task does not belong to this project."
     TASK_MODIFIED = "Task has been modified by another user. Please refresh and try again."
     TASK_VERSION_MISMATCH = "Task version mismatch. The task has been updated by another user. Please refresh and try again."
+    BULK_TASK_NOT_FOUND = "Task {task_id} not found in this project."
+    BULK_TASK_VERSION_MISMATCH = "Task {task_id} has been updated by another user. Please refresh and try again."
+    DUPLICATE_TASK_IN_BULK = "Each task may appear only once in a bulk request."
+    MOVE_ANCHOR_NOT_FOUND = "Reference task not found in the target column."
+    MOVE_ANCHOR_IS_TASK = "A task cannot be placed relative to itself."
+    PARENT_TASK_NOT_FOUND = "Parent task not found in this project."
+    SUBTASK_CYCLE = "A task cannot be placed under itself or one of its subtasks."
+    SUBTASK_TOO_DEEP = "Subtasks cannot be nested that deeply."
+    DEPENDENCY_SELF = "A task cannot depend on itself."
+    DEPENDENCY_BLOCKER_NOT_FOUND = "Blocking task not found in this project."
+    DEPENDENCY_EXISTS = "This dependency already exists."
+    DEPENDENCY_NOT_FOUND = "Dependency not found."
+    DEPENDENCY_CYCLE = "This dependency would create a cycle."
+    REVISION_NOT_FOUND = "No revision history for this version."
+    INVALID_EXPORT_FORMAT = "Invalid export format. Must be 'ndjson' or 'csv'."
+    INVALID_IMPORT_FORMAT = "Invalid import format. Upload a .ndjson or .csv file, or pass format=ndjson|csv."
+    IMPORT_NOT_FOUND = "Import not found."
+    CURSOR_SORT_MISMATCH = "Cursor does not match the requested sort. Restart pagination without a cursor."
+    INVALID_DATE_RANGE = "Invalid date range. 'start' must not be after 'end', and the range may span at most 366 days."
     
     # User errors
     USER_EXISTS = "User with this email already exists."
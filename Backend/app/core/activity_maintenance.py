@@ -0,0 +1,44 @@
+from app.constants import GeneralConstants
+from typing import Optional
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ActivityMaintenance:
+    """Background loop that keeps activity partitions created ahead and archives expired ones."""
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+            logger.info("Activity maintenance started")
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self):
+        from app.managers.activity_partition import ActivityPartitionManager
+
+        while True:
+            try:
+                await ActivityPartitionManager.run_maintenance()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Activity partition maintenance failed: {e}", exc_info=True)
+
+            await asyncio.sleep(GeneralConstants.ACTIVITY_MAINTENANCE_INTERVAL_SECONDS)
+
+
+activity_maintenance = ActivityMaintenance()
@@ -0,0 +1,207 @@
+from app.constants import GeneralConstants
+from app.core.redis_client import redis_client
+from app.utils.redis_cache import CacheKeys
+from tortoise import connections
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Optional
+import asyncio
+import json
+import logging
+import uuid
+
+logger = logging.getLogger(__name__)
+
+
+class ActivityWriter:
+    """
+    Writes activities off the request path.
+
+    Requests append their events to a Redis list that serves as a journal and return; a
+    background loop inserts the head of the journal with one bulk INSERT every
+    ACTIVITY_FLUSH_BATCH_SIZE events or ACTIVITY_FLUSH_INTERVAL_MS, whichever comes first, updates
+    the daily rollups in the same transaction, and only then removes those events from the list.
+    Events therefore outlive the worker that queued them, and any worker finishes the job.
+    A batch that keeps failing is retried one event at a time after ACTIVITY_MAX_ATTEMPTS, and
+    the events the database still rejects move to a dead-letter list instead of blocking the rest.
+    Ids and timestamps are fixed at enqueue time, which keeps retries idempotent and the feed
+    ordered by when things happened rather than when they were written.
+    While Redis is unreachable, events wait in an in-process buffer instead.
+    """
+
+    def __init__(self):
+        self._buffer: Deque[Dict[str, Any]] = deque()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._token = str(uuid.uuid4())
+        # Id of the journal head whose batch last failed here, and how many times in a row
+        self._failed_head: Optional[str] = None
+        self._failed_attempts = 0
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+            logger.info("Activity writer started")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def enqueue(self, activities: List[Dict[str, Any]]):
+        """Journal activities for the next flush; costs one Redis round trip and never raises into the caller."""
+        if not activities:
+            return
+
+        now = datetime.now(timezone.utc)
+        stamped = [{**activity, 'id': str(uuid.uuid4()), 'created_at': now} for activity in activities]
+
+        # Started lazily too, so scripts and workers without the app lifespan still get their activities written
+        self.start()
+        length = await redis_client.list_push(CacheKeys.activity_pending(), *(self._encode(item) for item in stamped))
+        if not length:
+            self._buffer.extend(stamped)
+            overflow = len(self._buffer) - GeneralConstants.ACTIVITY_BUFFER_LIMIT
+            if overflow > 0:
+                for _ in range(overflow):
+                    self._buffer.popleft()
+                logger.error(f"Activity buffer full, dropped {overflow} oldest activities")
+            length = len(self._buffer)
+
+        if length >= GeneralConstants.ACTIVITY_FLUSH_BATCH_SIZE:
+            self._wakeup.set()
+
+    async def flush(self):
+        """Insert everything journaled or buffered so far."""
+        await self._flush_buffer()
+        if await redis_client.set_if_absent(
+            CacheKeys.activity_flush_lock(), self._token, GeneralConstants.ACTIVITY_FLUSH_LOCK_SECONDS
+        ):
+            try:
+                await self._drain_journal()
+            finally:
+                if await redis_client.get(CacheKeys.activity_flush_lock(), deserialize=False) == self._token:
+                    await redis_client.delete(CacheKeys.activity_flush_lock())
+
+    async def _drain_journal(self):
+        from app.managers.activity import ActivityManager
+
+        key = CacheKeys.activity_pending()
+        while True:
+            raw = await redis_client.list_range(key, GeneralConstants.ACTIVITY_FLUSH_BATCH_SIZE)
+            if not raw:
+                return
+
+            try:
+                await ActivityManager.write_batch([self._decode(item) for item in raw])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Failed to write {len(raw)} journaled activities: {e}")
+                if not await self._isolate_failures(key, raw):
+                    return
+                continue
+
+            # If another worker wrote the same events after our lock expired, it also removed them
+            await redis_client.list_drop_head(key, raw[0], len(raw))
+
+    async def _isolate_failures(self, key: str, raw: List[str]) -> bool:
+        """
+        Count a failed attempt at the batch starting with raw[0]; past ACTIVITY_MAX_ATTEMPTS, write
+        it one event at a time and dead-letter what the database rejects while it is otherwise
+        reachable. Returns whether the batch is off the journal and draining may continue.
+        """
+        from app.managers.activity import ActivityManager
+
+        head_id = json.loads(raw[0])['id']
+        self._failed_attempts = self._failed_attempts + 1 if head_id == self._failed_head else 1
+        self._failed_head = head_id
+        if self._failed_attempts < GeneralConstants.ACTIVITY_MAX_ATTEMPTS:
+            return False
+
+        for item in raw:
+            try:
+                await ActivityManager.write_batch([self._decode(item)])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if not await self._database_reachable():
+                    return False
+                logger.error(f"Dead-lettering activity the database rejects: {e}")
+                await redis_client.list_push(CacheKeys.activity_dead(), json.dumps({
+                    "activity": json.loads(item),
+                    "error": str(e),
+                    "failed_at": datetime.now(timezone.utc).isoformat(),
+                }))
+
+        await redis_client.list_drop_head(key, raw[0], len(raw))
+        self._failed_head, self._failed_attempts = None, 0
+        return True
+
+    async def _flush_buffer(self):
+        """Write events buffered while Redis was down, handing them to the journal if the database is down instead."""
+        from app.managers.activity import ActivityManager
+
+        batch_size = GeneralConstants.ACTIVITY_FLUSH_BATCH_SIZE
+        while self._buffer:
+            batch = [self._buffer.popleft() for _ in range(min(batch_size, len(self._buffer)))]
+            try:
+                await ActivityManager.write_batch(batch)
+            except asyncio.CancelledError:
+                # Stopping mid-insert: put the batch back for the final flush, replays are idempotent
+                self._buffer.extendleft(reversed(batch))
+                raise
+            except Exception as e:
+                logger.error(f"Failed to write {len(batch)} buffered activities: {e}", exc_info=True)
+                batch.extend(self._buffer)
+                self._buffer.clear()
+                if not await redis_client.list_push(CacheKeys.activity_pending(), *(self._encode(item) for item in batch)):
+                    # Both are down: keep them, ahead of anything newer, up to the buffer limit
+                    dropped = max(len(batch) - GeneralConstants.ACTIVITY_BUFFER_LIMIT, 0)
+                    if dropped:
+                        logger.error(f"Activity buffer full, dropped {dropped} oldest activities")
+                    self._buffer.extend(batch[dropped:])
+                return
+
+    @staticmethod
+    async def _database_reachable() -> bool:
+        try:
+            await connections.get("default").execute_query("SELECT 1")
+            return True
+        except Exception:
+            return False
+
+    async def _run(self):
+        interval = GeneralConstants.ACTIVITY_FLUSH_INTERVAL_MS / 1000
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            try:
+                await self.flush()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Activity flush failed: {e}", exc_info=True)
+
+    @staticmethod
+    def _encode(activity: Dict[str, Any]) -> str:
+        return json.dumps({**activity, 'created_at': activity['created_at'].isoformat()}, default=str)
+
+    @staticmethod
+    def _decode(raw: str) -> Dict[str, Any]:
+        activity = json.loads(raw)
+        activity['created_at'] = datetime.fromisoformat(activity['created_at'])
+        return activity
+
+
+activity_writer = ActivityWriter()
@@ -35,6 +35,13 @@ class Config:
         self.REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
         self.REDIS_DB = int(os.getenv("REDIS_DB", 0))
         
+        self.REMINDER_SCHEDULER_ENABLED = os.getenv("REMINDER_SCHEDULER_ENABLED", "true").lower() == "true"
+        self.ACTIVITY_MAINTENANCE_ENABLED = os.getenv("ACTIVITY_MAINTENANCE_ENABLED", "true").lower() == "true"
+        self.TASK_COUNTER_RECONCILE_ENABLED = os.getenv("TASK_COUNTER_RECONCILE_ENABLED", "true").lower() == "true"
+        # What happens to activity partitions past retention: "archive" moves them to the
+        # activity_archive schema for offline export, "drop" deletes them
+        self.ACTIVITY_ARCHIVE_MODE = os.getenv("ACTIVITY_ARCHIVE_MODE", "archive").lower()
+
         cors_origins = os.getenv("CORS_ORIGINS", "http://localhost:3000,http://127.0.0.1:3000")
         self.CORS_ORIGINS = [origin.strip() for origin in cors_origins.split(",") if origin.strip()]
 
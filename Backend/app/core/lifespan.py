@@ -4,6 +4,11 @@ from fastapi import FastAPI
 from app.core.db import TORTOISE_ORM
 from app.observability import setup_logging
 from app.core.redis_client import redis_client
+from app.core.reminder_scheduler import reminder_scheduler
+from app.core.activity_writer import activity_writer
+from app.core.activity_maintenance import activity_maintenance
+from app.core.task_counter_reconciler import task_counter_reconciler
+from app.core.config import settings
 import logging
 
 logger = logging.getLogger(__name__)
@@ -28,17 +33,53 @@ async def init_redis(*args, **kwargs):
     except Exception as e:
         logger.warning(f"Redis not available: {e} - caching disabled")
 
+async def start_reminder_scheduler(*args, **kwargs):
+    if settings.REMINDER_SCHEDULER_ENABLED:
+        reminder_scheduler.start()
+
+async def start_activity_writer(*args, **kwargs):
+    activity_writer.start()
+
+async def start_activity_maintenance(*args, **kwargs):
+    if settings.ACTIVITY_MAINTENANCE_ENABLED:
+        activity_maintenance.start()
+
+async def start_task_counter_reconciler(*args, **kwargs):
+    if settings.TASK_COUNTER_RECONCILE_ENABLED:
+        task_counter_reconciler.start()
+
 
 on_startup = [
     init_db,
     init_observability,
     init_redis,
+    start_reminder_scheduler,
+    start_activity_writer,
+    start_activity_maintenance,
+    start_task_counter_reconciler,
 ]
 
 async def close_redis(*args, **kwargs):
     await redis_client.close()
 
+async def stop_reminder_scheduler(*args, **kwargs):
+    await reminder_scheduler.stop()
+
+async def stop_activity_maintenance(*args, **kwargs):
+    await activity_maintenance.stop()
+
+async def stop_task_counter_reconciler(*args, **kwargs):
+    await task_counter_reconciler.stop()
+
+async def stop_activity_writer(*args, **kwargs):
+    # Drains the buffer, so it has to run while the database is still open
+    await activity_writer.stop()
+
 on_shutdown = [
+    stop_reminder_scheduler,
+    stop_activity_maintenance,
+    stop_task_counter_reconciler,
+    stop_activity_writer,
     close_db,
     close_redis,
 ]
@@ -1,7 +1,7 @@
 import redis.asyncio as redis
 from app.core import settings
 import logging
-from typing import Optional, Any
+from typing import Optional, Any, Dict, List
 import json
 
 logger = logging.getLogger(__name__)
@@ -107,6 +107,60 @@ class RedisClient:
             logger.error(f"Redis GET failed for key {key}: {e}")
             return None
     
+    async def get_many(
+        self,
+        *keys: str,
+        deserialize: bool = True
+    ) -> List[Optional[Any]]:
+        try:
+            client = await self.get_client()
+            if client is None:
+                return [None] * len(keys)
+            
+            values = await client.mget(*keys)
+            if not deserialize:
+                return values
+            
+            result = []
+            for value in values:
+                if value is None:
+                    result.append(None)
+                    continue
+                try:
+                    result.append(json.loads(value))
+                except (json.JSONDecodeError, TypeError):
+                    result.append(value)
+            return result
+        except Exception as e:
+            logger.error(f"Redis MGET failed for keys {keys}: {e}")
+            return [None] * len(keys)
+    
+    async def set_many(
+        self,
+        mapping: Dict[str, Any],
+        expire: Optional[int] = None,
+        serialize: bool = True
+    ) -> bool:
+        try:
+            client = await self.get_client()
+            if client is None:
+                return False
+            
+            async with client.pipeline(transaction=False) as pipe:
+                for key, value in mapping.items():
+                    if serialize:
+                        value = json.dumps(value)
+                    if expire:
+                        pipe.setex(key, expire, value)
+                    else:
+                        pipe.set(key, value)
+                await pipe.execute()
+            
+            return True
+        except Exception as e:
+            logger.error(f"Redis pipelined SET failed for keys {list(mapping)}: {e}")
+            return False
+    
     async def delete(self, *keys: str) -> int:
         try:
             client = await self.get_client()
@@ -192,6 +246,155 @@ class RedisClient:
             logger.error(f"Redis SMEMBERS failed for key {key}: {e}")
             return set()
     
+    async def hash_get_many(self, fields: Dict[str, List[str]]) -> Dict[str, Dict[str, Any]]:
+        """HMGET several hashes in one round trip; returns only the fields that exist, deserialized."""
+        fields = {key: names for key, names in fields.items() if names}
+        try:
+            client = await self.get_client()
+            if client is None or not fields:
+                return {}
+            
+            async with client.pipeline(transaction=False) as pipe:
+                for key, names in fields.items():
+                    pipe.hmget(key, names)
+                replies = await pipe.execute()
+            
+            return {
+                key: {name: json.loads(value) for name, value in zip(names, values) if value is not None}
+                for (key, names), values in zip(fields.items(), replies)
+            }
+        except Exception as e:
+            logger.error(f"Redis pipelined HMGET failed for keys {list(fields)}: {e}")
+            return {}
+    
+    async def hash_set_many(self, mapping: Dict[str, Dict[str, Any]], expire: Optional[int] = None) -> bool:
+        """
+        HSET fields of several hashes in one round trip. The expiry is only applied to hashes that
+        have none yet, so a hash written to constantly still expires on schedule.
+        """
+        mapping = {key: values for key, values in mapping.items() if values}
+        try:
+            client = await self.get_client()
+            if client is None or not mapping:
+                return False
+            
+            async with client.pipeline(transaction=False) as pipe:
+                for key, values in mapping.items():
+                    pipe.hset(key, mapping={name: json.dumps(value) for name, value in values.items()})
+                    if expire:
+                        pipe.expire(key, expire, nx=True)
+                await pipe.execute()
+            
+            return True
+        except Exception as e:
+            logger.error(f"Redis pipelined HSET failed for keys {list(mapping)}: {e}")
+            return False
+    
+    # ARGV: expiry, then (name, expected, value) triples; an empty expected means the field must be absent
+    _HASH_SET_IF_UNCHANGED_SCRIPT = """
+    local written = {}
+    for i = 2, #ARGV, 3 do
+        if (redis.call('HGET', KEYS[1], ARGV[i]) or '') == ARGV[i + 1] then
+            redis.call('HSET', KEYS[1], ARGV[i], ARGV[i + 2])
+            table.insert(written, ARGV[i])
+        end
+    end
+    if #written > 0 and tonumber(ARGV[1]) > 0 and redis.call('TTL', KEYS[1]) == -1 then
+        redis.call('EXPIRE', KEYS[1], ARGV[1])
+    end
+    return written
+    """
+    
+    async def hash_set_if_unchanged(
+        self, mapping: Dict[str, Dict[str, tuple]], expire: Optional[int] = None
+    ) -> Optional[Dict[str, set]]:
+        """
+        Write hash fields only where they still hold what was read before, in one round trip.
+        `mapping` is {key: {name: (expected, value)}}, with None as the expected value of a field
+        that was absent. Returns the names written per key, or None if Redis could not be reached.
+        """
+        mapping = {key: fields for key, fields in mapping.items() if fields}
+        try:
+            client = await self.get_client()
+            if client is None:
+                return None
+            if not mapping:
+                return {}
+            
+            async with client.pipeline(transaction=False) as pipe:
+                for key, fields in mapping.items():
+                    args = [expire or 0]
+                    for name, (expected, value) in fields.items():
+                        args += [name, "" if expected is None else json.dumps(expected), json.dumps(value)]
+                    pipe.eval(self._HASH_SET_IF_UNCHANGED_SCRIPT, 1, key, *args)
+                replies = await pipe.execute()
+            
+            return {key: set(written) for key, written in zip(mapping, replies)}
+        except Exception as e:
+            logger.error(f"Redis conditional HSET failed for keys {list(mapping)}: {e}")
+            return None
+    
+    async def set_if_absent(self, key: str, value: str, expire: int) -> bool:
+        """SET NX with an expiry, for short-lived locks."""
+        try:
+            client = await self.get_client()
+            if client is None:
+                return False
+            
+            return bool(await client.set(key, value, ex=expire, nx=True))
+        except Exception as e:
+            logger.error(f"Redis SET NX failed for key {key}: {e}")
+            return False
+    
+    async def list_push(self, key: str, *values: str) -> int:
+        """RPUSH; returns the new length of the list, or 0 if the push failed."""
+        try:
+            client = await self.get_client()
+            if client is None:
+                return 0
+            
+            return await client.rpush(key, *values)
+        except Exception as e:
+            logger.error(f"Redis RPUSH failed for key {key}: {e}")
+            return 0
+    
+    async def list_range(self, key: str, count: int) -> List[str]:
+        """The first `count` items of a list without removing them."""
+        try:
+            client = await self.get_client()
+            if client is None:
+                return []
+            
+            return await client.lrange(key, 0, count - 1)
+        except Exception as e:
+            logger.error(f"Redis LRANGE failed for key {key}: {e}")
+            return []
+    
+    # Removes the head only if nobody else removed it in the meantime
+    _DROP_HEAD_SCRIPT = """
+    if redis.call('LINDEX', KEYS[1], 0) == ARGV[1] then
+        redis.call('LTRIM', KEYS[1], tonumber(ARGV[2]), -1)
+        return 1
+    end
+    return 0
+    """
+    
+    async def list_drop_head(self, key: str, head: str, count: int) -> bool:
+        """
+        Remove the first `count` items of a list read earlier with list_range, provided the list
+        still starts with `head`. Items are only ever appended at the tail, so a matching head means
+        the same items are still there; returns False when another consumer already removed them.
+        """
+        try:
+            client = await self.get_client()
+            if client is None:
+                return False
+            
+            return bool(await client.eval(self._DROP_HEAD_SCRIPT, 1, key, head, count))
+        except Exception as e:
+            logger.error(f"Redis list head removal failed for key {key}: {e}")
+            return False
+    
     async def close(self):
         if self._client:
             await self._client.close()
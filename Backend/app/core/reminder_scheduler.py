@@ -0,0 +1,47 @@
+from app.constants import GeneralConstants
+from typing import Optional
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ReminderScheduler:
+    """Background loop that drains due task reminders every poll interval."""
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+            logger.info("Reminder scheduler started")
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self):
+        from app.managers.reminder import ReminderManager
+
+        batch_size = GeneralConstants.REMINDER_BATCH_SIZE
+        while True:
+            try:
+                # A full batch means more may be waiting, so keep going before sleeping
+                while await ReminderManager.dispatch_due(batch_size) == batch_size:
+                    pass
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Reminder dispatch failed: {e}", exc_info=True)
+
+            await asyncio.sleep(GeneralConstants.REMINDER_POLL_INTERVAL_SECONDS)
+
+
+reminder_scheduler = ReminderScheduler()
@@ -0,0 +1,44 @@
+from app.constants import GeneralConstants
+from typing import Optional
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class TaskCounterReconciler:
+    """Background loop that recounts project task counters and repairs any that drifted."""
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+            logger.info("Task counter reconciler started")
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self):
+        from app.managers.task_counter import TaskCounterManager
+
+        while True:
+            # Counters are backfilled by their migration, so the first pass can wait a full interval
+            await asyncio.sleep(GeneralConstants.TASK_COUNTER_RECONCILE_INTERVAL_SECONDS)
+            try:
+                await TaskCounterManager.reconcile()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Task counter reconciliation failed: {e}", exc_info=True)
+
+
+task_counter_reconciler = TaskCounterReconciler()
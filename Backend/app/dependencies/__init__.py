@@ -1 +1,4 @@
-from .auth import require_user, require_org_membership, require_role, project_access
\ No newline at end of file
+from .auth import (
+    require_user, require_org_membership, require_role, project_access,
+    project_access_context, ProjectAccessContext
+)
@@ -1,7 +1,11 @@
 from app.models import Project
 from fastapi import Request
 from app.models import Organization, Membership
+from app.models.membership import MembershipRole
 from app.exceptions import UnauthorizedException, NotFoundException, ForbiddenException
+from app.constants import ErrorMessages
+from app.utils.validator import Validator
+from tortoise import connections
 from typing import List
 
 def require_user(request: Request):
@@ -47,31 +51,87 @@ def require_role(allowed_roles: List[str]):
 
     return role_guard
 
-def project_access():
-    async def project_access_guard(project_id: str, request: Request):
+class ProjectAccessContext:
+    """The project (with its org) and the caller's active membership, resolved once per request."""
+
+    WRITE_ROLES = ("member", "admin", "owner")
+
+    def __init__(self, project: Project, membership: Membership, user_id: str):
+        self.project = project
+        self.membership = membership
+        self.user_id = user_id
+
+    @property
+    def project_id(self) -> str:
+        return str(self.project.id)
+
+    @property
+    def org(self) -> Organization:
+        return self.project.org
+
+    @property
+    def org_id(self) -> str:
+        return str(self.project.org_id)
+
+    @property
+    def role(self) -> str:
+        return MembershipRole(self.membership.role).value
+
+def _aliased_columns(model, alias: str, prefix: str) -> str:
+    return ", ".join(f'{alias}."{column}" AS "{prefix}{column}"' for column in model._meta.db_fields)
+
+def _unprefixed(row: dict, prefix: str) -> dict:
+    return {key[len(prefix):]: value for key, value in row.items() if key.startswith(prefix)}
+
+async def load_project_access(project_id: str, user_id: str) -> ProjectAccessContext:
+    project_id = Validator.validate_uuid(project_id, "project_id")
+
+    # Project, org and the caller's active membership in one round trip
+    rows = await connections.get("default").execute_query_dict(
+        f"""
+        SELECT {_aliased_columns(Project, "p", "p__")},
+               {_aliased_columns(Organization, "o", "o__")},
+               {_aliased_columns(Membership, "m", "m__")}
+        FROM projects AS p
+        JOIN organizations AS o ON o.id = p.org_id
+        LEFT JOIN memberships AS m
+               ON m."organizationId" = p.org_id AND m."userId" = $2 AND m.status = 'active'
+        WHERE p.id = $1
+        """,
+        [project_id, user_id]
+    )
+    if not rows:
+        raise NotFoundException("Project not found")
+
+    row = rows[0]
+    project = Project._init_from_db(**_unprefixed(row, "p__"))
+    if project.is_archieved:
+        raise NotFoundException("This project has been archived and is no longer accessible")
+
+    if row["m__id"] is None:
+        raise ForbiddenException("You do not have access to this project")
+
+    project.org = Organization._init_from_db(**_unprefixed(row, "o__"))
+    membership = Membership._init_from_db(**_unprefixed(row, "m__"))
+    return ProjectAccessContext(project, membership, str(user_id))
+
+def project_access_context(require_write: bool = False):
+    async def project_access_context_guard(project_id: str, request: Request):
         user = require_user(request)
 
-        project = await Project.get_or_none(
-            id=project_id
-        ).select_related('org')
-
-        if not project:
-            raise NotFoundException("Project not found")
-        
-        if project.is_archieved:
-            raise NotFoundException("This project has been archived and is no longer accessible")
-
-        membership = await Membership.get_or_none(
-            userId=user.get('user_id'),
-            organizationId=project.org.id,
-            status="active"
-        )
+        access = await load_project_access(project_id, user.get('user_id'))
+        if require_write and access.role not in ProjectAccessContext.WRITE_ROLES:
+            raise ForbiddenException(ErrorMessages.INSUFFICIENT_PERMISSIONS)
 
-        if not membership:
-            raise ForbiddenException("You do not have access to this project")
+        request.state.access = access
+        request.state.project = access.project
+        request.state.role = access.membership.role
 
-        request.state.project = project
-        request.state.role = membership.role
+        return access
+    return project_access_context_guard
 
-        return project
+def project_access():
+    async def project_access_guard(project_id: str, request: Request):
+        access = await project_access_context()(project_id, request)
+        return access.project
     return project_access_guard
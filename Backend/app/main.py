@@ -1,4 +1,4 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from app.routes import api_router
 from app.routes.websocket import websocket_notifications
@@ -6,6 +6,8 @@ from app.core.lifespan import lifespan
 from app.core.config import settings
 from app.middlewares.authentication import AuthMiddleware
 from app.observability.logging import RequestIDMiddleware
+from app.utils.redis_cache import CacheStats
+from app.dependencies import require_user
 
 app = FastAPI(lifespan=lifespan, redirect_slashes=False)
 
@@ -19,6 +21,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
 )
 
 app.include_router(api_router)
@@ -30,3 +33,9 @@ app.websocket("/ws/notifications")(websocket_notifications)
 async def health():
     """Health check endpoint"""
     return {"status": "healthy"}
+
+
+@app.get("/metrics/cache")
+async def cache_metrics(user=Depends(require_user)):
+    """Read-through cache hit/miss counters of the worker that serves the request; counters are per process, not totals"""
+    return CacheStats.all()
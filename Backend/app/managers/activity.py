@@ -1,9 +1,21 @@
-from app.models import Activity, Organization, Membership, User, Task, Project
+from app.models import Activity, ActivityRollup, Membership
 from app.models.activity import EntityType, ActionType
+from app.models.task import TaskStatus
 from app.models.membership import MembershipRole, MembershipStatus
 from app.exceptions import BadRequestException
 from app.utils.validator import Validator
-from typing import Dict, List, Optional
+from app.constants import GeneralConstants, ErrorMessages
+from app.utils.pagination import encode_cursor, decode_cursor, parse_cursor_datetime, keyset_page
+from app.core.activity_writer import activity_writer
+from app.managers.entity_name import EntityNameManager
+from app.managers.activity_partition import ActivityPartitionManager
+from tortoise.expressions import Q
+from tortoise.transactions import in_transaction
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+import json
+import uuid
 
 class ActivityManager:
     
@@ -18,8 +30,17 @@ class ActivityManager:
         page: int = 1,
         page_size: int = 50,
         entity_type: Optional[str] = None,
-        action_type: Optional[str] = None
+        action_type: Optional[str] = None,
+        cursor: Optional[str] = None,
+        include_total: Optional[bool] = None
     ) -> Dict:
+        """
+        One page of the org's activity feed, newest first.
+
+        Without a cursor pages are numbered and counted. Passing cursor (empty for the first page)
+        switches to keyset pagination: each page seeks past the last (created_at, id) seen, so
+        deep pages cost the same as the first and counting is opt-in.
+        """
         org_id = Validator.validate_uuid(org_id, "org_id")
         user_id = Validator.validate_uuid(user_id, "user_id")
         
@@ -35,7 +56,9 @@ class ActivityManager:
         if membership.role not in [MembershipRole.ADMIN, MembershipRole.OWNER]:
             raise BadRequestException("Only admins and owners can view activities.")
         
-        query = Activity.filter(org_id=org_id)
+        # History past the org's retention is hidden, which also keeps the scan to recent partitions
+        retention_cutoff = await ActivityPartitionManager.get_retention_cutoff(org_id)
+        query = Activity.filter(org_id=org_id, created_at__gte=retention_cutoff)
         
         if entity_type:
             query = query.filter(entity_type=entity_type)
@@ -43,38 +66,37 @@ class ActivityManager:
         if action_type:
             query = query.filter(action=action_type)
         
-        total = await query.count()
-        total_pages = (total + page_size - 1) // page_size if total else 0
-        
-        activities = await query.order_by("-created_at").offset(
-            (page - 1) * page_size
-        ).limit(page_size)
-        
+        ordered = query.order_by("-created_at", "-id")
+        has_more = False
+        if cursor is None:
+            total = await query.count() if include_total is not False else None
+            activities = await ordered.offset((page - 1) * page_size).limit(page_size)
+        else:
+            total = await query.count() if include_total else None
+            if cursor:
+                created_at, last_id = decode_cursor(cursor, 2)
+                created_at = parse_cursor_datetime(created_at)
+                last_id = Validator.validate_uuid(last_id, "cursor")
+                # The plain bound is what the index seeks on; the OR only settles ties within it
+                ordered = ordered.filter(created_at__lte=created_at).filter(
+                    Q(created_at__lt=created_at) | Q(id__lt=last_id)
+                )
+            activities, has_more = keyset_page(await ordered.limit(page_size + 1), page_size)
+
         def _et(act):
             v = getattr(act.entity_type, "value", act.entity_type)
             return str(v) if v is not None else ""
 
-        user_ids = list({str(a.user_id) for a in activities})
-        users = await User.filter(id__in=user_ids)
-        user_map = {str(u.id): f"{u.firstName or ''} {u.lastName or ''}".strip() or u.email for u in users}
-        
-        task_ids = [str(a.entity_id) for a in activities if _et(a) == EntityType.TASK.value]
-        project_ids = [str(a.entity_id) for a in activities if _et(a) == EntityType.PROJECT.value]
-        org_ids = [str(a.entity_id) for a in activities if _et(a) == EntityType.ORGANIZATION.value]
-        
-        tasks = await Task.filter(id__in=task_ids).select_related("project") if task_ids else []
-        task_map = {}
-        for t in tasks:
-            task_map[str(t.id)] = {
-                "name": t.title,
-                "project_name": t.project.name if t.project else None,
-            }
-        
-        projects = await Project.filter(id__in=project_ids) if project_ids else []
-        project_map = {str(p.id): p.name for p in projects}
-        
-        orgs = await Organization.filter(id__in=org_ids) if org_ids else []
-        org_map = {str(o.id): o.name for o in orgs}
+        names = await EntityNameManager.resolve(
+            users=[a.user_id for a in activities],
+            tasks=[a.entity_id for a in activities if _et(a) == EntityType.TASK.value],
+            projects=[a.entity_id for a in activities if _et(a) == EntityType.PROJECT.value],
+            organizations=[a.entity_id for a in activities if _et(a) == EntityType.ORGANIZATION.value],
+        )
+        user_map = names[EntityNameManager.USER]
+        task_map = names[EntityNameManager.TASK]
+        project_map = names[EntityNameManager.PROJECT]
+        org_map = names[EntityNameManager.ORGANIZATION]
         
         activities_list = []
         for activity in activities:
@@ -86,8 +108,8 @@ class ActivityManager:
             if et == EntityType.TASK.value:
                 info = task_map.get(str(activity.entity_id))
                 if info:
-                    entity_name = info["name"]
-                    project_name = info["project_name"]
+                    entity_name = info["title"]
+                    project_name = project_map.get(info["project_id"])
                 else:
                     entity_name = "Deleted or unknown task"
             elif et == EntityType.PROJECT.value:
@@ -117,14 +139,24 @@ class ActivityManager:
                 "created_at": activity.created_at.isoformat() if activity.created_at else None,
             })
         
+        if cursor is None:
+            pagination = {"page": page, "page_size": page_size}
+            if total is not None:
+                pagination["total"] = total
+                pagination["total_pages"] = (total + page_size - 1) // page_size if total else 0
+        else:
+            last = activities[-1] if has_more else None
+            pagination = {
+                "page_size": page_size,
+                "next_cursor": encode_cursor(last.created_at, last.id) if last else None,
+                "has_more": has_more,
+            }
+            if total is not None:
+                pagination["total"] = total
+
         return {
             "activities": activities_list,
-            "pagination": {
-                "page": page,
-                "page_size": page_size,
-                "total": total,
-                "total_pages": total_pages,
-            },
+            "pagination": pagination,
             "filter_options": {
                 "entity_types": cls.ENTITY_TYPE_OPTIONS,
                 "action_types": cls.ACTION_TYPE_OPTIONS,
@@ -132,21 +164,138 @@ class ActivityManager:
         }
     
     @classmethod
-    async def create_activity(
+    async def get_activity_timeseries(
         cls,
         org_id: str,
-        user_id: str,
-        entity_type: str,
-        entity_id: str,
-        action: str,
-        metadata: Optional[Dict] = None
-    ) -> Activity:
-        activity = await Activity.create(
-            org_id=org_id,
-            user_id=user_id,
-            entity_type=entity_type,
-            entity_id=entity_id,
-            action=action,
-            metadata=metadata
-        )
-        return activity
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        project_id: Optional[str] = None,
+        actions: Optional[List[str]] = None
+    ) -> Dict:
+        """
+        Daily counts per project and action between start and end (UTC days, inclusive), read from
+        the rollups rather than from raw activities, so the cost grows with the days charted and not
+        with how busy they were. Days without activity are zeros.
+        """
+        org_id = Validator.validate_uuid(org_id, "org_id")
+        end = end or datetime.now(timezone.utc).date()
+        start = start or end - timedelta(days=GeneralConstants.ACTIVITY_TIMESERIES_DEFAULT_DAYS - 1)
+        if start > end or (end - start).days >= GeneralConstants.ACTIVITY_TIMESERIES_MAX_DAYS:
+            raise BadRequestException(ErrorMessages.INVALID_DATE_RANGE)
+
+        query = ActivityRollup.filter(org_id=org_id, day__gte=start, day__lte=end)
+        if project_id:
+            query = query.filter(project_id=Validator.validate_uuid(project_id, "project_id"))
+        if actions:
+            query = query.filter(action__in=actions)
+        rows = await query.values('project_id', 'day', 'action', 'count')
+
+        days = [start + timedelta(days=offset) for offset in range((end - start).days + 1)]
+        series: Dict[Tuple[str, str], List[int]] = {}
+        for row in rows:
+            counts = series.setdefault((str(row['project_id']), row['action']), [0] * len(days))
+            counts[(row['day'] - start).days] = row['count']
+
+        project_names = (await EntityNameManager.resolve(projects={project for project, _ in series}))[EntityNameManager.PROJECT]
+        return {
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "days": [day.isoformat() for day in days],
+            "series": [
+                {
+                    "project_id": project,
+                    "project_name": project_names.get(project),
+                    "action": action,
+                    "total": sum(counts),
+                    "counts": counts,
+                }
+                for (project, action), counts in sorted(series.items())
+            ],
+        }
+
+    @classmethod
+    async def write_batch(cls, activities: List[Dict]) -> int:
+        """
+        Insert buffered activities (with the id and created_at given at enqueue time) and fold them
+        into the daily rollups in the same transaction. Rows that already exist, as when a parked
+        batch is replayed, are skipped and not counted twice. Returns how many rows were new.
+        """
+        if not activities:
+            return 0
+
+        async with in_transaction() as conn:
+            inserted = await conn.execute_query_dict(
+                """
+                INSERT INTO activities (id, org_id, user_id, entity_type, entity_id, action, metadata, created_at)
+                SELECT v.id, v.org_id, v.user_id, v.entity_type, v.entity_id, v.action, v.metadata::jsonb, v.created_at
+                FROM unnest($1::uuid[], $2::uuid[], $3::uuid[], $4::varchar[], $5::uuid[], $6::varchar[], $7::text[], $8::timestamptz[])
+                    AS v(id, org_id, user_id, entity_type, entity_id, action, metadata, created_at)
+                ON CONFLICT DO NOTHING
+                RETURNING id
+                """,
+                [
+                    [str(a['id']) for a in activities],
+                    [str(a['org_id']) for a in activities],
+                    [str(a['user_id']) for a in activities],
+                    [getattr(a['entity_type'], 'value', a['entity_type']) for a in activities],
+                    [str(a['entity_id']) for a in activities],
+                    [getattr(a['action'], 'value', a['action']) for a in activities],
+                    [json.dumps(a['metadata'], default=str) if a.get('metadata') is not None else None for a in activities],
+                    [a['created_at'] for a in activities],
+                ]
+            )
+            new_ids = {str(row['id']) for row in inserted}
+
+            counts: Dict[Tuple[str, str, date, str], int] = defaultdict(int)
+            for activity in activities:
+                if str(activity['id']) not in new_ids:
+                    continue
+                key = cls._rollup_key(activity)
+                if key is not None:
+                    counts[key[:4]] += key[4]
+
+            if counts:
+                # Sorted so concurrent writers take the row locks in the same order
+                keys = sorted(counts)
+                await conn.execute_query(
+                    """
+                    INSERT INTO activity_rollups (id, org_id, project_id, day, action, count)
+                    SELECT * FROM unnest($1::uuid[], $2::uuid[], $3::uuid[], $4::date[], $5::varchar[], $6::int[])
+                    ON CONFLICT (org_id, project_id, day, action)
+                    DO UPDATE SET count = activity_rollups.count + EXCLUDED.count
+                    """,
+                    [
+                        [str(uuid.uuid4()) for _ in keys],
+                        [key[0] for key in keys],
+                        [key[1] for key in keys],
+                        [key[2] for key in keys],
+                        [key[3] for key in keys],
+                        [counts[key] for key in keys],
+                    ]
+                )
+
+        return len(new_ids)
+
+    @classmethod
+    def _rollup_key(cls, activity: Dict) -> Optional[Tuple[str, str, date, str, int]]:
+        """(org, project, UTC day, action, increment) an activity counts towards, or None if it has no project."""
+        entity_type = getattr(activity['entity_type'], 'value', activity['entity_type'])
+        project_id = activity.get('project_id') or (activity['entity_id'] if entity_type == EntityType.PROJECT.value else None)
+        if project_id is None:
+            return None
+
+        action = getattr(activity['action'], 'value', activity['action'])
+        metadata = activity.get('metadata') or {}
+        increment = 1
+        if action == ActionType.TASK_STATUS_CHANGED.value:
+            action = f"{action}:{TaskStatus(metadata['new_status']).value}"
+        elif action == ActionType.TASKS_IMPORTED.value:
+            increment = int(metadata.get('tasks') or 0)
+
+        day = activity['created_at'].astimezone(timezone.utc).date()
+        return str(activity['org_id']), str(project_id), day, action, increment
+
+    @classmethod
+    async def log_activities(cls, activities: List[Dict]):
+        """Record activities without waiting for them to be written; see ActivityWriter."""
+        await activity_writer.enqueue(activities)
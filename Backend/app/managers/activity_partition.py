@@ -0,0 +1,141 @@
+from app.constants import GeneralConstants
+from app.core.config import settings
+from tortoise.transactions import in_transaction
+from tortoise import connections
+from datetime import datetime, timezone, timedelta
+from typing import Dict, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ActivityPartitionManager:
+    """
+    Monthly partitions of the activities table.
+
+    The table is range-partitioned on created_at, one partition per UTC month, plus a default
+    partition that catches anything outside them. Upcoming months are created ahead of time.
+    Months older than the longest retention of any organization are detached, a catalog-only
+    change, and then dropped or moved to the archive schema, so history expires without DELETEs.
+    Organizations with a shorter retention have the rest hidden by the feed until the month goes.
+    """
+
+    PARENT = "activities"
+    DEFAULT_PARTITION = "activities_default"
+    ARCHIVE_SCHEMA = "activity_archive"
+    _PREFIX = "activities_p"
+
+    @classmethod
+    async def run_maintenance(cls, now: Optional[datetime] = None) -> Dict[str, List[str]]:
+        """Create upcoming partitions and archive expired ones; workers that find it already running skip it."""
+        now = now or datetime.now(timezone.utc)
+        async with in_transaction() as conn:
+            locked = await conn.execute_query_dict(
+                "SELECT pg_try_advisory_xact_lock(hashtextextended('activity_partitions', 0)) AS locked"
+            )
+            if not locked[0]['locked']:
+                return {"created": [], "archived": []}
+
+            existing = await cls._list_partitions()
+            created = await cls._create_upcoming(existing, now)
+            archived = await cls._archive_expired(existing, now)
+
+        if created or archived:
+            logger.info(f"Activity partitions created: {created}, archived ({settings.ACTIVITY_ARCHIVE_MODE}): {archived}")
+        return {"created": created, "archived": archived}
+
+    @classmethod
+    async def get_retention_cutoff(cls, org_id: str, now: Optional[datetime] = None) -> datetime:
+        """Oldest timestamp the organization still keeps; feeds filter on it so only recent partitions are scanned."""
+        rows = await connections.get("default").execute_query_dict(
+            "SELECT activity_retention_days FROM organizations WHERE id = $1", [org_id]
+        )
+        days = (rows[0]['activity_retention_days'] if rows else None) or GeneralConstants.ACTIVITY_RETENTION_DAYS
+        return (now or datetime.now(timezone.utc)) - timedelta(days=days)
+
+    @classmethod
+    async def _create_upcoming(cls, existing: List[str], now: datetime) -> List[str]:
+        conn = connections.get("default")
+        created = []
+        month = cls._month_start(now)
+        for _ in range(GeneralConstants.ACTIVITY_PARTITIONS_AHEAD + 1):
+            next_month = cls._add_month(month)
+            name = cls._partition_name(month)
+            if name not in existing:
+                # Built detached and attached afterwards, so rows that landed in the default
+                # partition for this month move over instead of blocking the attach
+                await conn.execute_script(f"""
+                    CREATE TABLE "{name}" (LIKE "{cls.PARENT}" INCLUDING DEFAULTS INCLUDING CONSTRAINTS);
+                    WITH moved AS (
+                        DELETE FROM "{cls.DEFAULT_PARTITION}"
+                        WHERE created_at >= '{month.isoformat()}' AND created_at < '{next_month.isoformat()}'
+                        RETURNING *
+                    )
+                    INSERT INTO "{name}" SELECT * FROM moved;
+                    ALTER TABLE "{cls.PARENT}" ATTACH PARTITION "{name}"
+                        FOR VALUES FROM ('{month.isoformat()}') TO ('{next_month.isoformat()}');
+                """)
+                created.append(name)
+            month = next_month
+        return created
+
+    @classmethod
+    async def _archive_expired(cls, existing: List[str], now: datetime) -> List[str]:
+        conn = connections.get("default")
+        rows = await conn.execute_query_dict(
+            "SELECT max(COALESCE(activity_retention_days, $1)) AS days FROM organizations",
+            [GeneralConstants.ACTIVITY_RETENTION_DAYS]
+        )
+        cutoff = now - timedelta(days=rows[0]['days'] or GeneralConstants.ACTIVITY_RETENTION_DAYS)
+
+        archived = []
+        for name in sorted(existing):
+            month = cls._partition_month(name)
+            if month is None or cls._add_month(month) > cutoff:
+                continue
+            statement = f'ALTER TABLE "{cls.PARENT}" DETACH PARTITION "{name}";'
+            if settings.ACTIVITY_ARCHIVE_MODE == "drop":
+                statement += f' DROP TABLE "{name}";'
+            else:
+                statement += f' ALTER TABLE "{name}" SET SCHEMA "{cls.ARCHIVE_SCHEMA}";'
+            await conn.execute_script(statement)
+            archived.append(name)
+
+        # Strays outside every monthly range are few; these are the only rows ever deleted
+        await conn.execute_query(f'DELETE FROM "{cls.DEFAULT_PARTITION}" WHERE created_at < $1', [cutoff])
+        return archived
+
+    @classmethod
+    async def _list_partitions(cls) -> List[str]:
+        rows = await connections.get("default").execute_query_dict(
+            """
+            SELECT child.relname AS name
+            FROM pg_inherits
+            JOIN pg_class AS child ON child.oid = pg_inherits.inhrelid
+            WHERE pg_inherits.inhparent = $1::text::regclass
+            """,
+            [cls.PARENT]
+        )
+        return [row['name'] for row in rows]
+
+    @classmethod
+    def _partition_name(cls, month: datetime) -> str:
+        return f"{cls._PREFIX}{month:%Y%m}"
+
+    @classmethod
+    def _partition_month(cls, name: str) -> Optional[datetime]:
+        if not name.startswith(cls._PREFIX):
+            return None
+        try:
+            return datetime.strptime(name[len(cls._PREFIX):], "%Y%m").replace(tzinfo=timezone.utc)
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _month_start(moment: datetime) -> datetime:
+        moment = moment.astimezone(timezone.utc)
+        return datetime(moment.year, moment.month, 1, tzinfo=timezone.utc)
+
+    @staticmethod
+    def _add_month(month: datetime) -> datetime:
+        return month.replace(year=month.year + month.month // 12, month=month.month % 12 + 1)
@@ -1,59 +1,115 @@
-from app.models import Organization, Membership, Project, Task, TaskAssignee
+from app.models import Organization, Membership, Project, TaskAssignee
 from app.models.membership import MembershipStatus
 from app.exceptions import NotFoundException
+from app.constants import GeneralConstants
+from app.core.redis_client import redis_client
+from app.managers.task_counter import TaskCounterManager
+from app.utils.redis_cache import CacheKeys, CacheStats
 from app.utils.validator import Validator
+from tortoise import connections
 from typing import List, Dict
+import uuid
 
 
 class DashboardManager:
     
+    _cache_stats = CacheStats(CacheKeys.DASHBOARD)
+    
     @classmethod
     async def get_dashboard_analytics(cls, user_id: str) -> Dict:
-        user_id = Validator.validate_uuid(user_id, "user_id")
-        
-        organization_ids = await Membership.filter(
-            userId=user_id,
-            status=MembershipStatus.ACTIVE
-        ).values_list('organizationId', flat=True)
-        
-        if not organization_ids:
-            return {
-                "total_projects": 0,
-                "active_tasks": 0,
-                "complete_tasks": 0,
-                "team_members": 0
-            }
-        
-        total_projects = await Project.filter(
-            org_id__in=organization_ids,
-            is_archieved=False
-        ).count()
-        
-        active_tasks = await Task.filter(
-            assignees__user_id=user_id,
-            project__is_archieved=False,
-            status__in=["todo", "in_progress"]
-        ).distinct().count()
-        
-        complete_tasks = await Task.filter(
-            assignees__user_id=user_id,
-            project__is_archieved=False,
-            status="done"
-        ).distinct().count()
-        
-        team_members = await Membership.filter(
-            organizationId__in=organization_ids,
-            status=MembershipStatus.ACTIVE
-        ).distinct().values_list('userId', flat=True)
-        team_members_count = len(set(team_members)) if team_members else 0
-        
-        return {
-            "total_projects": total_projects,
-            "active_tasks": active_tasks,
-            "complete_tasks": complete_tasks,
-            "team_members": team_members_count
+        """
+        Headline numbers for the user's dashboard, computed in one statement and cached per user.
+
+        A cached entry carries the dashboard version of every organization it was computed from,
+        both the user's own and those of projects holding tasks assigned to them, plus the user's
+        version. Task, membership and project writes bump their organization's version; joining or
+        leaving an organization and new assignments bump the user's, since those change which
+        organizations apply. An entry is only served while none of them changed.
+        """
+        user_id = str(uuid.UUID(Validator.validate_uuid(user_id, "user_id")))
+        user_version_key = CacheKeys.dashboard_user_version(user_id)
+
+        cached = await redis_client.get(CacheKeys.dashboard(user_id))
+        if isinstance(cached, dict):
+            org_ids = list(cached['versions'])
+            current = await redis_client.get_many(
+                user_version_key, *[CacheKeys.dashboard_version(org_id) for org_id in org_ids]
+            )
+            if current == [cached['user_version'], *[cached['versions'][org_id] for org_id in org_ids]]:
+                cls._cache_stats.hit()
+                return cached['analytics']
+        cls._cache_stats.miss()
+
+        # Versions are read before the queries, so a write landing while they run leaves the entry
+        # stale already; the user's version comes first, as it covers changes to the set of orgs
+        conn = connections.get("default")
+        user_version = await redis_client.get(user_version_key)
+        org_rows = await conn.execute_query_dict(
+            """
+            SELECT "organizationId" AS org_id FROM memberships WHERE "userId" = $1 AND status = $2
+            UNION
+            SELECT p.org_id
+            FROM task_assignees AS ta
+            JOIN tasks AS t ON t.id = ta.task_id
+            JOIN projects AS p ON p.id = t.project_id
+            WHERE ta.user_id = $1
+            """,
+            [user_id, MembershipStatus.ACTIVE.value]
+        )
+        org_ids = [str(row['org_id']) for row in org_rows]
+        versions = await redis_client.get_many(*[CacheKeys.dashboard_version(org_id) for org_id in org_ids]) if org_ids else []
+
+        # Assigned tasks count in any unarchived project, as long as the user belongs to an organization
+        row = (await conn.execute_query_dict(
+            """
+            WITH orgs AS (
+                SELECT DISTINCT "organizationId" AS org_id FROM memberships WHERE "userId" = $1 AND status = $2
+            ), assigned AS (
+                SELECT count(DISTINCT t.id) FILTER (WHERE t.status IN ('todo', 'in_progress')) AS active_tasks,
+                       count(DISTINCT t.id) FILTER (WHERE t.status = 'done') AS complete_tasks
+                FROM task_assignees AS ta
+                JOIN tasks AS t ON t.id = ta.task_id
+                JOIN projects AS p ON p.id = t.project_id AND NOT p.is_archieved
+                WHERE ta.user_id = $1 AND EXISTS (SELECT 1 FROM orgs)
+            )
+            SELECT (SELECT count(*) FROM projects WHERE org_id IN (SELECT org_id FROM orgs) AND NOT is_archieved) AS total_projects,
+                   assigned.active_tasks,
+                   assigned.complete_tasks,
+                   (SELECT count(DISTINCT "userId") FROM memberships
+                    WHERE "organizationId" IN (SELECT org_id FROM orgs) AND status = $2) AS team_members
+            FROM assigned
+            """,
+            [user_id, MembershipStatus.ACTIVE.value]
+        ))[0]
+
+        analytics = {
+            "total_projects": row['total_projects'],
+            "active_tasks": row['active_tasks'],
+            "complete_tasks": row['complete_tasks'],
+            "team_members": row['team_members']
         }
-    
+
+        await redis_client.set(
+            CacheKeys.dashboard(user_id),
+            {"user_version": user_version, "versions": dict(zip(org_ids, versions)), "analytics": analytics},
+            expire=GeneralConstants.DASHBOARD_CACHE_TTL
+        )
+        return analytics
+
+    @classmethod
+    async def invalidate_organization(cls, org_id: str):
+        """Expire every member's cached dashboard after a write to the organization's tasks, projects or members."""
+        await redis_client.incr(CacheKeys.dashboard_version(str(org_id)))
+
+    @classmethod
+    async def invalidate_users(cls, *user_ids: str):
+        """
+        Expire the cached dashboards of users who joined or left an organization or got new
+        assignments, which can change the organizations whose versions apply.
+        """
+        for user_id in set(map(str, user_ids)):
+            await redis_client.incr(CacheKeys.dashboard_user_version(user_id))
+
     @classmethod
     async def get_recent_projects(cls, user_id: str, limit: int = 3) -> List[Dict]:
         user_id = Validator.validate_uuid(user_id, "user_id")
@@ -72,22 +128,18 @@ class DashboardManager:
             is_archieved=False
         ).order_by('-updatedAt').limit(limit).all()
         
+        counts = await TaskCounterManager.get_counts(str(project.id) for project in projects)
+        
         result = []
         for project in projects:
-            total_tasks = await Task.filter(project_id=project.id).count()
-            
-            completed_tasks = await Task.filter(
-                project_id=project.id,
-                status="done"
-            ).count()
-            
+            project_counts = counts[str(project.id)]
             result.append({
                 "id": str(project.id),
                 "name": project.name,
                 "description": project.description or "",
                 "org_id": str(project.org_id),
-                "total_tasks": total_tasks,
-                "completed_tasks": completed_tasks,
+                "total_tasks": project_counts["total"],
+                "completed_tasks": project_counts["done"],
                 "updatedAt": project.updatedAt.isoformat() if project.updatedAt else None,
                 "createdAt": project.createdAt.isoformat() if project.createdAt else None,
             })
@@ -0,0 +1,191 @@
+from app.constants import GeneralConstants
+from app.core.redis_client import redis_client
+from app.utils.redis_cache import CacheKeys
+from tortoise import connections
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+import time
+import uuid
+
+
+class EntityNameManager:
+    """
+    Display names of users, tasks, projects and organizations, for feeds that mention many of them.
+
+    Lookups go through a per-process LRU, then one Redis hash per kind, and whatever is still
+    missing is read with a single query and written back to both. Renames and deletes replace the
+    entry here and in Redis with a tombstone; other workers' LRUs catch up within
+    ENTITY_NAME_LOCAL_TTL seconds. A write-back only lands where the entry is still what the
+    lookup saw, so a name loaded before an invalidation can't be put back after it.
+
+    Users, projects and organizations resolve to their name; tasks resolve to
+    {"title", "project_id"} so a project rename never leaves stale copies inside task entries.
+    """
+
+    USER = "user"
+    TASK = "task"
+    PROJECT = "project"
+    ORGANIZATION = "organization"
+    KINDS = (USER, TASK, PROJECT, ORGANIZATION)
+
+    _local: "OrderedDict[Tuple[str, str], Tuple[float, Any]]" = OrderedDict()
+
+    # Marks an entry as invalidated; the token makes every invalidation distinct
+    _TOMBSTONE = "invalidated"
+
+    @classmethod
+    async def resolve(
+        cls,
+        users: Iterable[str] = (),
+        tasks: Iterable[str] = (),
+        projects: Iterable[str] = (),
+        organizations: Iterable[str] = ()
+    ) -> Dict[str, Dict[str, Any]]:
+        """Names by kind and id; the projects of the given tasks are resolved too. Unknown ids are left out."""
+        wanted = {
+            cls.USER: {str(i) for i in users},
+            cls.TASK: {str(i) for i in tasks},
+            cls.PROJECT: {str(i) for i in projects},
+            cls.ORGANIZATION: {str(i) for i in organizations},
+        }
+        found: Dict[str, Dict[str, Any]] = {kind: {} for kind in cls.KINDS}
+        # (local entry, Redis value) of everything not served from the LRU, as seen before reading on
+        seen: Dict[Tuple[str, str], Tuple[Any, Any]] = {}
+
+        missing = await cls._lookup_cached(wanted, found, seen)
+
+        # Task entries only carry their project's id; look those projects up as a second step
+        task_projects = {task['project_id'] for task in found[cls.TASK].values()} - wanted[cls.PROJECT]
+        if task_projects:
+            missing[cls.PROJECT] |= (await cls._lookup_cached({cls.PROJECT: task_projects}, found, seen))[cls.PROJECT]
+
+        if any(missing.values()):
+            loaded = await cls._load(missing)
+            for kind, values in loaded.items():
+                found[kind].update(values)
+            await cls._write_back(loaded, seen)
+
+        return found
+
+    @classmethod
+    async def invalidate(cls, kind: str, *entity_ids: str):
+        """Forget cached names after a rename or delete; call it once the change is committed."""
+        entity_ids = [str(entity_id) for entity_id in entity_ids]
+        if not entity_ids:
+            return
+        tombstone = {cls._TOMBSTONE: uuid.uuid4().hex}
+        for entity_id in entity_ids:
+            # An already expired entry, so lookups skip it, but one that in-flight write-backs can tell apart
+            cls._local[(kind, entity_id)] = (0.0, tombstone)
+            cls._local.move_to_end((kind, entity_id))
+        cls._trim_local()
+        await redis_client.hash_set_many(
+            {CacheKeys.entity_names(kind): dict.fromkeys(entity_ids, tombstone)},
+            expire=GeneralConstants.ENTITY_NAME_CACHE_TTL
+        )
+
+    @classmethod
+    async def _lookup_cached(
+        cls, wanted: Dict[str, Set[str]], found: Dict[str, Dict[str, Any]], seen: Dict[Tuple[str, str], Tuple[Any, Any]]
+    ) -> Dict[str, Set[str]]:
+        """Fill `found` from the LRU and then Redis, recording in `seen` what was looked up remotely; returns what neither had."""
+        now = time.monotonic()
+        remote: Dict[str, Set[str]] = {}
+        for kind, ids in wanted.items():
+            remote[kind] = set()
+            for entity_id in ids:
+                entry = cls._local.get((kind, entity_id))
+                if entry is not None and entry[0] > now:
+                    cls._local.move_to_end((kind, entity_id))
+                    found[kind][entity_id] = entry[1]
+                else:
+                    remote[kind].add(entity_id)
+                    seen[(kind, entity_id)] = (entry, None)
+
+        cached = await redis_client.hash_get_many(
+            {CacheKeys.entity_names(kind): list(ids) for kind, ids in remote.items()}
+        )
+        missing = {kind: set() for kind in cls.KINDS}
+        for kind, ids in remote.items():
+            values = cached.get(CacheKeys.entity_names(kind), {})
+            for entity_id in ids:
+                value = values.get(entity_id)
+                local_entry = seen[(kind, entity_id)][0]
+                seen[(kind, entity_id)] = (local_entry, value)
+                if value is not None and not cls._is_tombstone(value):
+                    found[kind][entity_id] = value
+                    cls._remember(kind, entity_id, value, local_entry)
+                else:
+                    missing[kind].add(entity_id)
+        return missing
+
+    @classmethod
+    async def _write_back(cls, loaded: Dict[str, Dict[str, Any]], seen: Dict[Tuple[str, str], Tuple[Any, Any]]):
+        """
+        Cache loaded names wherever the entries are unchanged since the lookup. Projects that only
+        came along with their tasks were never looked up, so there is nothing to check them against.
+        """
+        written = await redis_client.hash_set_if_unchanged(
+            {
+                CacheKeys.entity_names(kind): {
+                    entity_id: (seen[(kind, entity_id)][1], value)
+                    for entity_id, value in values.items() if (kind, entity_id) in seen
+                }
+                for kind, values in loaded.items()
+            },
+            expire=GeneralConstants.ENTITY_NAME_CACHE_TTL
+        )
+        for kind, values in loaded.items():
+            for entity_id, value in values.items():
+                if (kind, entity_id) not in seen:
+                    continue
+                # With Redis unreachable the local check is all there is; otherwise Redis also
+                # catches invalidations made by other workers
+                if written is None or entity_id in written.get(CacheKeys.entity_names(kind), ()):
+                    cls._remember(kind, entity_id, value, seen[(kind, entity_id)][0])
+
+    @classmethod
+    async def _load(cls, missing: Dict[str, Set[str]]) -> Dict[str, Dict[str, Any]]:
+        # One round trip for every kind; projects of tasks loaded here come along in the same query
+        rows = await connections.get("default").execute_query_dict(
+            """
+            SELECT 'user' AS kind, id, COALESCE(NULLIF(trim(concat_ws(' ', "firstName", "lastName")), ''), email) AS name,
+                   NULL::uuid AS project_id
+            FROM users WHERE id = ANY($1::uuid[])
+            UNION ALL
+            SELECT 'task', id, title, project_id FROM tasks WHERE id = ANY($2::uuid[])
+            UNION ALL
+            SELECT 'project', id, name, NULL FROM projects
+            WHERE id = ANY($3::uuid[]) OR id IN (SELECT project_id FROM tasks WHERE id = ANY($2::uuid[]))
+            UNION ALL
+            SELECT 'organization', id, name, NULL FROM organizations WHERE id = ANY($4::uuid[])
+            """,
+            [list(missing[kind]) for kind in cls.KINDS]
+        )
+
+        loaded: Dict[str, Dict[str, Any]] = {kind: {} for kind in cls.KINDS}
+        for row in rows:
+            if row['kind'] == cls.TASK:
+                value = {"title": row['name'], "project_id": str(row['project_id'])}
+            else:
+                value = row['name']
+            loaded[row['kind']][str(row['id'])] = value
+        return loaded
+
+    @classmethod
+    def _remember(cls, kind: str, entity_id: str, value: Any, seen: Optional[Tuple[float, Any]]):
+        # Entries are compared by identity: anything written since the lookup, such as a tombstone, wins
+        if cls._local.get((kind, entity_id)) is not seen:
+            return
+        cls._local[(kind, entity_id)] = (time.monotonic() + GeneralConstants.ENTITY_NAME_LOCAL_TTL, value)
+        cls._local.move_to_end((kind, entity_id))
+        cls._trim_local()
+
+    @classmethod
+    def _trim_local(cls):
+        while len(cls._local) > GeneralConstants.ENTITY_NAME_LOCAL_SIZE:
+            cls._local.popitem(last=False)
+
+    @classmethod
+    def _is_tombstone(cls, value: Any) -> bool:
+        return isinstance(value, dict) and cls._TOMBSTONE in value
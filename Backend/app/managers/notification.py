@@ -2,7 +2,7 @@ from app.models import Notification
 from app.models.notification import NotificationType
 from app.exceptions import NotFoundException
 from app.utils.validator import Validator
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 
 class NotificationManager:
@@ -23,6 +23,7 @@ class NotificationManager:
                 NotificationType.ORG_INVITE.value,
                 NotificationType.MEETING.value,
                 NotificationType.CHAT.value,
+                NotificationType.TASK_DUE.value,
             ],
             "type",
         )
@@ -38,6 +39,37 @@ class NotificationManager:
         )
         return notification
 
+    @classmethod
+    async def create_many(cls, notifications: List[Dict]) -> List[Notification]:
+        """Insert system-generated notifications (already validated by the caller) in one statement."""
+        if not notifications:
+            return []
+
+        objects = [
+            Notification(
+                user_id=n["user_id"],
+                type=n["type"],
+                title=n["title"][:512],
+                message=n["message"],
+                metadata=n.get("metadata"),
+            )
+            for n in notifications
+        ]
+        await Notification.bulk_create(objects)
+        return objects
+
+    @classmethod
+    def serialize(cls, notification: Notification) -> Dict:
+        return {
+            "id": str(notification.id),
+            "type": getattr(notification.type, "value", notification.type) or "",
+            "title": notification.title,
+            "message": notification.message,
+            "metadata": notification.metadata or {},
+            "read": notification.read,
+            "created_at": notification.created_at.isoformat() if notification.created_at else None,
+        }
+
     @classmethod
     async def list_for_user(
         cls,
@@ -1,10 +1,13 @@
-from app.models import Organization, Membership, User, Project, Task, TaskAssignee, Notification
+from app.models import Organization, Membership, User, Project, TaskAssignee, Notification
 from app.models.membership import MembershipRole, MembershipStatus
 from app.models.notification import NotificationType
 from app.exceptions import BadRequestException
 from app.schemas.organization import CREATE_ORGANIZATION_SCHEMA, UPDATE_ORGANIZATION_SCHEMA, OrganizationSerializer
 from tortoise.transactions import in_transaction
 from tortoise import connections
+from app.managers.entity_name import EntityNameManager
+from app.managers.dashboard import DashboardManager
+from app.managers.task_counter import TaskCounterManager
 from typing import Dict
 
 class OrganizationManager:
@@ -26,6 +29,7 @@ class OrganizationManager:
                 role=MembershipRole.OWNER,
                 status=MembershipStatus.ACTIVE
             )
+        await DashboardManager.invalidate_users(creator_user_id)
 
         return OrganizationSerializer.from_orm(org).dict()
 
@@ -52,11 +56,11 @@ class OrganizationManager:
                 if existing_org and str(existing_org.id) != org_id:
                     raise BadRequestException("Organization with this name already exists.")
 
-            org.name = update_data['name']
-            org.address = update_data['address']
-            org.website = update_data['website']
-            org.description = update_data['description']
+            for key, value in update_data.items():
+                setattr(org, key, value)
             await org.save()
+            if 'name' in update_data:
+                await EntityNameManager.invalidate(EntityNameManager.ORGANIZATION, org_id)
 
         return OrganizationSerializer.from_orm(org).dict()
 
@@ -69,6 +73,8 @@ class OrganizationManager:
         async with in_transaction():
             await Membership.filter(organizationId=org_id).delete()
             await org.delete()
+        await EntityNameManager.invalidate(EntityNameManager.ORGANIZATION, org_id)
+        await DashboardManager.invalidate_organization(org_id)
 
         return True
 
@@ -212,6 +218,8 @@ class OrganizationManager:
 
         membership.status = MembershipStatus.SUSPENDED
         await membership.save()
+        await DashboardManager.invalidate_organization(org_id)
+        await DashboardManager.invalidate_users(user_id)
 
         return {"message": "User removed from organization successfully."}
 
@@ -265,32 +273,15 @@ class OrganizationManager:
             status=MembershipStatus.ACTIVE
         ).count()
 
-        # Total tasks across all projects in organization
-        total_tasks = await Task.filter(
-            project__org_id=org_id,
-            project__is_archieved=False
-        ).count()
-
-        # Active tasks (todo or in_progress)
-        active_tasks = await Task.filter(
-            project__org_id=org_id,
-            project__is_archieved=False,
-            status__in=["todo", "in_progress"]
-        ).count()
-
-        # Completed tasks
-        completed_tasks = await Task.filter(
-            project__org_id=org_id,
-            project__is_archieved=False,
-            status="done"
-        ).count()
+        # Task counts summed over the projects' counters
+        counts = await TaskCounterManager.get_organization_counts(org_id)
 
         return {
             "total_projects": total_projects,
             "total_members": total_members,
-            "total_tasks": total_tasks,
-            "active_tasks": active_tasks,
-            "completed_tasks": completed_tasks
+            "total_tasks": counts["total"],
+            "active_tasks": counts["todo"] + counts["in_progress"],
+            "completed_tasks": counts["done"]
         }
 
     @classmethod
@@ -309,6 +300,8 @@ class OrganizationManager:
 
         membership.status = MembershipStatus.ACTIVE
         await membership.save()
+        await DashboardManager.invalidate_organization(org_id)
+        await DashboardManager.invalidate_users(user_id)
 
         # Mark related org_invite notifications as accepted
         all_invites = await Notification.filter(
@@ -1,8 +1,12 @@
-from app.models import Project, Organization, Membership, Task, TaskAssignee
+from app.models import Project, Organization, Membership, TaskAssignee
 from app.models.membership import MembershipRole
 from app.exceptions import BadRequestException
 from app.schemas.project import CREATE_PROJECT_SCHEMA, UPDATE_PROJECT_SCHEMA, ProjectSerializer
 from tortoise.transactions import in_transaction
+from tortoise.functions import Count, Max
+from app.managers.entity_name import EntityNameManager
+from app.managers.dashboard import DashboardManager
+from app.managers.task_counter import TaskCounterManager
 from typing import Dict
 
 class ProjectManager:
@@ -25,6 +29,7 @@ class ProjectManager:
             org_id=organization.organizationId,
             created_by_id=user_id
         )
+        await DashboardManager.invalidate_organization(project.org_id)
 
         return ProjectSerializer.from_orm(project).dict()
 
@@ -35,6 +40,14 @@ class ProjectManager:
         projects = await Project.filter(org_id=org_id, is_archieved=False)
         return [ProjectSerializer.from_orm(project).dict() for project in projects]
 
+    @classmethod
+    async def get_projects_fingerprint(cls, org_id: str) -> Dict:
+        """Row count and newest updatedAt of the active projects; create, edit and archive all change one of them."""
+        rows = await Project.filter(org_id=org_id, is_archieved=False).annotate(
+            count=Count('id'), last_updated=Max('updatedAt')
+        ).values('count', 'last_updated')
+        return rows[0]
+
     @classmethod
     async def get_project(cls, project_id: str):
         project = await Project.get_or_none(id=project_id, is_archieved=False)
@@ -66,6 +79,8 @@ class ProjectManager:
             for key, value in update_data.items():
                 setattr(project, key, value)
             await project.save()
+            if 'name' in update_data:
+                await EntityNameManager.invalidate(EntityNameManager.PROJECT, project.id)
 
         return ProjectSerializer.from_orm(project).dict()
 
@@ -79,6 +94,7 @@ class ProjectManager:
 
         project.is_archieved = True
         await project.save()
+        await DashboardManager.invalidate_organization(project.org_id)
 
         return {"message": "Project archived successfully."}
 
@@ -97,6 +113,7 @@ class ProjectManager:
 
         project.is_archieved = False
         await project.save()
+        await DashboardManager.invalidate_organization(project.org_id)
 
         return ProjectSerializer.from_orm(project).dict()
 
@@ -118,20 +135,7 @@ class ProjectManager:
         if not project:
             raise BadRequestException("Project not found.")
 
-        # Total tasks
-        total_tasks = await Task.filter(project_id=project_id).count()
-
-        # Active tasks (todo or in_progress)
-        active_tasks = await Task.filter(
-            project_id=project_id,
-            status__in=["todo", "in_progress"]
-        ).count()
-
-        # Completed tasks
-        completed_tasks = await Task.filter(
-            project_id=project_id,
-            status="done"
-        ).count()
+        counts = (await TaskCounterManager.get_counts([str(project.id)]))[str(project.id)]
 
         # Team members (unique users assigned to tasks in this project)
         assignee_ids = await TaskAssignee.filter(
@@ -140,8 +144,8 @@ class ProjectManager:
         team_members = len(set(assignee_ids)) if assignee_ids else 0
 
         return {
-            "total_tasks": total_tasks,
-            "active_tasks": active_tasks,
-            "completed_tasks": completed_tasks,
+            "total_tasks": counts["total"],
+            "active_tasks": counts["todo"] + counts["in_progress"],
+            "completed_tasks": counts["done"],
             "team_members": team_members
         }
\ No newline at end of file
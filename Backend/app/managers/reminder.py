@@ -0,0 +1,121 @@
+from app.models.task import TaskStatus
+from app.models.notification import NotificationType
+from app.managers.notification import NotificationManager
+from app.core.websocket_manager import websocket_manager
+from app.constants import GeneralConstants
+from tortoise.transactions import in_transaction
+from tortoise import connections
+from typing import Optional, Dict
+from datetime import datetime, timedelta, timezone
+import logging
+import uuid
+
+logger = logging.getLogger(__name__)
+
+
+class ReminderManager:
+
+    @classmethod
+    async def schedule_task_reminders(cls, due_dates: Dict[str, Optional[datetime]]):
+        """
+        Point each task's reminder at its new due date. Call it in the transaction that wrote the due dates.
+        A cleared or already-passed due date cancels the reminder; a changed one re-arms it.
+        """
+        if not due_dates:
+            return
+
+        now = datetime.now(timezone.utc)
+        lead = timedelta(seconds=GeneralConstants.TASK_REMINDER_LEAD_SECONDS)
+        pending = {task_id: due_at - lead for task_id, due_at in due_dates.items() if due_at and due_at > now}
+        cancelled = [task_id for task_id in due_dates if task_id not in pending]
+
+        conn = connections.get("default")
+        if cancelled:
+            await conn.execute_query(
+                "DELETE FROM task_reminders WHERE task_id = ANY($1::uuid[])", [cancelled]
+            )
+        if pending:
+            await conn.execute_query(
+                """
+                INSERT INTO task_reminders (id, task_id, remind_at, sent_at, "createdAt")
+                SELECT v.id, v.task_id, v.remind_at, NULL, CURRENT_TIMESTAMP
+                FROM unnest($1::uuid[], $2::uuid[], $3::timestamptz[]) AS v(id, task_id, remind_at)
+                ON CONFLICT (task_id) DO UPDATE SET remind_at = EXCLUDED.remind_at, sent_at = NULL
+                """,
+                [[uuid.uuid4() for _ in pending], list(pending.keys()), list(pending.values())]
+            )
+
+    @classmethod
+    async def dispatch_due(cls, batch_size: int = GeneralConstants.REMINDER_BATCH_SIZE) -> int:
+        """
+        Claim up to batch_size reminders that are due and notify each task's assignees (or its creator).
+        Returns how many reminders were claimed, so callers know whether to keep draining.
+
+        Claiming, notification rows and marking as sent commit together, and SKIP LOCKED lets several
+        workers poll at once without sending a reminder twice. Websocket pushes follow the commit.
+        """
+        now = datetime.now(timezone.utc)
+
+        async with in_transaction() as conn:
+            claimed = await conn.execute_query_dict(
+                """
+                WITH due AS (
+                    SELECT id FROM task_reminders
+                    WHERE sent_at IS NULL AND remind_at <= $1
+                    ORDER BY remind_at
+                    LIMIT $2
+                    FOR UPDATE SKIP LOCKED
+                )
+                UPDATE task_reminders AS r SET sent_at = $1
+                FROM due
+                WHERE r.id = due.id
+                RETURNING r.task_id
+                """,
+                [now, batch_size]
+            )
+            if not claimed:
+                return 0
+
+            # Tasks finished, archived or undated since scheduling are skipped but stay claimed
+            tasks = await conn.execute_query_dict(
+                """
+                SELECT t.id, t.title, t.due_at, t.project_id, t.created_by_id, p.name AS project_name, p.org_id,
+                       COALESCE(array_agg(ta.user_id) FILTER (WHERE ta.user_id IS NOT NULL), '{}') AS assignee_ids
+                FROM tasks AS t
+                JOIN projects AS p ON p.id = t.project_id
+                LEFT JOIN task_assignees AS ta ON ta.task_id = t.id
+                WHERE t.id = ANY($1::uuid[])
+                  AND t.status <> $2
+                  AND t.due_at IS NOT NULL
+                  AND p.is_archieved = FALSE
+                GROUP BY t.id, p.name, p.org_id
+                """,
+                [[row['task_id'] for row in claimed], TaskStatus.DONE.value]
+            )
+
+            notifications = []
+            for task in tasks:
+                recipients = task['assignee_ids'] or ([task['created_by_id']] if task['created_by_id'] else [])
+                for user_id in recipients:
+                    notifications.append({
+                        "user_id": user_id,
+                        "type": NotificationType.TASK_DUE.value,
+                        "title": f"Task due soon: {task['title']}",
+                        "message": f"'{task['title']}' in {task['project_name']} is due at {task['due_at'].isoformat()}.",
+                        "metadata": {
+                            "org_id": str(task['org_id']),
+                            "project_id": str(task['project_id']),
+                            "project_name": task['project_name'],
+                            "task_id": str(task['id']),
+                            "due_at": task['due_at'].isoformat(),
+                        },
+                    })
+            created = await NotificationManager.create_many(notifications)
+
+        for notification in created:
+            try:
+                await websocket_manager.send_notification(str(notification.user_id), NotificationManager.serialize(notification))
+            except Exception as e:
+                logger.warning(f"Failed to push reminder {notification.id}: {e}")
+
+        return len(claimed)
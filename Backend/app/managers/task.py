@@ -1,26 +1,68 @@
-from app.models import Task, Project, User, Membership, TaskAssignee
+from app.models import Task, Project, User, TaskAssignee, TaskTombstone
 from app.models.membership import MembershipRole
+from app.models.task import TaskStatus
+from app.models.activity import ActionType, EntityType
 from app.exceptions import (
-    BadRequestException, NotFoundException, ConflictException, ForbiddenException
+    BadRequestException, NotFoundException, ConflictException
 )
 from app.schemas.task import (
     CREATE_TASK_SCHEMA, UPDATE_TASK_SCHEMA, ASSIGN_TASK_SCHEMA, CHANGE_STATUS_SCHEMA, 
+    MOVE_TASK_SCHEMA, SET_PARENT_SCHEMA, BULK_CREATE_TASK_SCHEMA, BULK_UPDATE_TASK_SCHEMA, BULK_CHANGE_STATUS_SCHEMA, BULK_ASSIGN_TASK_SCHEMA,
     TaskSerializer, TaskListSerializer, TaskDetailSerializer, PaginatedResponse
 )
 from tortoise.transactions import in_transaction
+from tortoise import connections
 from app.managers.activity import ActivityManager
+from app.managers.reminder import ReminderManager
+from app.managers.task_revision import TaskRevisionManager
+from app.managers.entity_name import EntityNameManager
+from app.managers.dashboard import DashboardManager
+from app.managers.task_counter import TaskCounterManager
 from tortoise.exceptions import IntegrityError
 from app.constants import GeneralConstants, ErrorMessages
 from app.utils.validator import Validator
-from typing import Optional
+from app.dependencies.auth import ProjectAccessContext
+from app.utils.pagination import encode_cursor, decode_cursor, parse_cursor_datetime, keyset_page
+from app.utils.redis_cache import CacheKeys, CacheStats
+from app.utils.ranking import rank_between, evenly_spaced_ranks
+from app.core.redis_client import redis_client
+from tortoise.expressions import Q
+from fastapi import UploadFile
+from starlette.concurrency import run_in_threadpool
+from pydantic import ValidationError
+from typing import Optional, List, Dict, Tuple, Any, AsyncIterator
+from collections import OrderedDict
+from datetime import datetime, timezone
 from math import ceil
+import logging
+import tempfile
+import shutil
+import uuid
+import json
+import csv
+import io
+import os
+
+logger = logging.getLogger(__name__)
 
 class TaskManager:
 
+    # Columns that raw-SQL updates may change, with their Postgres types
+    _UPDATABLE_COLUMNS = {
+        "title": "varchar", "description": "text", "status": "varchar", "rank": "varchar",
+        "parent_id": "uuid", "path": "varchar", "due_at": "timestamptz",
+    }
+
+    # Materialized paths are a run of ancestor ids, each 32 hex digits followed by '.'
+    _PATH_SEGMENT_LENGTH = 33
+
+    # Hit/miss counters for the read-through task detail cache
+    _cache_stats = CacheStats(CacheKeys.TASK)
+
     @classmethod
-    async def create_task(cls, payload: dict, project_id: str, user_id: str):
-        project_id = Validator.validate_uuid(project_id, "project_id")
-        user_id = Validator.validate_uuid(user_id, "user_id")
+    async def create_task(cls, payload: dict, access: ProjectAccessContext):
+        project_id = access.project_id
+        user_id = access.user_id
 
         validated_data = CREATE_TASK_SCHEMA(**payload)
 
@@ -30,81 +72,145 @@ class TaskManager:
 
         Validator.validate_non_empty_string(validated_data.title, "title", max_length=255)
 
-        project = await Project.get_or_none(id=project_id).select_related('org')
-        if not project:
-            raise NotFoundException(ErrorMessages.PROJECT_NOT_FOUND)
-        
-        if project.is_archieved:
-            raise NotFoundException(ErrorMessages.PROJECT_ARCHIVED)
-
-        task = await Task.create(
-            title=validated_data.title,
-            description=validated_data.description,
-            status=validated_data.status,
-            project=project,
-            created_by_id=user_id
-        )
-
-        if validated_data.assignee_ids:
-            for assignee_id_str in validated_data.assignee_ids:
-                assignee_id = Validator.validate_uuid(assignee_id_str, "assignee_id")
-                assignee = await User.get_or_none(id=assignee_id)
-                if not assignee:
-                    raise NotFoundException(ErrorMessages.ASSIGNEE_NOT_FOUND)
-                await TaskAssignee.create(task=task, user=assignee)
-
-        # Log activity (non-blocking - don't fail the request if logging fails)
-        org_id = str(project.org_id)
-        try:
-            from app.models.activity import ActionType, EntityType
-            await ActivityManager.create_activity(
-                org_id=org_id,
-                user_id=user_id,
-                entity_type=EntityType.TASK.value,
-                entity_id=str(task.id),
-                action=ActionType.TASK_CREATED.value,
-                metadata={
-                    'title': validated_data.title,
-                    'description': validated_data.description,
-                    'status': validated_data.status,
-                    'assignee_ids': validated_data.assignee_ids
-                }
+        assignee_ids = cls._normalize_ids(validated_data.assignee_ids, "assignee_id")
+        await cls._ensure_assignees_exist(set(assignee_ids))
+        parent_id = cls._normalize_ids([validated_data.parent_id], "parent_id")[0] if validated_data.parent_id else None
+
+        project = access.project
+
+        # New tasks go to the bottom of their column
+        async with in_transaction():
+            path = ""
+            if parent_id:
+                await cls._lock_task_tree(project_id, shared=True)
+                path = (await cls._resolve_parent_paths({parent_id}, project_id))[parent_id]
+
+            await cls._lock_rank_column(project_id, validated_data.status)
+            rank = rank_between(await cls._last_rank(project_id, validated_data.status), None)
+            task = await Task.create(
+                title=validated_data.title,
+                description=validated_data.description,
+                status=validated_data.status,
+                rank=rank,
+                parent_id=parent_id,
+                path=path,
+                due_at=validated_data.due_at,
+                project=project,
+                created_by_id=user_id
             )
-        except Exception as e:
-            # Log the error but don't fail the request - task was already created
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.error(f"Failed to log task creation activity: {e}", exc_info=True)
+            if assignee_ids:
+                await TaskAssignee.bulk_create([
+                    TaskAssignee(task_id=task.id, user_id=assignee_id) for assignee_id in assignee_ids
+                ])
+            if task.due_at:
+                await ReminderManager.schedule_task_reminders({str(task.id): task.due_at})
+            await TaskRevisionManager.record_revisions([(None, task)], user_id)
+            await TaskCounterManager.record_transitions(project_id, [(None, task.status)])
+
+        if assignee_ids:
+            await DashboardManager.invalidate_organization(access.org_id)
+            await DashboardManager.invalidate_users(*assignee_ids)
+
+        # Log activity (journaled, written after the response)
+        await ActivityManager.log_activities([{
+            'org_id': str(project.org_id),
+            'project_id': access.project_id,
+            'user_id': user_id,
+            'entity_type': EntityType.TASK.value,
+            'entity_id': str(task.id),
+            'action': ActionType.TASK_CREATED.value,
+            'metadata': {
+                'title': validated_data.title,
+                'description': validated_data.description,
+                'status': validated_data.status,
+                'assignee_ids': validated_data.assignee_ids
+            }
+        }])
 
         result = await TaskSerializer.from_orm(task)
         return result.dict()
 
     @classmethod
-    async def get_task(cls, task_id: str, project_id: Optional[str] = None):
-        task_id = Validator.validate_uuid(task_id, "task_id")
-        
-        task = await Task.get_or_none(id=task_id).select_related('project', 'created_by')
+    async def get_task(cls, task_id: str, access: ProjectAccessContext):
+        task_id = cls._normalize_ids([task_id], "task_id")[0]
+        project_id = access.project_id
+
+        # An entry is only trusted if no write has since recorded a newer version for the task
+        cached, latest_version = await redis_client.get_many(CacheKeys.task(task_id), CacheKeys.task_version(task_id))
+        if isinstance(cached, dict) and (latest_version is None or cached.get('version', 0) >= latest_version):
+            cls._cache_stats.hit()
+            if cached['project_id'] != project_id:
+                raise NotFoundException(ErrorMessages.TASK_NOT_IN_PROJECT)
+            return cached
+
+        cls._cache_stats.miss()
+
+        task = await Task.get_or_none(id=task_id).select_related('created_by')
         if not task:
             raise NotFoundException(ErrorMessages.TASK_NOT_FOUND)
 
-        if project_id:
-            project_id = Validator.validate_uuid(project_id, "project_id")
-            if str(task.project_id) != project_id:
-                raise NotFoundException(ErrorMessages.TASK_NOT_IN_PROJECT)
-            
-            # Check if project is archived
-            if task.project.is_archieved:
-                raise NotFoundException(ErrorMessages.PROJECT_ARCHIVED)
+        if str(task.project_id) != project_id:
+            raise NotFoundException(ErrorMessages.TASK_NOT_IN_PROJECT)
 
-        result = await TaskDetailSerializer.from_orm(task)
-        return result.dict()
+        result = (await TaskDetailSerializer.from_orm(task)).dict()
+        await redis_client.set(CacheKeys.task(task_id), result, expire=GeneralConstants.TASK_CACHE_TTL)
+        return result
 
     @classmethod
-    async def update_task(cls, task_id: str, payload: dict, user_id: str, project_id: Optional[str] = None):
-        task_id = Validator.validate_uuid(task_id, "task_id")
+    async def get_task_version(cls, task_id: str, access: ProjectAccessContext) -> Optional[int]:
+        task_id = cls._normalize_ids([task_id], "task_id")[0]
+
+        return await Task.filter(id=task_id, project_id=access.project_id).first().values_list('version', flat=True)
+
+    @classmethod
+    async def get_project_tasks_fingerprint(cls, access: ProjectAccessContext) -> Dict[str, Any]:
+        """
+        Row count and newest updatedAt of a project's tasks, plus the newest updatedAt of their
+        assignees, whose names are listed with them; any task write, delete or rename changes one.
+        """
+        rows = await connections.get("default").execute_query_dict(
+            """
+            SELECT COUNT(*) AS count, MAX(t."updatedAt") AS last_updated,
+                   (SELECT MAX(u."updatedAt") FROM task_assignees AS ta
+                    JOIN tasks AS pt ON pt.id = ta.task_id
+                    JOIN users AS u ON u.id = ta.user_id
+                    WHERE pt.project_id = $1) AS assignees_updated
+            FROM tasks AS t
+            WHERE t.project_id = $1
+            """,
+            [access.project_id]
+        )
+        return rows[0]
+
+    @classmethod
+    async def get_my_tasks_fingerprint(cls, user_id: str) -> Dict[str, Any]:
         user_id = Validator.validate_uuid(user_id, "user_id")
-        if project_id:
-            project_id = Validator.validate_uuid(project_id, "project_id")
+
+        # Tortoise groups joined aggregates by every task column, so this one is written out
+        rows = await connections.get("default").execute_query_dict(
+            """
+            WITH mine AS (
+                SELECT t.id, t."updatedAt"
+                FROM tasks AS t
+                JOIN task_assignees AS ta ON ta.task_id = t.id
+                JOIN projects AS p ON p.id = t.project_id
+                WHERE ta.user_id = $1 AND p.is_archieved = FALSE
+            )
+            SELECT (SELECT COUNT(*) FROM mine) AS count,
+                   (SELECT MAX("updatedAt") FROM mine) AS last_updated,
+                   (SELECT MAX(u."updatedAt") FROM mine
+                    JOIN task_assignees AS ta ON ta.task_id = mine.id
+                    JOIN users AS u ON u.id = ta.user_id) AS assignees_updated
+            """,
+            [user_id]
+        )
+        return rows[0]
+
+    @classmethod
+    async def update_task(cls, task_id: str, payload: dict, access: ProjectAccessContext):
+        task_id = Validator.validate_uuid(task_id, "task_id")
+        user_id = access.user_id
+        project_id = access.project_id
 
         validated_data = UPDATE_TASK_SCHEMA(**payload)
 
@@ -114,212 +220,455 @@ class TaskManager:
         if validated_data.title is not None:
             Validator.validate_non_empty_string(validated_data.title, "title", max_length=255)
 
-        task = await Task.get_or_none(id=task_id).select_related('project')
-        if not task:
-            raise NotFoundException(ErrorMessages.TASK_NOT_FOUND)
-
-        if project_id and str(task.project_id) != project_id:
-            raise NotFoundException(ErrorMessages.TASK_NOT_IN_PROJECT)
-
-        if task.project.is_archieved:
-            raise NotFoundException(ErrorMessages.PROJECT_ARCHIVED)
-
-        if task.version != validated_data.version:
-            raise ConflictException(ErrorMessages.TASK_VERSION_MISMATCH)
+        update_assignees = 'assignee_ids' in validated_data.dict(exclude_unset=True)
+        if update_assignees:
+            assignee_ids = cls._normalize_ids(validated_data.assignee_ids or [], "assignee_id")
+            await cls._ensure_assignees_exist(set(assignee_ids))
 
         update_data = validated_data.dict(exclude_unset=True, exclude={'version', 'assignee_ids'})
-        
-        # Handle assignee_ids separately
-        if 'assignee_ids' in validated_data.dict(exclude_unset=True):
-            # Remove existing assignees
-            await TaskAssignee.filter(task_id=task_id).delete()
-            
-            # Add new assignees
-            if validated_data.assignee_ids:
-                for assignee_id_str in validated_data.assignee_ids:
-                    assignee_id = Validator.validate_uuid(assignee_id_str, "assignee_id")
-                    assignee = await User.get_or_none(id=assignee_id)
-                    if not assignee:
-                        raise NotFoundException(ErrorMessages.ASSIGNEE_NOT_FOUND)
-                    await TaskAssignee.create(task=task, user=assignee)
-
-        if update_data:
-            # Store old values for activity logging
-            old_title = task.title
-            old_description = task.description
-
-            update_data['version'] = task.version + 1
-
-            for key, value in update_data.items():
-                setattr(task, key, value)
-            await task.save()
-
-            # Log activities for changes (non-blocking)
-            org_id = str(task.project.org_id)
-            try:
-                from app.models.activity import ActionType, EntityType
-                
-                if 'title' in update_data and update_data['title'] != old_title:
-                    await ActivityManager.create_activity(
-                        org_id=org_id,
-                        user_id=user_id,
-                        entity_type=EntityType.TASK.value,
-                        entity_id=task_id,
-                        action=ActionType.TASK_TITLE_UPDATED.value,
-                        metadata={
-                            'old_title': old_title,
-                            'new_title': update_data['title']
-                        }
-                    )
 
-                if 'description' in update_data and update_data['description'] != old_description:
-                    await ActivityManager.create_activity(
-                        org_id=org_id,
-                        user_id=user_id,
-                        entity_type=EntityType.TASK.value,
-                        entity_id=task_id,
-                        action=ActionType.TASK_DESCRIPTION_UPDATED.value,
-                        metadata={
-                            'old_description': old_description or '',
-                            'new_description': update_data['description'] or ''
-                        }
-                    )
-            except Exception as e:
-                # Log the error but don't fail the request - task was already updated
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.error(f"Failed to log task update activity: {e}", exc_info=True)
+        if not update_data:
+            # Assignee-only update: the version is checked, and bumped only if the assignee set changes
+            task = await cls._get_task_for_write(task_id, project_id)
+            if task.version != validated_data.version:
+                raise ConflictException(ErrorMessages.TASK_VERSION_MISMATCH)
+
+            if update_assignees:
+                async with in_transaction():
+                    added, removed = await cls._sync_assignees({str(task.id): assignee_ids})
+                    if added or removed:
+                        # Assignees are part of the task's representation, so a real change is a new version
+                        task, _ = await cls._compare_and_swap(task_id, validated_data.version, {}, project_id)
+                await cls._invalidate_task_cache({str(task.id): task.version})
+                if added or removed:
+                    await DashboardManager.invalidate_organization(access.org_id)
+                    await DashboardManager.invalidate_users(*[assignee_id for _, assignee_id in added])
+
+            result = await TaskSerializer.from_orm(task)
+            return result.dict()
+
+        # The swapped row stays locked until commit, so assignee, reminder and history writes land atomically with it
+        async with in_transaction():
+            if update_data.get('status'):
+                update_data.update(await cls._rank_for_status_change(
+                    task_id, project_id, validated_data.version, update_data['status']
+                ))
+            task, previous = await cls._compare_and_swap(task_id, validated_data.version, update_data, project_id)
+            added = []
+            if update_assignees:
+                added, _ = await cls._sync_assignees({str(task.id): assignee_ids})
+            if 'due_at' in update_data:
+                await ReminderManager.schedule_task_reminders({str(task.id): task.due_at})
+            await TaskRevisionManager.record_revisions([(TaskRevisionManager.state_of(previous), task)], user_id)
+            await TaskCounterManager.record_transitions(project_id, [(previous['status'], task.status)])
+
+        await cls._invalidate_task_cache({str(task.id): task.version})
+        if update_assignees or update_data.get('status', previous['status']) != previous['status']:
+            await DashboardManager.invalidate_organization(access.org_id)
+        await DashboardManager.invalidate_users(*[assignee_id for _, assignee_id in added])
+
+        # Old values come back from the swap itself for activity logging
+        old_title = previous['title']
+        old_description = previous['description']
+        if 'title' in update_data and update_data['title'] != old_title:
+            await EntityNameManager.invalidate(EntityNameManager.TASK, task_id)
+
+        # Log activities for changes (journaled, written after the response)
+        org_id = previous['org_id']
+        activities = []
+        if 'title' in update_data and update_data['title'] != old_title:
+            activities.append({
+                'org_id': org_id,
+                'project_id': access.project_id,
+                'user_id': user_id,
+                'entity_type': EntityType.TASK.value,
+                'entity_id': task_id,
+                'action': ActionType.TASK_TITLE_UPDATED.value,
+                'metadata': {
+                    'old_title': old_title,
+                    'new_title': update_data['title']
+                }
+            })
+
+        if 'description' in update_data and update_data['description'] != old_description:
+            activities.append({
+                'org_id': org_id,
+                'project_id': access.project_id,
+                'user_id': user_id,
+                'entity_type': EntityType.TASK.value,
+                'entity_id': task_id,
+                'action': ActionType.TASK_DESCRIPTION_UPDATED.value,
+                # The text itself lives in the revision history; keep activity rows small
+                'metadata': {
+                    'version': task.version,
+                    'old_length': len(old_description or ''),
+                    'new_length': len(update_data['description'] or '')
+                }
+            })
+        await ActivityManager.log_activities(activities)
 
         result = await TaskSerializer.from_orm(task)
         return result.dict()
 
     @classmethod
-    async def assign_task(cls, task_id: str, payload: dict, user_id: str, project_id: Optional[str] = None):
+    async def assign_task(cls, task_id: str, payload: dict, access: ProjectAccessContext):
         task_id = Validator.validate_uuid(task_id, "task_id")
-        user_id = Validator.validate_uuid(user_id, "user_id")
-        if project_id:
-            project_id = Validator.validate_uuid(project_id, "project_id")
+        user_id = access.user_id
+        project_id = access.project_id
 
         validated_data = ASSIGN_TASK_SCHEMA(**payload)
 
-        task = await Task.get_or_none(id=task_id).select_related('project')
-        if not task:
-            raise NotFoundException(ErrorMessages.TASK_NOT_FOUND)
-
-        if project_id and str(task.project_id) != project_id:
-            raise NotFoundException(ErrorMessages.TASK_NOT_IN_PROJECT)
-
-        if task.project.is_archieved:
-            raise NotFoundException(ErrorMessages.PROJECT_ARCHIVED)
+        assignee_ids = cls._normalize_ids(validated_data.assignee_ids, "assignee_id")
+        await cls._ensure_assignees_exist(set(assignee_ids))
 
+        task = await cls._get_task_for_write(task_id, project_id)
         if task.version != validated_data.version:
             raise ConflictException(ErrorMessages.TASK_VERSION_MISMATCH)
 
-        # Remove existing assignees
-        await TaskAssignee.filter(task_id=task_id).delete()
-        
-        # Add new assignees
-        if validated_data.assignee_ids:
-            for assignee_id_str in validated_data.assignee_ids:
-                assignee_id = Validator.validate_uuid(assignee_id_str, "assignee_id")
-                assignee = await User.get_or_none(id=assignee_id)
-                if not assignee:
-                    raise NotFoundException(ErrorMessages.ASSIGNEE_NOT_FOUND)
-                await TaskAssignee.create(task=task, user=assignee)
-                # Log activity for each assignment (non-blocking)
-                org_id = str(task.project.org_id)
-                try:
-                    from app.models.activity import ActionType, EntityType
-                    await ActivityManager.create_activity(
-                        org_id=org_id,
-                        user_id=user_id,
-                        entity_type=EntityType.TASK.value,
-                        entity_id=task_id,
-                        action=ActionType.TASK_ASSIGNED.value,
-                        metadata={
-                            'assignee_id': str(assignee_id)
-                        }
-                    )
-                except Exception as e:
-                    # Log the error but don't fail the request - assignment was already made
-                    import logging
-                    logger = logging.getLogger(__name__)
-                    logger.error(f"Failed to log task assignment activity: {e}", exc_info=True)
+        # Diff against the current assignees; an unchanged list writes nothing. A real change bumps
+        # the version with a guarded swap, which rolls the assignee rows back if another write won
+        async with in_transaction():
+            added, removed = await cls._sync_assignees({str(task.id): assignee_ids})
+            if added or removed:
+                task, _ = await cls._compare_and_swap(task_id, validated_data.version, {}, project_id)
+        if not added and not removed:
+            result = await TaskSerializer.from_orm(task)
+            return result.dict()
+
+        # Log activity for each new assignment in one batch (non-blocking)
+        org_id = access.org_id
+        await ActivityManager.log_activities([
+            {
+                'org_id': org_id,
+                'project_id': access.project_id,
+                'user_id': user_id,
+                'entity_type': EntityType.TASK.value,
+                'entity_id': task_id,
+                'action': ActionType.TASK_ASSIGNED.value,
+                'metadata': {
+                    'assignee_id': assignee_id
+                }
+            }
+            for _, assignee_id in added
+        ])
 
-        task.version = task.version + 1
-        await task.save()
+        await cls._invalidate_task_cache({str(task.id): task.version})
+        await DashboardManager.invalidate_organization(access.org_id)
+        await DashboardManager.invalidate_users(*[assignee_id for _, assignee_id in added])
 
         result = await TaskSerializer.from_orm(task)
         return result.dict()
 
     @classmethod
-    async def change_task_status(cls, task_id: str, payload: dict, user_id: str, project_id: Optional[str] = None):
+    async def change_task_status(cls, task_id: str, payload: dict, access: ProjectAccessContext):
         task_id = Validator.validate_uuid(task_id, "task_id")
-        user_id = Validator.validate_uuid(user_id, "user_id")
-        if project_id:
-            project_id = Validator.validate_uuid(project_id, "project_id")
+        user_id = access.user_id
+        project_id = access.project_id
 
         validated_data = CHANGE_STATUS_SCHEMA(**payload)
 
         if validated_data.status not in GeneralConstants.TASK_STATUSES:
             raise BadRequestException(ErrorMessages.INVALID_STATUS)
 
-        task = await Task.get_or_none(id=task_id).select_related('project')
-        if not task:
-            raise NotFoundException(ErrorMessages.TASK_NOT_FOUND)
+        async with in_transaction():
+            changes = {'status': validated_data.status}
+            changes.update(await cls._rank_for_status_change(
+                task_id, project_id, validated_data.version, validated_data.status
+            ))
+            task, previous = await cls._compare_and_swap(task_id, validated_data.version, changes, project_id)
+            await TaskRevisionManager.record_revisions([(TaskRevisionManager.state_of(previous), task)], user_id)
+            await TaskCounterManager.record_transitions(project_id, [(previous['status'], task.status)])
+        old_status = previous['status']
+        await cls._invalidate_task_cache({str(task.id): task.version})
+
+        # Log activity (journaled, written after the response)
+        if old_status != validated_data.status:
+            await DashboardManager.invalidate_organization(access.org_id)
+            await ActivityManager.log_activities([{
+                'org_id': previous['org_id'],
+                'project_id': access.project_id,
+                'user_id': user_id,
+                'entity_type': EntityType.TASK.value,
+                'entity_id': task_id,
+                'action': ActionType.TASK_STATUS_CHANGED.value,
+                'metadata': {
+                    "old_status": old_status,
+                    "new_status": validated_data.status,
+                }
+            }])
 
-        if project_id and str(task.project_id) != project_id:
-            raise NotFoundException(ErrorMessages.TASK_NOT_IN_PROJECT)
+        result = await TaskSerializer.from_orm(task)
+        return result.dict()
+
+    @classmethod
+    async def move_task(cls, task_id: str, payload: dict, access: ProjectAccessContext):
+        """
+        Place a task between its new neighbours, optionally in another status column.
+        Only the moved row is written: it gets a rank that sorts between the neighbours' ranks.
+        """
+        task_id = cls._normalize_ids([task_id], "task_id")[0]
+        user_id = access.user_id
+        project_id = access.project_id
 
-        if task.project.is_archieved:
-            raise NotFoundException(ErrorMessages.PROJECT_ARCHIVED)
+        validated_data = MOVE_TASK_SCHEMA(**payload)
 
+        if validated_data.status and validated_data.status not in GeneralConstants.TASK_STATUSES:
+            raise BadRequestException(ErrorMessages.INVALID_STATUS)
+
+        after_id = cls._normalize_ids([validated_data.after_id], "after_id")[0] if validated_data.after_id else None
+        before_id = cls._normalize_ids([validated_data.before_id], "before_id")[0] if validated_data.before_id else None
+        if task_id in (after_id, before_id):
+            raise BadRequestException(ErrorMessages.MOVE_ANCHOR_IS_TASK)
+
+        task = await cls._get_task_for_write(task_id, project_id)
         if task.version != validated_data.version:
             raise ConflictException(ErrorMessages.TASK_VERSION_MISMATCH)
 
-        old_status = task.status
+        status = validated_data.status or TaskStatus(task.status).value
+
+        async with in_transaction():
+            # The column left behind too: renumbering it would bump this task's version mid-move
+            await cls._lock_rank_columns(project_id, {status, TaskStatus(task.status).value})
+
+            column = Task.filter(project_id=project_id, status=status).exclude(id=task_id)
+            anchor_ids = [anchor for anchor in (after_id, before_id) if anchor]
+            anchors = {
+                str(row['id']): row['rank']
+                for row in await column.filter(id__in=anchor_ids).values('id', 'rank')
+            } if anchor_ids else {}
+            if len(anchors) != len(anchor_ids):
+                raise BadRequestException(ErrorMessages.MOVE_ANCHOR_NOT_FOUND)
+
+            # A single anchor implies the other neighbour: the next row on the far side of it
+            lower = anchors.get(after_id)
+            upper = anchors.get(before_id)
+            if after_id and not before_id:
+                upper = await column.filter(rank__gt=lower).order_by('rank').first().values_list('rank', flat=True)
+            elif before_id and not after_id:
+                lower = await column.filter(rank__lt=upper).order_by('-rank').first().values_list('rank', flat=True)
+            elif not anchor_ids:
+                lower = await column.order_by('-rank').first().values_list('rank', flat=True)
+
+            changes = {'rank': rank_between(lower, upper)}
+            if status != task.status:
+                changes['status'] = status
+            task, previous = await cls._compare_and_swap(task_id, validated_data.version, changes, project_id)
+            await TaskRevisionManager.record_revisions([(TaskRevisionManager.state_of(previous), task)], user_id)
+            await TaskCounterManager.record_transitions(project_id, [(previous['status'], task.status)])
+
+        await cls._invalidate_task_cache({str(task.id): task.version})
+
+        if previous['status'] != status:
+            await DashboardManager.invalidate_organization(access.org_id)
+            await ActivityManager.log_activities([{
+                'org_id': previous['org_id'],
+                'project_id': access.project_id,
+                'user_id': user_id,
+                'entity_type': EntityType.TASK.value,
+                'entity_id': task_id,
+                'action': ActionType.TASK_STATUS_CHANGED.value,
+                'metadata': {
+                    "old_status": previous['status'],
+                    "new_status": status,
+                }
+            }])
+
+        result = await TaskSerializer.from_orm(task)
+        return result.dict()
 
-        task.status = validated_data.status
-        task.version = task.version + 1
-        await task.save()
+    @classmethod
+    def rank_needs_rebalance(cls, rank: str) -> bool:
+        return len(rank) > GeneralConstants.TASK_RANK_REBALANCE_LENGTH
 
-        # Log activity (non-blocking - don't fail the request if logging fails)
-        org_id = str(task.project.org_id)
-        if old_status != validated_data.status:
-            try:
-                from app.models.activity import ActionType, EntityType
-                await ActivityManager.create_activity(
-                    org_id=org_id,
-                    user_id=user_id,
-                    entity_type=EntityType.TASK.value,
-                    entity_id=task_id,
-                    action=ActionType.TASK_STATUS_CHANGED.value,
-                    metadata={
-                        "old_status": old_status,
-                        "new_status": validated_data.status,
-                    }
+    @classmethod
+    async def rebalance_ranks(cls, project_id: str, status: str):
+        """
+        Renumber one status column with short, evenly spaced ranks, keeping its order.
+        Runs in the background after a move produced an overly long rank, so it is rare.
+        Renumbered tasks get a new version, so ETags and cached copies pick up the new ranks;
+        moves hold the lock on every column they touch, so none is in flight meanwhile.
+        """
+        try:
+            async with in_transaction() as conn:
+                await cls._lock_rank_column(project_id, status)
+                task_ids = await Task.filter(project_id=project_id, status=status).order_by(
+                    'rank', 'id'
+                ).values_list('id', flat=True)
+
+                rows = await conn.execute_query_dict(
+                    """
+                    UPDATE tasks AS t
+                    SET "rank" = v.rank, "version" = t."version" + 1, "updatedAt" = CURRENT_TIMESTAMP
+                    FROM unnest($1::uuid[], $2::varchar[]) AS v(id, rank)
+                    WHERE t.id = v.id AND t."rank" <> v.rank
+                    RETURNING t.id, t.version
+                    """,
+                    [list(task_ids), evenly_spaced_ranks(len(task_ids))]
                 )
-            except Exception as e:
-                # Log the error but don't fail the request - task was already updated
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.error(f"Failed to log task status change activity: {e}", exc_info=True)
+
+            await cls._invalidate_task_cache({str(row['id']): row['version'] for row in rows})
+            logger.info(f"Renumbered {len(rows)} task ranks in project {project_id} column {status}")
+        except Exception as e:
+            logger.error(f"Failed to renumber task ranks for project {project_id} column {status}: {e}", exc_info=True)
+
+    @classmethod
+    async def set_parent(cls, task_id: str, payload: dict, access: ProjectAccessContext):
+        """
+        Move a task, together with its subtree, under another task or back to the top level.
+        Only the task itself is version-checked and bumped; descendants just get their paths rewritten.
+        """
+        task_id = cls._normalize_ids([task_id], "task_id")[0]
+        project_id = access.project_id
+
+        validated_data = SET_PARENT_SCHEMA(**payload)
+        parent_id = cls._normalize_ids([validated_data.parent_id], "parent_id")[0] if validated_data.parent_id else None
+        if parent_id == task_id:
+            raise BadRequestException(ErrorMessages.SUBTASK_CYCLE)
+
+        async with in_transaction():
+            await cls._lock_task_tree(project_id)
+            task = await cls._get_task_for_write(task_id, project_id)
+            if task.version != validated_data.version:
+                raise ConflictException(ErrorMessages.TASK_VERSION_MISMATCH)
+
+            old_prefix = cls._subtree_prefix(task)
+            path = (await cls._resolve_parent_paths({parent_id}, project_id))[parent_id] if parent_id else ""
+            if path.startswith(old_prefix):
+                raise BadRequestException(ErrorMessages.SUBTASK_CYCLE)
+
+            new_prefix = f"{path}{old_prefix[len(task.path):]}"
+            rows = await connections.get("default").execute_query_dict(
+                "SELECT max(length(path)) AS length FROM tasks WHERE project_id = $1 AND path ~>=~ $2 AND path ~<~ $3",
+                [project_id, old_prefix, cls._path_upper_bound(old_prefix)]
+            )
+            deepest = (rows[0]['length'] or len(old_prefix)) - len(old_prefix) + len(new_prefix)
+            if deepest // cls._PATH_SEGMENT_LENGTH > GeneralConstants.TASK_MAX_DEPTH:
+                raise BadRequestException(ErrorMessages.SUBTASK_TOO_DEEP)
+
+            task, _ = await cls._compare_and_swap(
+                task_id, validated_data.version, {'parent_id': parent_id, 'path': path}, project_id
+            )
+            await cls._rewrite_subtree_paths(project_id, old_prefix, new_prefix)
+
+        await cls._invalidate_task_cache({str(task.id): task.version})
 
         result = await TaskSerializer.from_orm(task)
         return result.dict()
 
+    @classmethod
+    async def list_subtasks(
+        cls,
+        task_id: str,
+        access: ProjectAccessContext,
+        recursive: bool = False,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ):
+        """
+        Direct children of a task, or with `recursive` its whole subtree, as one indexed path scan.
+        Items are ordered by (path, rank, id) so each level comes out in board order; clients
+        rebuild the tree from parent_id and pass next_cursor back for the following page.
+        """
+        task_id = cls._normalize_ids([task_id], "task_id")[0]
+        limit = Validator.validate_positive_integer(limit, "limit", min_value=1, max_value=GeneralConstants.SUBTASK_LIST_LIMIT)
+
+        task = await cls._get_task_for_write(task_id, access.project_id)
+        prefix = cls._subtree_prefix(task)
+
+        params: List[Any] = [access.project_id, prefix]
+        if recursive:
+            params.append(cls._path_upper_bound(prefix))
+            conditions = ["t.project_id = $1", "t.path ~>=~ $2", "t.path ~<~ $3"]
+        else:
+            conditions = ["t.project_id = $1", "t.path = $2"]
+
+        if cursor:
+            path, rank, last_id = decode_cursor(cursor, 3)
+            params += [path, rank, Validator.validate_uuid(last_id, "cursor")]
+            conditions.append(f'(t.path, t."rank", t.id) > (${len(params) - 2}, ${len(params) - 1}, ${len(params)}::uuid)')
+        params.append(limit + 1)
+
+        rows = await connections.get("default").execute_query_dict(
+            f"""
+            SELECT t.* FROM tasks AS t
+            WHERE {' AND '.join(conditions)}
+            ORDER BY t.path, t."rank", t.id
+            LIMIT ${len(params)}
+            """,
+            params
+        )
+        tasks, has_more = keyset_page([Task._init_from_db(**row) for row in rows], limit)
+
+        return {
+            "items": [serializer.dict() for serializer in await TaskListSerializer.from_orm_batch(tasks)],
+            "next_cursor": encode_cursor(tasks[-1].path, tasks[-1].rank, tasks[-1].id) if has_more else None,
+            "has_more": has_more,
+        }
+
+    @classmethod
+    async def get_subtask_rollup(cls, task_id: str, access: ProjectAccessContext):
+        """Progress of a task's subtree: status counts for all descendants and for direct children."""
+        task_id = cls._normalize_ids([task_id], "task_id")[0]
+
+        status_counts = ", ".join(
+            f"count(d.id) FILTER (WHERE d.status = '{status}') AS \"{status}\""
+            for status in GeneralConstants.TASK_STATUSES
+        )
+        # The root's path is resolved inside the statement, so the whole rollup is one range scan
+        rows = await connections.get("default").execute_query_dict(
+            f"""
+            WITH root AS (
+                SELECT id, project_id, path || replace(id::text, '-', '') || '.' AS prefix
+                FROM tasks
+                WHERE id = $1 AND project_id = $2
+            )
+            SELECT count(d.id) AS total, {status_counts},
+                   count(d.id) FILTER (WHERE d.parent_id = root.id) AS children,
+                   count(d.id) FILTER (WHERE d.parent_id = root.id AND d.status = 'done') AS children_done,
+                   COALESCE(max(length(d.path)) - length(root.prefix), -{cls._PATH_SEGMENT_LENGTH})
+                       / {cls._PATH_SEGMENT_LENGTH} + 1 AS depth
+            FROM root
+            LEFT JOIN tasks AS d
+              ON d.project_id = root.project_id
+             AND d.path ~>=~ root.prefix
+             AND d.path ~<~ (left(root.prefix, -1) || '/')
+            GROUP BY root.id, root.prefix
+            """,
+            [task_id, access.project_id]
+        )
+        if not rows:
+            await cls._get_task_for_write(task_id, access.project_id)
+            raise NotFoundException(ErrorMessages.TASK_NOT_FOUND)
+
+        row = rows[0]
+        done = row[TaskStatus.DONE.value]
+        return {
+            "task_id": task_id,
+            "descendants": {
+                "total": row['total'],
+                "by_status": {status: row[status] for status in GeneralConstants.TASK_STATUSES},
+                "depth": row['depth'],
+            },
+            "children": {"total": row['children'], "done": row['children_done']},
+            "progress": round(done / row['total'], 4) if row['total'] else None,
+        }
+
     @classmethod
     async def list_tasks_by_project(
         cls, 
-        project_id: str,
+        access: ProjectAccessContext,
         page: int = 1,
         page_size: int = 20,
         status: Optional[str] = None,
         assignee_id: Optional[str] = None,
         sort_by: str = "updatedAt",
-        sort_order: str = "desc"
+        sort_order: str = "desc",
+        cursor: Optional[str] = None,
+        include_total: Optional[bool] = None,
+        due_before: Optional[datetime] = None,
+        due_after: Optional[datetime] = None
     ):
-        project_id = Validator.validate_uuid(project_id, "project_id")
+        project_id = access.project_id
         
         page = Validator.validate_positive_integer(page, "page", min_value=1)
         page_size = Validator.validate_positive_integer(page_size, "page_size", min_value=1, max_value=100)
@@ -327,13 +676,6 @@ class TaskManager:
         if assignee_id:
             assignee_id = Validator.validate_uuid(assignee_id, "assignee_id")
 
-        project = await Project.get_or_none(id=project_id).select_related('org')
-        if not project:
-            raise NotFoundException(ErrorMessages.PROJECT_NOT_FOUND)
-        
-        if project.is_archieved:
-            raise NotFoundException(ErrorMessages.PROJECT_ARCHIVED)
-
         if page < 1:
             page = 1
         if page_size < 1:
@@ -346,7 +688,7 @@ class TaskManager:
             raise BadRequestException(ErrorMessages.INVALID_STATUS)
 
         # Validate sort_by field
-        valid_sort_fields = ["updatedAt", "createdAt", "title", "status"]
+        valid_sort_fields = ["updatedAt", "createdAt", "title", "status", "rank", "due_at"]
         if sort_by not in valid_sort_fields:
             sort_by = "updatedAt"
 
@@ -365,79 +707,767 @@ class TaskManager:
             # Filter by assignee using TaskAssignee join
             query = query.filter(assignees__user_id=assignee_id)
 
-        # Get total count for pagination
-        total = await query.count()
+        # Due-date windows and due-date ordering are served by the (project, due_at) index;
+        # undated tasks have no place in either, which also keeps due_at cursors free of nulls
+        if due_before or due_after or sort_by == "due_at":
+            query = query.filter(due_at__isnull=False)
+        if due_before:
+            query = query.filter(due_at__lt=due_before)
+        if due_after:
+            query = query.filter(due_at__gte=due_after)
 
-        # Apply sorting
-        sort_field = f"-{sort_by}" if sort_order == "desc" else sort_by
-        query = query.order_by(sort_field)
+        return await cls._paginate(query, page, page_size, sort_by, sort_order, cursor, include_total)
 
-        # Apply pagination
-        skip = (page - 1) * page_size
-        tasks = await query.offset(skip).limit(page_size).all()
+    @classmethod
+    async def get_board(cls, access: ProjectAccessContext, per_column: int = 20, assignee_id: Optional[str] = None):
+        """Top tasks for every status column plus per-column counts, in two queries."""
+        project_id = access.project_id
+        per_column = Validator.validate_positive_integer(
+            per_column, "per_column", min_value=1, max_value=GeneralConstants.BOARD_COLUMN_LIMIT
+        )
 
-        # Convert to list serializers (lighter payload)
-        items = []
-        for task in tasks:
-            serializer = await TaskListSerializer.from_orm(task)
-            items.append(serializer.dict())
+        params: List[Any] = [project_id]
+        assignee_filter = ""
+        if assignee_id:
+            params.append(Validator.validate_uuid(assignee_id, "assignee_id"))
+            assignee_filter = f"""
+                AND EXISTS (
+                    SELECT 1 FROM task_assignees ta WHERE ta.task_id = t.id AND ta.user_id = ${len(params)}
+                )"""
+
+        conn = connections.get("default")
+        rows = await conn.execute_query_dict(
+            f"""
+            SELECT * FROM (
+                SELECT t.*, ROW_NUMBER() OVER (
+                    PARTITION BY t.status ORDER BY t."rank", t.id
+                ) AS column_position
+                FROM tasks t
+                WHERE t.project_id = $1 {assignee_filter}
+            ) ranked
+            WHERE column_position <= ${len(params) + 1}
+            ORDER BY status, column_position
+            """,
+            params + [per_column]
+        )
+        count_rows = await conn.execute_query_dict(
+            f"""
+            SELECT t.status, COUNT(*) AS count
+            FROM tasks t
+            WHERE t.project_id = $1 {assignee_filter}
+            GROUP BY t.status
+            """,
+            params
+        )
+
+        tasks = [Task._init_from_db(**row) for row in rows]
+        serialized = await TaskListSerializer.from_orm_batch(tasks)
+        counts = {row['status']: row['count'] for row in count_rows}
+
+        columns = {status: [] for status in GeneralConstants.TASK_STATUSES}
+        for serializer in serialized:
+            columns[serializer.status].append(serializer.dict())
+
+        return {
+            "columns": [
+                {
+                    "status": status,
+                    "count": counts.get(status, 0),
+                    "items": items,
+                    "has_more": counts.get(status, 0) > len(items),
+                }
+                for status, items in columns.items()
+            ],
+            "per_column": per_column,
+        }
+
+    @classmethod
+    async def list_task_changes(cls, access: ProjectAccessContext, since: Optional[str] = None, limit: int = 100):
+        """
+        Tasks created or modified, and tasks deleted, after the `since` watermark.
+        The watermark tracks (updatedAt, id) for tasks and (deletedAt, id) for tombstones;
+        omit it for an initial full sync and pass back next_cursor on every poll.
+        """
+        project_id = access.project_id
+        limit = Validator.validate_positive_integer(limit, "limit", min_value=1, max_value=GeneralConstants.TASK_CHANGES_LIMIT)
+
+        task_query = Task.filter(project_id=project_id)
+        tombstone_query = TaskTombstone.filter(project_id=project_id)
+
+        if since:
+            task_at, task_id, deleted_at, tombstone_id = decode_cursor(since, 4)
+            if task_at:
+                task_at = parse_cursor_datetime(task_at)
+                task_id = Validator.validate_uuid(task_id, "since")
+                task_query = task_query.filter(
+                    Q(updatedAt__gt=task_at) | Q(updatedAt=task_at, id__gt=task_id)
+                )
+            if deleted_at:
+                deleted_at = parse_cursor_datetime(deleted_at)
+                tombstone_id = Validator.validate_uuid(tombstone_id, "since")
+                tombstone_query = tombstone_query.filter(
+                    Q(deletedAt__gt=deleted_at) | Q(deletedAt=deleted_at, id__gt=tombstone_id)
+                )
+        else:
+            task_at = task_id = deleted_at = tombstone_id = ""
 
-        # Calculate total pages
-        total_pages = ceil(total / page_size) if total > 0 else 0
+        tasks, tasks_more = keyset_page(
+            await task_query.order_by("updatedAt", "id").limit(limit + 1).all(), limit
+        )
+
+        if since:
+            tombstones, tombstones_more = keyset_page(
+                await tombstone_query.order_by("deletedAt", "id").limit(limit + 1).all(), limit
+            )
+        else:
+            # A full sync already excludes deleted tasks, so tombstones start from the newest one
+            tombstones, tombstones_more = [], False
+            latest = await tombstone_query.order_by("-deletedAt", "-id").first()
+            if latest:
+                deleted_at, tombstone_id = latest.deletedAt, latest.id
+
+        if tasks:
+            task_at, task_id = tasks[-1].updatedAt, tasks[-1].id
+        if tombstones:
+            deleted_at, tombstone_id = tombstones[-1].deletedAt, tombstones[-1].id
+
+        items = [serializer.dict() for serializer in await TaskListSerializer.from_orm_batch(tasks)]
+        deleted = [
+            {"id": str(t.task_id), "deletedAt": t.deletedAt.isoformat()}
+            for t in tombstones
+        ]
 
-        # Return paginated response
         return {
             "items": items,
-            "total": total,
-            "page": page,
-            "page_size": page_size,
-            "total_pages": total_pages
+            "deleted": deleted,
+            "next_cursor": encode_cursor(task_at, task_id, deleted_at, tombstone_id),
+            "has_more": tasks_more or tombstones_more,
         }
 
     @classmethod
-    async def validate_project_access(cls, project_id: str, user_id: str, require_write: bool = False):
-        project_id = Validator.validate_uuid(project_id, "project_id")
-        user_id = Validator.validate_uuid(user_id, "user_id")
+    async def delete_task(cls, task_id: str, access: ProjectAccessContext):
+        task_id = Validator.validate_uuid(task_id, "task_id")
 
-        project = await Project.get_or_none(id=project_id).select_related('org')
-        if not project:
-            raise NotFoundException(ErrorMessages.PROJECT_NOT_FOUND)
-        
-        if project.is_archieved:
-            raise NotFoundException(ErrorMessages.PROJECT_ARCHIVED)
+        async with in_transaction():
+            await cls._lock_task_tree(access.project_id)
+            task = await cls._get_task_for_write(task_id, access.project_id)
+
+            # Subtasks move up one level instead of disappearing with their parent
+            await cls._rewrite_subtree_paths(access.project_id, cls._subtree_prefix(task), task.path)
+            children = await connections.get("default").execute_query_dict(
+                """
+                UPDATE tasks SET parent_id = $2, version = version + 1, "updatedAt" = CURRENT_TIMESTAMP
+                WHERE parent_id = $1
+                RETURNING id, version
+                """,
+                [task.id, task.parent_id]
+            )
 
-        membership = await Membership.get_or_none(
-            userId=user_id,
-            organizationId=project.org.id,
-            status="active"
+            # Leave a tombstone so delta-syncing clients learn about the deletion
+            await TaskTombstone.create(task_id=task.id, project_id=task.project_id)
+            await task.delete()
+            await TaskCounterManager.record_transitions(access.project_id, [(task.status, None)])
+
+        # No row will ever carry version + 1, so stale reads can't repopulate the cache
+        versions = {str(row['id']): row['version'] for row in children}
+        versions[str(task.id)] = task.version + 1
+        await cls._invalidate_task_cache(versions)
+        await EntityNameManager.invalidate(EntityNameManager.TASK, task.id)
+        await DashboardManager.invalidate_organization(access.org_id)
+
+    # Column order for exports; CSV uses it as the header row
+    _EXPORT_COLUMNS = [
+        "id", "project_id", "project_name", "parent_id", "title", "description", "status", "rank", "version",
+        "due_at", "assignee_ids", "assignee_names", "created_by_id", "createdAt", "updatedAt",
+    ]
+
+    @classmethod
+    def export_project_tasks(cls, access: ProjectAccessContext, export_format: str) -> AsyncIterator[str]:
+        cls._validate_export_format(export_format)
+        return cls._stream_export([access.project_id], export_format)
+
+    @classmethod
+    async def export_organization_tasks(cls, org_id: str, export_format: str) -> AsyncIterator[str]:
+        org_id = Validator.validate_uuid(org_id, "org_id")
+        cls._validate_export_format(export_format)
+
+        project_ids = await Project.filter(org_id=org_id, is_archieved=False).values_list('id', flat=True)
+        return cls._stream_export([str(project_id) for project_id in project_ids], export_format)
+
+    @classmethod
+    def _validate_export_format(cls, export_format: str):
+        if export_format not in GeneralConstants.EXPORT_FORMATS:
+            raise BadRequestException(ErrorMessages.INVALID_EXPORT_FORMAT)
+
+    @classmethod
+    async def _stream_export(cls, project_ids: List[str], export_format: str) -> AsyncIterator[str]:
+        """
+        Yield the tasks of the given projects batch by batch, keyed on id.
+        Each batch is its own short query, so memory stays flat and no transaction spans the export.
+        """
+        if export_format == "csv":
+            yield cls._format_csv_rows([cls._EXPORT_COLUMNS])
+
+        last_id = None
+        while project_ids:
+            try:
+                rows = await cls._fetch_export_batch(project_ids, last_id, GeneralConstants.EXPORT_BATCH_SIZE)
+            except Exception as e:
+                # Headers are already sent, so the best we can do is end the stream early
+                logger.error(f"Task export failed after task {last_id}: {e}", exc_info=True)
+                return
+
+            if not rows:
+                return
+
+            if export_format == "csv":
+                yield cls._format_csv_rows([
+                    [cls._export_value(row[column], ";") for column in cls._EXPORT_COLUMNS]
+                    for row in rows
+                ])
+            else:
+                yield "".join(
+                    json.dumps({column: cls._export_value(row[column]) for column in cls._EXPORT_COLUMNS}) + "\n"
+                    for row in rows
+                )
+
+            if len(rows) < GeneralConstants.EXPORT_BATCH_SIZE:
+                return
+            last_id = rows[-1]["id"]
+
+    @classmethod
+    async def _fetch_export_batch(cls, project_ids: List[str], after_id: Optional[uuid.UUID], limit: int) -> List[dict]:
+        params: List[Any] = [project_ids]
+        after_filter = ""
+        if after_id is not None:
+            params.append(after_id)
+            after_filter = f"AND t.id > ${len(params)}"
+        params.append(limit)
+
+        # Page the tasks first, then join assignees onto just that page
+        return await connections.get("default").execute_query_dict(
+            f"""
+            SELECT t.id, t.project_id, p.name AS project_name, t.parent_id, t.title, t.description, t.status, t."rank",
+                   t.version, t.due_at, t.created_by_id, t."createdAt", t."updatedAt",
+                   COALESCE(array_agg(ta.user_id ORDER BY ta.user_id) FILTER (WHERE ta.user_id IS NOT NULL), '{{}}')
+                       AS assignee_ids,
+                   COALESCE(array_agg(TRIM(u."firstName" || ' ' || u."lastName") ORDER BY ta.user_id)
+                       FILTER (WHERE ta.user_id IS NOT NULL), '{{}}') AS assignee_names
+            FROM (
+                SELECT * FROM tasks AS t
+                WHERE t.project_id = ANY($1::uuid[]) {after_filter}
+                ORDER BY t.id
+                LIMIT ${len(params)}
+            ) AS t
+            JOIN projects AS p ON p.id = t.project_id
+            LEFT JOIN task_assignees AS ta ON ta.task_id = t.id
+            LEFT JOIN users AS u ON u.id = ta.user_id
+            GROUP BY t.id, t.project_id, p.name, t.parent_id, t.title, t.description, t.status, t."rank",
+                     t.version, t.due_at, t.created_by_id, t."createdAt", t."updatedAt"
+            ORDER BY t.id
+            """,
+            params
         )
-        if not membership:
-            raise ForbiddenException(ErrorMessages.NO_PROJECT_ACCESS)
 
+    @classmethod
+    def _export_value(cls, value: Any, list_separator: Optional[str] = None) -> Any:
+        if isinstance(value, datetime):
+            return value.isoformat()
+        if isinstance(value, uuid.UUID):
+            return str(value)
+        if isinstance(value, list):
+            values = [str(item) for item in value]
+            return list_separator.join(values) if list_separator else values
+        return value
+
+    @classmethod
+    def _format_csv_rows(cls, rows: List[List[Any]]) -> str:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        return buffer.getvalue()
+
+    # Task import. Columns written by COPY, in record order
+    # updatedAt is left to its default and stamped at commit, and subtasks are linked at commit
+    # too, see _copy_import_file
+    _IMPORT_TASK_COLUMNS = [
+        "id", "title", "description", "status", "version", "rank", "due_at",
+        "project_id", "created_by_id", "createdAt",
+    ]
+    _IMPORT_ASSIGNEE_COLUMNS = ["id", "task_id", "user_id", "assigned_at"]
+
+    # Progress records kept in-process when Redis is unavailable (most recent last)
+    _import_jobs: "OrderedDict[str, dict]" = OrderedDict()
+    _IMPORT_JOBS_KEPT = 100
 
-        if require_write and membership.role not in ["member", "admin", "owner"]:
-            raise ForbiddenException(ErrorMessages.INSUFFICIENT_PERMISSIONS)
+    @classmethod
+    async def start_import(
+        cls, upload: UploadFile, import_format: Optional[str], access: ProjectAccessContext
+    ) -> Tuple[dict, str]:
+        """
+        Take ownership of the uploaded file and register a queued import.
+        Returns the job record and the spooled file path for run_import.
+        """
+        import_format = cls._resolve_import_format(import_format, upload.filename)
+
+        # The request's upload is closed once the response is sent, so copy it out first
+        fd, path = tempfile.mkstemp(prefix="task-import-", suffix=f".{import_format}")
+        with os.fdopen(fd, "wb") as target:
+            await run_in_threadpool(shutil.copyfileobj, upload.file, target)
+
+        job = {
+            "import_id": str(uuid.uuid4()),
+            "project_id": access.project_id,
+            "format": import_format,
+            "status": "queued",
+            "rows_validated": 0,
+            "rows_imported": 0,
+            "errors": [],
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        }
+        await cls._save_import_job(job)
+        return job, path
 
-        return project, membership
-    
-    
     @classmethod
-    async def delete_task(cls, task_id: str, project_id: Optional[str] = None):
-        task_id = Validator.validate_uuid(task_id, "task_id")
-        if project_id:
-            project_id = Validator.validate_uuid(project_id, "project_id")
+    async def get_import(cls, import_id: str, access: ProjectAccessContext) -> dict:
+        import_id = Validator.validate_uuid(import_id, "import_id")
+        job = await redis_client.get(CacheKeys.task_import(import_id)) or cls._import_jobs.get(import_id)
+        if job is None or job["project_id"] != access.project_id:
+            raise NotFoundException(ErrorMessages.IMPORT_NOT_FOUND)
+        return job
 
-        task = await Task.get_or_none(id=task_id).select_related('project')
-        if not task:
-            raise NotFoundException(ErrorMessages.TASK_NOT_FOUND)
+    @classmethod
+    async def run_import(cls, job: dict, path: str, access: ProjectAccessContext):
+        """
+        Validate the whole file, then load it in one transaction with COPY.
 
-        if project_id and str(task.project_id) != project_id:
-            raise NotFoundException(ErrorMessages.TASK_NOT_IN_PROJECT)
+        Nothing is written unless every row is valid, so a failed import can simply be
+        fixed and re-uploaded. Runs as a background task; failures land in the job record.
+        """
+        try:
+            job["status"] = "validating"
+            await cls._save_import_job(job)
+
+            hierarchy = await cls._validate_import_file(job, path)
+            if hierarchy is None:
+                job["status"] = "failed"
+                return
+
+            job["status"] = "importing"
+            await cls._save_import_job(job)
+
+            counts = await cls._copy_import_file(job, path, access, hierarchy)
+
+            job["status"] = "completed"
+            await DashboardManager.invalidate_organization(access.org_id)
+            await DashboardManager.invalidate_users(*counts["assignee_ids"])
+            await ActivityManager.log_activities([{
+                'org_id': access.org_id,
+                'project_id': access.project_id,
+                'user_id': access.user_id,
+                'entity_type': EntityType.PROJECT.value,
+                'entity_id': access.project_id,
+                'action': ActionType.TASKS_IMPORTED.value,
+                'metadata': {
+                    'import_id': job["import_id"],
+                    'format': job["format"],
+                    'tasks': job["rows_imported"],
+                    'assignments': counts["assignments"],
+                    'by_status': counts["by_status"]
+                }
+            }])
+        except Exception as e:
+            logger.error(f"Task import {job['import_id']} failed: {e}", exc_info=True)
+            job["status"] = "failed"
+            job["errors"].append({"row": None, "message": "Import failed while writing tasks."})
+        finally:
+            job["finished_at"] = datetime.now(timezone.utc).isoformat()
+            await cls._save_import_job(job)
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    @classmethod
+    def _resolve_import_format(cls, import_format: Optional[str], filename: Optional[str]) -> str:
+        if not import_format and filename:
+            extension = os.path.splitext(filename)[1].lower().lstrip(".")
+            import_format = "ndjson" if extension in ("jsonl", "json") else extension
+        if import_format not in GeneralConstants.EXPORT_FORMATS:
+            raise BadRequestException(ErrorMessages.INVALID_IMPORT_FORMAT)
+        return import_format
+
+    @classmethod
+    def _iter_import_chunks(cls, path: str, import_format: str):
+        """Yield lists of (row_number, raw_row) from the file, IMPORT_CHUNK_SIZE rows at a time."""
+        chunk = []
+        # utf-8-sig drops the BOM spreadsheet tools like to prepend
+        with open(path, newline="", encoding="utf-8-sig") as source:
+            if import_format == "csv":
+                rows = enumerate(csv.DictReader(source), start=2)
+            else:
+                rows = ((number, line) for number, line in enumerate(source, start=1) if line.strip())
+
+            for number, raw in rows:
+                chunk.append((number, raw))
+                if len(chunk) >= GeneralConstants.IMPORT_CHUNK_SIZE:
+                    yield chunk
+                    chunk = []
+        if chunk:
+            yield chunk
+
+    @classmethod
+    def _parse_import_row(cls, raw: Any, import_format: str) -> Tuple[CREATE_TASK_SCHEMA, List[str], Optional[str]]:
+        """
+        Turn one CSV/NDJSON row into a validated task, its assignee ids and its id in the file.
+        The id only serves as a parent_id for other rows; columns an export adds are ignored.
+        """
+        if import_format == "ndjson":
+            try:
+                raw = json.loads(raw)
+            except ValueError:
+                raise BadRequestException("Row is not valid JSON")
+            if not isinstance(raw, dict):
+                raise BadRequestException("Row must be a JSON object")
 
-        if task.project.is_archieved:
-            raise NotFoundException(ErrorMessages.PROJECT_ARCHIVED)
+        assignee_ids = raw.get("assignee_ids") or []
+        if isinstance(assignee_ids, str):
+            assignee_ids = [value.strip() for value in assignee_ids.split(";") if value.strip()]
 
-        await task.delete()
+        try:
+            item = CREATE_TASK_SCHEMA(
+                title=raw.get("title"),
+                description=raw.get("description") or None,
+                status=raw.get("status") or TaskStatus.TODO.value,
+                assignee_ids=assignee_ids,
+                parent_id=raw.get("parent_id") or None,
+                due_at=raw.get("due_at") or None
+            )
+        except ValidationError as e:
+            error = e.errors()[0]
+            raise BadRequestException(f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}")
+
+        if item.status not in GeneralConstants.TASK_STATUSES:
+            raise BadRequestException(ErrorMessages.INVALID_STATUS)
+        Validator.validate_non_empty_string(item.title, "title", max_length=255)
+        row_id = raw.get("id")
+        return item, cls._normalize_ids(item.assignee_ids, "assignee_id"), str(row_id) if row_id else None
+
+    @classmethod
+    async def _validate_import_file(cls, job: dict, path: str) -> Optional[Dict[str, Any]]:
+        """
+        Check every row; returns None if any is invalid, otherwise what _copy_import_file needs to
+        link subtasks: the ids rows use in the file and whether any parent is an existing task.
+        """
+        errors = job["errors"]
+        rows = 0
+        row_ids: Dict[str, int] = {}
+        parent_refs: List[Tuple[int, Optional[str], str]] = []
+
+        def add_error(number: Optional[int], message: str):
+            if len(errors) < GeneralConstants.IMPORT_MAX_ERRORS:
+                errors.append({"row": number, "message": message})
+
+        for chunk in cls._iter_import_chunks(path, job["format"]):
+            rows += len(chunk)
+            if rows > GeneralConstants.IMPORT_MAX_ROWS:
+                add_error(None, f"Imports are limited to {GeneralConstants.IMPORT_MAX_ROWS} rows")
+                return False
+
+            referenced: Dict[str, List[int]] = {}
+            for number, raw in chunk:
+                try:
+                    item, assignee_ids, row_id = cls._parse_import_row(raw, job["format"])
+                except BadRequestException as e:
+                    add_error(number, e.detail)
+                    continue
+                if row_id is not None:
+                    if row_id in row_ids:
+                        add_error(number, f"Row {row_ids[row_id]} already uses id {row_id}")
+                        continue
+                    row_ids[row_id] = number
+                if item.parent_id:
+                    parent_refs.append((number, row_id, item.parent_id))
+                for assignee_id in assignee_ids:
+                    referenced.setdefault(assignee_id, []).append(number)
+
+            # One existence check per chunk instead of one per row
+            if referenced:
+                found = {str(user_id) for user_id in await User.filter(
+                    id__in=list(referenced)
+                ).values_list('id', flat=True)}
+                for assignee_id in referenced.keys() - found:
+                    for number in referenced[assignee_id]:
+                        add_error(number, ErrorMessages.ASSIGNEE_NOT_FOUND)
+
+            job["rows_validated"] = rows
+            await cls._save_import_job(job)
+
+            if len(errors) >= GeneralConstants.IMPORT_MAX_ERRORS:
+                break
+
+        if not rows:
+            add_error(None, "The file contains no tasks")
+        if not errors:
+            for number, message in await cls._validate_import_hierarchy(job["project_id"], row_ids, parent_refs):
+                add_error(number, message)
+        errors.sort(key=lambda error: error["row"] or 0)
+        if errors:
+            return None
+        return {
+            "row_ids": set(row_ids),
+            "existing_parents": any(parent_ref not in row_ids for _, _, parent_ref in parent_refs),
+        }
+
+    @classmethod
+    async def _validate_import_hierarchy(
+        cls, project_id: str, row_ids: Dict[str, int], parent_refs: List[Tuple[int, Optional[str], str]]
+    ) -> List[Tuple[int, str]]:
+        """
+        Check the parent_id of every row: it names another row of the file or a task of the project,
+        and following parents never loops or nests deeper than TASK_MAX_DEPTH. Returns the errors.
+        """
+        errors = []
+
+        # Parents outside the file must be tasks of this project; keep the depth their children get
+        external = {}
+        for number, _, parent_ref in parent_refs:
+            if parent_ref not in row_ids:
+                try:
+                    external[parent_ref] = cls._normalize_ids([parent_ref], "parent_id")[0]
+                except BadRequestException as e:
+                    errors.append((number, e.detail))
+        paths = {
+            str(row['id']): row['path']
+            for row in await Task.filter(id__in=list(set(external.values())), project_id=project_id).values('id', 'path')
+        } if external else {}
+        child_depths = {
+            parent_ref: len(paths[parent_id]) // cls._PATH_SEGMENT_LENGTH + 1
+            for parent_ref, parent_id in external.items() if parent_id in paths
+        }
+        errors += [
+            (number, ErrorMessages.PARENT_TASK_NOT_FOUND)
+            for number, _, parent_ref in parent_refs
+            if parent_ref in external and parent_ref not in child_depths
+        ]
+        if errors:
+            return errors
+
+        # Number of ancestors per row id; None for rows on or under a cycle
+        parent_of = {row_id: parent_ref for _, row_id, parent_ref in parent_refs if row_id}
+        depths: Dict[str, Optional[int]] = {}
+
+        def depth_of(row_id: str) -> Optional[int]:
+            # Walk up to a known depth or the top of the file's part of the tree, then fill in the way back
+            chain, on_chain = [], set()
+            current = row_id
+            while current not in depths:
+                if current in on_chain:
+                    depths.update(dict.fromkeys(chain))
+                    return depths[row_id]
+                chain.append(current)
+                on_chain.add(current)
+                parent_ref = parent_of.get(current)
+                if parent_ref in row_ids:
+                    current = parent_ref
+                else:
+                    depths[current] = child_depths[parent_ref] if parent_ref else 0
+            for child in reversed(chain):
+                if child not in depths:
+                    parent_depth = depths[parent_of[child]]
+                    depths[child] = None if parent_depth is None else parent_depth + 1
+            return depths[row_id]
+
+        for number, row_id, parent_ref in parent_refs:
+            if row_id:
+                depth = depth_of(row_id)
+            elif parent_ref in row_ids:
+                parent_depth = depth_of(parent_ref)
+                depth = None if parent_depth is None else parent_depth + 1
+            else:
+                depth = child_depths[parent_ref]
+
+            if depth is None:
+                errors.append((number, ErrorMessages.SUBTASK_CYCLE))
+            elif depth > GeneralConstants.TASK_MAX_DEPTH:
+                errors.append((number, ErrorMessages.SUBTASK_TOO_DEEP))
+        return errors
+
+    @classmethod
+    async def _copy_import_file(
+        cls, job: dict, path: str, access: ProjectAccessContext, hierarchy: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        project_id = uuid.UUID(access.project_id)
+        user_id = uuid.UUID(access.user_id)
+        now = datetime.now(timezone.utc)
+
+        # Rows get new ids; a row's id in the file maps to the same new id wherever it is a parent_id
+        namespace = uuid.UUID(job["import_id"])
+        row_ids = hierarchy["row_ids"]
+
+        def new_id(row_id: str) -> uuid.UUID:
+            return uuid.uuid5(namespace, row_id)
+
+        by_status = {status: 0 for status in GeneralConstants.TASK_STATUSES}
+        assignments = 0
+
+        # Ranks continue each column from where it ends now; columns aren't locked while loading,
+        # so tasks added meanwhile are checked for, and the import moved after them, at commit
+        initial_last_ranks = {
+            status: await cls._last_rank(access.project_id, status) for status in GeneralConstants.TASK_STATUSES
+        }
+        last_ranks = dict(initial_last_ranks)
+        imported_ids: Dict[str, List[uuid.UUID]] = {status: [] for status in GeneralConstants.TASK_STATUSES}
+        # (task id, parent id) pairs; a parent may come later in the file, so links wait for the commit step
+        links: List[Tuple[uuid.UUID, uuid.UUID]] = []
+        due_dates: Dict[str, datetime] = {}
+        assigned_users: set = set()
+
+        async with in_transaction() as conn:
+            if hierarchy["existing_parents"]:
+                # Existing parents must keep their place until the children's paths are filled in
+                await cls._lock_task_tree(access.project_id, shared=True)
+
+            async with conn.acquire_connection() as raw_conn:
+                for chunk in cls._iter_import_chunks(path, job["format"]):
+                    task_records, assignee_records = [], []
+                    for _, raw in chunk:
+                        item, assignee_ids, row_id = cls._parse_import_row(raw, job["format"])
+                        task_id = new_id(row_id) if row_id else uuid.uuid4()
+                        if item.parent_id in row_ids:
+                            links.append((task_id, new_id(item.parent_id)))
+                        elif item.parent_id:
+                            links.append((task_id, uuid.UUID(item.parent_id)))
+                        last_ranks[item.status] = rank_between(last_ranks[item.status], None)
+                        by_status[item.status] += 1
+                        imported_ids[item.status].append(task_id)
+                        task_records.append((
+                            task_id, item.title, item.description, item.status, 1, last_ranks[item.status],
+                            item.due_at, project_id, user_id, now
+                        ))
+                        if item.due_at:
+                            due_dates[str(task_id)] = item.due_at
+                        assignee_records.extend(
+                            (uuid.uuid4(), task_id, uuid.UUID(assignee_id), now) for assignee_id in assignee_ids
+                        )
+                        assigned_users.update(assignee_ids)
+
+                    await raw_conn.copy_records_to_table(
+                        Task._meta.db_table, records=task_records, columns=cls._IMPORT_TASK_COLUMNS
+                    )
+                    if assignee_records:
+                        await raw_conn.copy_records_to_table(
+                            TaskAssignee._meta.db_table, records=assignee_records,
+                            columns=cls._IMPORT_ASSIGNEE_COLUMNS
+                        )
+
+                    assignments += len(assignee_records)
+                    job["rows_imported"] += len(task_records)
+                    await cls._save_import_job(job)
+
+            if links:
+                await cls._link_imported_subtasks(conn, links)
+            # Not from inside the COPY block: it holds the transaction's connection for itself
+            await ReminderManager.schedule_task_reminders(due_dates)
+
+            # Commit step: columns are locked, in a fixed order, only from here to the commit
+            for status in sorted(GeneralConstants.TASK_STATUSES):
+                if not imported_ids[status]:
+                    continue
+                await cls._lock_rank_column(access.project_id, status)
+                await cls._append_imported_ranks(
+                    conn, access.project_id, status, initial_last_ranks[status], imported_ids[status]
+                )
+
+            # Stamped as late as possible, so delta-sync clients whose watermark moved past the start
+            # of a long import still receive its tasks
+            await conn.execute_query(
+                """
+                UPDATE tasks SET "updatedAt" = stamp.at
+                FROM (SELECT clock_timestamp() AS at) AS stamp
+                WHERE id = ANY($1::uuid[])
+                """,
+                [[task_id for ids in imported_ids.values() for task_id in ids]]
+            )
+            await TaskCounterManager.adjust(access.project_id, by_status)
+
+        return {
+            "assignments": assignments,
+            "assignee_ids": sorted(assigned_users),
+            "by_status": {k: v for k, v in by_status.items() if v}
+        }
+
+    @classmethod
+    async def _link_imported_subtasks(cls, conn, links: List[Tuple[uuid.UUID, uuid.UUID]]):
+        """Point imported subtasks at their parents and fill in their materialized paths, top down."""
+        task_ids, parent_ids = [list(column) for column in zip(*links)]
+        await conn.execute_query(
+            """
+            UPDATE tasks AS t SET parent_id = v.parent_id
+            FROM unnest($1::uuid[], $2::uuid[]) AS v(id, parent_id)
+            WHERE t.id = v.id
+            """,
+            [task_ids, parent_ids]
+        )
+        # Start from subtasks whose parent is not itself being linked, then walk down the imported rows
+        await conn.execute_query(
+            """
+            WITH RECURSIVE tree AS (
+                SELECT t.id, p.path || replace(p.id::text, '-', '') || '.' AS path
+                FROM tasks AS t
+                JOIN tasks AS p ON p.id = t.parent_id
+                WHERE t.id = ANY($1::uuid[]) AND p.id <> ALL($1::uuid[])
+                UNION ALL
+                SELECT c.id, tree.path || replace(tree.id::text, '-', '') || '.'
+                FROM tree
+                JOIN tasks AS c ON c.parent_id = tree.id
+                WHERE c.id = ANY($1::uuid[])
+            )
+            UPDATE tasks AS t SET path = tree.path
+            FROM tree
+            WHERE t.id = tree.id
+            """,
+            [task_ids]
+        )
+
+    @classmethod
+    async def _append_imported_ranks(
+        cls, conn, project_id: str, status: str, initial_last_rank: Optional[str], task_ids: List[uuid.UUID]
+    ):
+        """Move imported tasks below any task appended to their column while the import was loading."""
+        rows = await conn.execute_query_dict(
+            """
+            SELECT max("rank") AS last FROM tasks
+            WHERE project_id = $1 AND status = $2 AND ($3::varchar IS NULL OR "rank" > $3) AND id <> ALL($4::uuid[])
+            """,
+            [project_id, status, initial_last_rank, task_ids]
+        )
+        rank = rows[0]['last']
+        if rank is None:
+            return
+
+        ranks = []
+        for _ in task_ids:
+            rank = rank_between(rank, None)
+            ranks.append(rank)
+        await conn.execute_query(
+            """
+            UPDATE tasks AS t SET "rank" = v.rank
+            FROM unnest($1::uuid[], $2::varchar[]) AS v(id, rank)
+            WHERE t.id = v.id
+            """,
+            [task_ids, ranks]
+        )
+
+    @classmethod
+    async def _save_import_job(cls, job: dict):
+        cls._import_jobs[job["import_id"]] = job
+        cls._import_jobs.move_to_end(job["import_id"])
+        while len(cls._import_jobs) > cls._IMPORT_JOBS_KEPT:
+            cls._import_jobs.popitem(last=False)
+
+        await redis_client.set(
+            CacheKeys.task_import(job["import_id"]), job, expire=GeneralConstants.IMPORT_JOB_TTL
+        )
 
     @classmethod
     async def list_my_tasks(
@@ -447,7 +1477,9 @@ class TaskManager:
         page_size: int = 20,
         status: Optional[str] = None,
         sort_by: str = "updatedAt",
-        sort_order: str = "desc"
+        sort_order: str = "desc",
+        cursor: Optional[str] = None,
+        include_total: Optional[bool] = None
     ):
         user_id = Validator.validate_uuid(user_id, "user_id")
         page = Validator.validate_positive_integer(page, "page", min_value=1)
@@ -458,7 +1490,7 @@ class TaskManager:
             raise BadRequestException(ErrorMessages.INVALID_STATUS)
 
         # Validate sort_by field
-        valid_sort_fields = ["updatedAt", "createdAt", "title", "status"]
+        valid_sort_fields = ["updatedAt", "createdAt", "title", "status", "rank"]
         if sort_by not in valid_sort_fields:
             sort_by = "updatedAt"
 
@@ -476,31 +1508,639 @@ class TaskManager:
         if status:
             query = query.filter(status=status)
 
-        # Get total count for pagination
-        total = await query.count()
-
-        # Apply sorting
-        sort_field = f"-{sort_by}" if sort_order == "desc" else sort_by
-        query = query.order_by(sort_field)
+        return await cls._paginate(query, page, page_size, sort_by, sort_order, cursor, include_total)
 
-        # Apply pagination
-        skip = (page - 1) * page_size
-        tasks = await query.offset(skip).limit(page_size).all()
+    @classmethod
+    async def _paginate(
+        cls,
+        query,
+        page: int,
+        page_size: int,
+        sort_by: str,
+        sort_order: str,
+        cursor: Optional[str],
+        include_total: Optional[bool]
+    ):
+        # Sorting always ends with id so equal sort values have a stable order
+        direction = "-" if sort_order == "desc" else ""
+        ordered = query.order_by(f"{direction}{sort_by}", f"{direction}id")
+
+        if cursor is None:
+            # Offset mode: counting is on by default for backward compatibility
+            total = await query.count() if include_total is not False else None
+
+            skip = (page - 1) * page_size
+            tasks = await ordered.offset(skip).limit(page_size).all()
+
+            # Convert to list serializers (lighter payload), hydrating assignees for the whole page at once
+            items = [serializer.dict() for serializer in await TaskListSerializer.from_orm_batch(tasks)]
+
+            response = {
+                "items": items,
+                "page": page,
+                "page_size": page_size,
+            }
+            if total is not None:
+                response["total"] = total
+                response["total_pages"] = ceil(total / page_size) if total > 0 else 0
+            return response
+
+        # Cursor mode: an empty cursor starts from the first page, counting is opt-in
+        total = await query.count() if include_total else None
+
+        if cursor:
+            cursor_sort_by, cursor_sort_order, value, last_id = decode_cursor(cursor, 4)
+            if cursor_sort_by != sort_by or cursor_sort_order != sort_order:
+                raise BadRequestException(ErrorMessages.CURSOR_SORT_MISMATCH)
+            last_id = Validator.validate_uuid(last_id, "cursor")
+            if sort_by in ("updatedAt", "createdAt", "due_at"):
+                value = parse_cursor_datetime(value)
+
+            op = "lt" if sort_order == "desc" else "gt"
+            ordered = ordered.filter(
+                Q(**{f"{sort_by}__{op}": value})
+                | Q(**{sort_by: value, f"id__{op}": last_id})
+            )
 
-        # Convert to list serializers
-        items = []
-        for task in tasks:
-            serializer = await TaskListSerializer.from_orm(task)
-            items.append(serializer.dict())
+        tasks, has_more = keyset_page(await ordered.limit(page_size + 1).all(), page_size)
+        items = [serializer.dict() for serializer in await TaskListSerializer.from_orm_batch(tasks)]
 
-        # Calculate total pages
-        total_pages = ceil(total / page_size) if total > 0 else 0
+        next_cursor = None
+        if has_more:
+            last = tasks[-1]
+            next_cursor = encode_cursor(sort_by, sort_order, getattr(last, sort_by), last.id)
 
-        # Return paginated response
-        return {
+        response = {
             "items": items,
-            "total": total,
-            "page": page,
             "page_size": page_size,
-            "total_pages": total_pages
-        }
\ No newline at end of file
+            "next_cursor": next_cursor,
+            "has_more": has_more,
+        }
+        if total is not None:
+            response["total"] = total
+        return response
+
+    @classmethod
+    async def bulk_create_tasks(cls, payload: dict, access: ProjectAccessContext):
+        project_id = access.project_id
+        user_id = access.user_id
+
+        validated_data = BULK_CREATE_TASK_SCHEMA(**payload)
+
+        assignees_by_item = []
+        parent_by_item = []
+        for item in validated_data.tasks:
+            if item.status not in GeneralConstants.TASK_STATUSES:
+                raise BadRequestException(ErrorMessages.INVALID_STATUS)
+            Validator.validate_non_empty_string(item.title, "title", max_length=255)
+            assignees_by_item.append(cls._normalize_ids(item.assignee_ids, "assignee_id"))
+            parent_by_item.append(cls._normalize_ids([item.parent_id], "parent_id")[0] if item.parent_id else None)
+
+        project = access.project
+        await cls._ensure_assignees_exist({a for ids in assignees_by_item for a in ids})
+
+        tasks = [
+            Task(
+                title=item.title,
+                description=item.description,
+                status=item.status,
+                due_at=item.due_at,
+                project_id=project_id,
+                created_by_id=user_id
+            )
+            for item in validated_data.tasks
+        ]
+
+        async with in_transaction():
+            parent_ids = {parent_id for parent_id in parent_by_item if parent_id}
+            if parent_ids:
+                await cls._lock_task_tree(project_id, shared=True)
+                paths = await cls._resolve_parent_paths(parent_ids, project_id)
+                for task, parent_id in zip(tasks, parent_by_item):
+                    if parent_id:
+                        task.parent_id = parent_id
+                        task.path = paths[parent_id]
+
+            # Append each column's new tasks below its current last task, in request order
+            for status in sorted({task.status for task in tasks}):
+                await cls._lock_rank_column(project_id, status)
+                rank = await cls._last_rank(project_id, status)
+                for task in tasks:
+                    if task.status == status:
+                        rank = rank_between(rank, None)
+                        task.rank = rank
+            await Task.bulk_create(tasks)
+            await TaskAssignee.bulk_create([
+                TaskAssignee(task_id=task.id, user_id=assignee_id)
+                for task, assignee_ids in zip(tasks, assignees_by_item)
+                for assignee_id in assignee_ids
+            ])
+            await ReminderManager.schedule_task_reminders({str(task.id): task.due_at for task in tasks if task.due_at})
+            await TaskRevisionManager.record_revisions([(None, task) for task in tasks], user_id)
+            await TaskCounterManager.record_transitions(project_id, [(None, task.status) for task in tasks])
+
+        await DashboardManager.invalidate_organization(access.org_id)
+        await DashboardManager.invalidate_users(*[
+            assignee_id for assignee_ids in assignees_by_item for assignee_id in assignee_ids
+        ])
+        await ActivityManager.log_activities([
+            {
+                'org_id': str(project.org_id),
+                'project_id': access.project_id,
+                'user_id': user_id,
+                'entity_type': EntityType.TASK.value,
+                'entity_id': str(task.id),
+                'action': ActionType.TASK_CREATED.value,
+                'metadata': {
+                    'title': item.title,
+                    'description': item.description,
+                    'status': item.status,
+                    'assignee_ids': item.assignee_ids
+                }
+            }
+            for task, item in zip(tasks, validated_data.tasks)
+        ])
+
+        return {"items": [serializer.dict() for serializer in await TaskSerializer.from_orm_batch(tasks)]}
+
+    @classmethod
+    async def bulk_update_tasks(cls, payload: dict, access: ProjectAccessContext):
+        project_id = access.project_id
+        user_id = access.user_id
+
+        validated_data = BULK_UPDATE_TASK_SCHEMA(**payload)
+        items = cls._index_bulk_items(validated_data.tasks)
+
+        changes_by_task = {}
+        desired_assignees = {}
+        for task_id, item in items.items():
+            if item.status and item.status not in GeneralConstants.TASK_STATUSES:
+                raise BadRequestException(ErrorMessages.INVALID_STATUS)
+            if item.title is not None:
+                Validator.validate_non_empty_string(item.title, "title", max_length=255)
+
+            changes_by_task[task_id] = item.dict(exclude_unset=True, exclude={'id', 'version', 'assignee_ids'})
+            if 'assignee_ids' in item.dict(exclude_unset=True):
+                desired_assignees[task_id] = cls._normalize_ids(item.assignee_ids or [], "assignee_id")
+
+        project = access.project
+        await cls._ensure_assignees_exist({a for ids in desired_assignees.values() for a in ids})
+
+        async with in_transaction() as conn:
+            await cls._lock_rank_columns(project_id, {changes.get('status') for changes in changes_by_task.values()})
+            current = await cls._lock_tasks(project_id, items)
+            await cls._append_status_changes(project_id, current, changes_by_task)
+            tasks = await cls._bulk_update_rows(conn, project_id, [
+                (task_id, item.version, changes_by_task[task_id]) for task_id, item in items.items()
+            ])
+            added, _ = await cls._sync_assignees(desired_assignees)
+            await ReminderManager.schedule_task_reminders({
+                str(task.id): task.due_at for task in tasks if 'due_at' in changes_by_task[str(task.id)]
+            })
+            await TaskRevisionManager.record_revisions(
+                [(TaskRevisionManager.state_of(current[str(task.id)]), task) for task in tasks], user_id
+            )
+            await TaskCounterManager.record_transitions(
+                project_id, [(current[str(task.id)].status, task.status) for task in tasks]
+            )
+
+        await cls._invalidate_task_cache({str(task.id): task.version for task in tasks})
+        await EntityNameManager.invalidate(EntityNameManager.TASK, *[
+            task_id for task_id, changes in changes_by_task.items()
+            if 'title' in changes and changes['title'] != current[task_id].title
+        ])
+        if desired_assignees or any('status' in changes for changes in changes_by_task.values()):
+            await DashboardManager.invalidate_organization(access.org_id)
+        await DashboardManager.invalidate_users(*[assignee_id for _, assignee_id in added])
+
+        org_id = str(project.org_id)
+        activities = []
+        for task_id, changes in changes_by_task.items():
+            old = current[task_id]
+            if 'title' in changes and changes['title'] != old.title:
+                activities.append({
+                    'org_id': org_id,
+                    'project_id': access.project_id,
+                    'user_id': user_id,
+                    'entity_type': EntityType.TASK.value,
+                    'entity_id': task_id,
+                    'action': ActionType.TASK_TITLE_UPDATED.value,
+                    'metadata': {
+                        'old_title': old.title,
+                        'new_title': changes['title']
+                    }
+                })
+            if 'description' in changes and changes['description'] != old.description:
+                activities.append({
+                    'org_id': org_id,
+                    'project_id': access.project_id,
+                    'user_id': user_id,
+                    'entity_type': EntityType.TASK.value,
+                    'entity_id': task_id,
+                    'action': ActionType.TASK_DESCRIPTION_UPDATED.value,
+                    'metadata': {
+                        'version': old.version + 1,
+                        'old_length': len(old.description or ''),
+                        'new_length': len(changes['description'] or '')
+                    }
+                })
+        await ActivityManager.log_activities(activities)
+
+        return {"items": [serializer.dict() for serializer in await TaskSerializer.from_orm_batch(tasks)]}
+
+    @classmethod
+    async def bulk_change_task_status(cls, payload: dict, access: ProjectAccessContext):
+        project_id = access.project_id
+        user_id = access.user_id
+
+        validated_data = BULK_CHANGE_STATUS_SCHEMA(**payload)
+        items = cls._index_bulk_items(validated_data.tasks)
+
+        for item in items.values():
+            if item.status not in GeneralConstants.TASK_STATUSES:
+                raise BadRequestException(ErrorMessages.INVALID_STATUS)
+
+        project = access.project
+
+        changes_by_task = {task_id: {'status': item.status} for task_id, item in items.items()}
+        async with in_transaction() as conn:
+            await cls._lock_rank_columns(project_id, {item.status for item in items.values()})
+            current = await cls._lock_tasks(project_id, items)
+            await cls._append_status_changes(project_id, current, changes_by_task)
+            tasks = await cls._bulk_update_rows(conn, project_id, [
+                (task_id, item.version, changes_by_task[task_id]) for task_id, item in items.items()
+            ])
+            await TaskRevisionManager.record_revisions(
+                [(TaskRevisionManager.state_of(current[str(task.id)]), task) for task in tasks], user_id
+            )
+            await TaskCounterManager.record_transitions(
+                project_id, [(current[str(task.id)].status, task.status) for task in tasks]
+            )
+
+        await cls._invalidate_task_cache({str(task.id): task.version for task in tasks})
+        await DashboardManager.invalidate_organization(access.org_id)
+
+        org_id = str(project.org_id)
+        await ActivityManager.log_activities([
+            {
+                'org_id': org_id,
+                'project_id': access.project_id,
+                'user_id': user_id,
+                'entity_type': EntityType.TASK.value,
+                'entity_id': task_id,
+                'action': ActionType.TASK_STATUS_CHANGED.value,
+                'metadata': {
+                    "old_status": current[task_id].status,
+                    "new_status": item.status,
+                }
+            }
+            for task_id, item in items.items()
+            if current[task_id].status != item.status
+        ])
+
+        return {"items": [serializer.dict() for serializer in await TaskSerializer.from_orm_batch(tasks)]}
+
+    @classmethod
+    async def bulk_assign_tasks(cls, payload: dict, access: ProjectAccessContext):
+        project_id = access.project_id
+        user_id = access.user_id
+
+        validated_data = BULK_ASSIGN_TASK_SCHEMA(**payload)
+        items = cls._index_bulk_items(validated_data.tasks)
+
+        desired_assignees = {
+            task_id: cls._normalize_ids(item.assignee_ids, "assignee_id")
+            for task_id, item in items.items()
+        }
+
+        project = access.project
+        await cls._ensure_assignees_exist({a for ids in desired_assignees.values() for a in ids})
+
+        async with in_transaction() as conn:
+            await cls._lock_tasks(project_id, items)
+            tasks = await cls._bulk_update_rows(conn, project_id, [
+                (task_id, item.version, {}) for task_id, item in items.items()
+            ])
+            added, _ = await cls._sync_assignees(desired_assignees)
+
+        await cls._invalidate_task_cache({str(task.id): task.version for task in tasks})
+        await DashboardManager.invalidate_organization(access.org_id)
+        await DashboardManager.invalidate_users(*[assignee_id for _, assignee_id in added])
+
+        org_id = str(project.org_id)
+        await ActivityManager.log_activities([
+            {
+                'org_id': org_id,
+                'project_id': access.project_id,
+                'user_id': user_id,
+                'entity_type': EntityType.TASK.value,
+                'entity_id': task_id,
+                'action': ActionType.TASK_ASSIGNED.value,
+                'metadata': {
+                    'assignee_id': assignee_id
+                }
+            }
+            for task_id, assignee_id in added
+        ])
+
+        return {"items": [serializer.dict() for serializer in await TaskSerializer.from_orm_batch(tasks)]}
+
+    @classmethod
+    def _normalize_ids(cls, values: List[str], field_name: str) -> List[str]:
+        # Canonical lowercase UUID strings, de-duplicated in their original order
+        return list(dict.fromkeys(
+            str(uuid.UUID(Validator.validate_uuid(value, field_name))) for value in values
+        ))
+
+    @classmethod
+    def _index_bulk_items(cls, items: list) -> Dict[str, Any]:
+        indexed = {}
+        for item in items:
+            task_id = cls._normalize_ids([item.id], "task_id")[0]
+            if task_id in indexed:
+                raise BadRequestException(ErrorMessages.DUPLICATE_TASK_IN_BULK)
+            indexed[task_id] = item
+        return indexed
+
+    @classmethod
+    async def _ensure_assignees_exist(cls, assignee_ids: set):
+        if not assignee_ids:
+            return
+
+        found = await User.filter(id__in=list(assignee_ids)).count()
+        if found != len(assignee_ids):
+            raise NotFoundException(ErrorMessages.ASSIGNEE_NOT_FOUND)
+
+    @classmethod
+    async def _lock_tasks(cls, project_id: str, items: Dict[str, Any]) -> Dict[str, Task]:
+        """Row-lock the requested tasks and check that each exists and carries the expected version."""
+        tasks = await Task.filter(id__in=list(items), project_id=project_id).select_for_update()
+        current = {str(task.id): task for task in tasks}
+
+        for task_id, item in items.items():
+            task = current.get(task_id)
+            if not task:
+                raise NotFoundException(ErrorMessages.BULK_TASK_NOT_FOUND.format(task_id=task_id))
+            if task.version != item.version:
+                raise ConflictException(ErrorMessages.BULK_TASK_VERSION_MISMATCH.format(task_id=task_id))
+
+        return current
+
+    @classmethod
+    async def _bulk_update_rows(cls, conn, project_id: str, updates: List[Tuple[str, int, Dict[str, Any]]]) -> List[Task]:
+        """
+        Apply per-task changes in one UPDATE ... FROM (VALUES ...) statement.
+        Every row is guarded by its expected version and gets version + 1.
+        """
+        columns = [c for c in cls._UPDATABLE_COLUMNS if any(c in changes for _, _, changes in updates)]
+        names = ["id", "version"] + [name for c in columns for name in (c, f"set_{c}")]
+
+        params: List[Any] = [project_id]
+        rows = []
+        for task_id, version, changes in updates:
+            values = [(task_id, "uuid"), (version, "int")]
+            for column in columns:
+                values.append((changes.get(column), cls._UPDATABLE_COLUMNS[column]))
+                values.append((column in changes, "boolean"))
+
+            placeholders = []
+            for value, cast in values:
+                params.append(value)
+                placeholders.append(f"${len(params)}::{cast}")
+            rows.append(f"({', '.join(placeholders)})")
+
+        assignments = [
+            f'"{c}" = CASE WHEN v."set_{c}" THEN v."{c}" ELSE t."{c}" END' for c in columns
+        ] + ['"version" = t."version" + 1', '"updatedAt" = CURRENT_TIMESTAMP']
+
+        result = await conn.execute_query_dict(
+            f"""
+            UPDATE tasks AS t
+            SET {', '.join(assignments)}
+            FROM (VALUES {', '.join(rows)}) AS v({', '.join(f'"{n}"' for n in names)})
+            WHERE t.id = v.id AND t.version = v.version AND t.project_id = $1
+            RETURNING t.*
+            """,
+            params
+        )
+        if len(result) != len(updates):
+            raise ConflictException(ErrorMessages.TASK_VERSION_MISMATCH)
+
+        # Keep the response in request order
+        by_id = {str(row['id']): Task._init_from_db(**row) for row in result}
+        return [by_id[task_id] for task_id, _, _ in updates]
+
+    @classmethod
+    async def _get_task_for_write(cls, task_id: str, project_id: str) -> Task:
+        # The project itself was already resolved and checked by the request's access context
+        task = await Task.get_or_none(id=task_id)
+        if not task:
+            raise NotFoundException(ErrorMessages.TASK_NOT_FOUND)
+
+        if str(task.project_id) != project_id:
+            raise NotFoundException(ErrorMessages.TASK_NOT_IN_PROJECT)
+
+        return task
+
+    @classmethod
+    async def _compare_and_swap(
+        cls, task_id: str, version: int, changes: Dict[str, Any], project_id: Optional[str] = None
+    ) -> Tuple[Task, Dict[str, Any]]:
+        """
+        Apply changes and bump the version in a single statement, guarded by the expected version.
+        Returns the updated task plus the previous title/description/status/due_at and the org id.
+        """
+        params: List[Any] = [task_id, version]
+        assignments = []
+        for column, value in changes.items():
+            if column not in cls._UPDATABLE_COLUMNS:
+                raise BadRequestException(ErrorMessages.INVALID_INPUT)
+            params.append(value)
+            assignments.append(f'"{column}" = ${len(params)}::{cls._UPDATABLE_COLUMNS[column]}')
+        assignments += ['"version" = t."version" + 1', '"updatedAt" = CURRENT_TIMESTAMP']
+
+        project_filter = ""
+        if project_id:
+            params.append(project_id)
+            project_filter = f"AND t.project_id = ${len(params)}"
+
+        # Joining the row to itself exposes its pre-update values to RETURNING
+        rows = await connections.get("default").execute_query_dict(
+            f"""
+            UPDATE tasks AS t
+            SET {', '.join(assignments)}
+            FROM tasks AS old, projects AS p
+            WHERE t.id = $1 AND t.version = $2
+              AND old.id = t.id
+              AND p.id = t.project_id AND p.is_archieved = FALSE
+              {project_filter}
+            RETURNING t.*, old.title AS old_title, old.description AS old_description,
+                      old.status AS old_status, old.due_at AS old_due_at, p.org_id AS project_org_id
+            """,
+            params
+        )
+        if not rows:
+            # Nothing matched: find out why, only on this slow path
+            await cls._get_task_for_write(task_id, project_id)
+            raise ConflictException(ErrorMessages.TASK_VERSION_MISMATCH)
+
+        row = rows[0]
+        previous = {
+            'title': row['old_title'],
+            'description': row['old_description'],
+            'status': row['old_status'],
+            'due_at': row['old_due_at'],
+            'org_id': str(row['project_org_id']),
+        }
+        return Task._init_from_db(**row), previous
+
+    @classmethod
+    async def _sync_assignees(cls, desired: Dict[str, List[str]]) -> Tuple[List[Tuple[str, str]], int]:
+        """
+        Bring task_assignees in line with the desired user ids per task, touching only rows that differ.
+        Returns the (task_id, user_id) pairs that were added and the number of rows removed.
+        """
+        if not desired:
+            return [], 0
+
+        existing = await TaskAssignee.filter(task_id__in=list(desired)).values('id', 'task_id', 'user_id')
+
+        kept: Dict[str, set] = {}
+        stale = []
+        for row in existing:
+            task_id, assignee_id = str(row['task_id']), str(row['user_id'])
+            if assignee_id in desired[task_id]:
+                kept.setdefault(task_id, set()).add(assignee_id)
+            else:
+                stale.append(row['id'])
+
+        added = [
+            (task_id, assignee_id)
+            for task_id, assignee_ids in desired.items()
+            for assignee_id in assignee_ids
+            if assignee_id not in kept.get(task_id, ())
+        ]
+
+        if stale:
+            await TaskAssignee.filter(id__in=stale).delete()
+        if added:
+            await TaskAssignee.bulk_create([
+                TaskAssignee(task_id=task_id, user_id=assignee_id) for task_id, assignee_id in added
+            ])
+
+        return added, len(stale)
+
+    @classmethod
+    async def _lock_rank_column(cls, project_id: str, status: str):
+        # Serializes rank assignment within one status column until the transaction ends
+        await connections.get("default").execute_query(
+            "SELECT pg_advisory_xact_lock(hashtextextended($1, 0))",
+            [f"task_rank:{project_id}:{TaskStatus(status).value}"]
+        )
+
+    @classmethod
+    async def _lock_rank_columns(cls, project_id: str, statuses: set):
+        # Taken before any task row lock and in a fixed order, like single-column moves
+        for status in sorted(status for status in statuses if status):
+            await cls._lock_rank_column(project_id, status)
+
+    @classmethod
+    async def _rank_for_status_change(cls, task_id: str, project_id: str, version: int, status: str) -> Dict[str, Any]:
+        """
+        The rank that puts a task at the end of the status column it moves to, or nothing if it
+        already is in that column. Locks the column until the caller's transaction ends, so call
+        it inside the transaction that applies the change, before the version-guarded swap.
+        """
+        current = await Task.filter(id=task_id, project_id=project_id).first().values('status', 'version')
+        # A stale version fails the swap anyway; leave the error to it
+        if not current or current['version'] != version or TaskStatus(current['status']).value == status:
+            return {}
+
+        await cls._lock_rank_column(project_id, status)
+        return {'rank': rank_between(await cls._last_rank(project_id, status), None)}
+
+    @classmethod
+    async def _append_status_changes(cls, project_id: str, current: Dict[str, Task], changes_by_task: Dict[str, Dict[str, Any]]):
+        """
+        Add a rank at the end of the new column to every task whose status changes, in request
+        order. The target columns must already be locked with _lock_rank_columns.
+        """
+        moving: Dict[str, List[str]] = {}
+        for task_id, changes in changes_by_task.items():
+            status = changes.get('status')
+            if status and status != TaskStatus(current[task_id].status).value:
+                moving.setdefault(status, []).append(task_id)
+
+        for status, task_ids in moving.items():
+            rank = await cls._last_rank(project_id, status)
+            for task_id in task_ids:
+                rank = rank_between(rank, None)
+                changes_by_task[task_id]['rank'] = rank
+
+    @classmethod
+    async def _lock_task_tree(cls, project_id: str, shared: bool = False):
+        # Reparenting and deleting take this exclusively; creating subtasks shares it, so a new
+        # child never copies the path of a parent that is being moved
+        lock = "pg_advisory_xact_lock_shared" if shared else "pg_advisory_xact_lock"
+        await connections.get("default").execute_query(
+            f"SELECT {lock}(hashtextextended($1, 0))", [f"task_tree:{project_id}"]
+        )
+
+    @classmethod
+    def _subtree_prefix(cls, task: Task) -> str:
+        """The path every descendant of the task starts with (and its children's exact path)."""
+        return f"{task.path}{uuid.UUID(str(task.id)).hex}."
+
+    @classmethod
+    def _path_upper_bound(cls, prefix: str) -> str:
+        # '/' is the byte after '.', so [prefix, bound) holds exactly the paths starting with prefix
+        return prefix[:-1] + "/"
+
+    @classmethod
+    async def _resolve_parent_paths(cls, parent_ids: set, project_id: str) -> Dict[str, str]:
+        """Map each parent id to the path its children get; every parent must belong to the project."""
+        rows = await Task.filter(id__in=list(parent_ids), project_id=project_id).values('id', 'path')
+        if len(rows) != len(parent_ids):
+            raise NotFoundException(ErrorMessages.PARENT_TASK_NOT_FOUND)
+
+        paths = {}
+        for row in rows:
+            path = f"{row['path']}{uuid.UUID(str(row['id'])).hex}."
+            if len(path) // cls._PATH_SEGMENT_LENGTH > GeneralConstants.TASK_MAX_DEPTH:
+                raise BadRequestException(ErrorMessages.SUBTASK_TOO_DEEP)
+            paths[str(row['id'])] = path
+        return paths
+
+    @classmethod
+    async def _rewrite_subtree_paths(cls, project_id: str, old_prefix: str, new_prefix: str):
+        if old_prefix == new_prefix:
+            return
+        await connections.get("default").execute_query(
+            """
+            UPDATE tasks SET path = $4 || substr(path, $5)
+            WHERE project_id = $1 AND path ~>=~ $2 AND path ~<~ $3
+            """,
+            [project_id, old_prefix, cls._path_upper_bound(old_prefix), new_prefix, len(old_prefix) + 1]
+        )
+
+    @classmethod
+    async def _last_rank(cls, project_id: str, status: str) -> Optional[str]:
+        return await Task.filter(project_id=project_id, status=status).order_by('-rank').first().values_list(
+            'rank', flat=True
+        )
+
+    @classmethod
+    async def _invalidate_task_cache(cls, versions: Dict[str, int]):
+        """Drop cached task details after a committed write.
+
+        The newest version is recorded first so a read that loaded the old row before
+        the write cannot put that older snapshot back into the cache afterwards.
+        """
+        if not versions:
+            return
+
+        await redis_client.set_many(
+            {CacheKeys.task_version(task_id): version for task_id, version in versions.items()},
+            expire=GeneralConstants.TASK_VERSION_MARKER_TTL
+        )
+        await redis_client.delete(*[CacheKeys.task(task_id) for task_id in versions])
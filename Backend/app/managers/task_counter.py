@@ -0,0 +1,162 @@
+from app.models import ProjectTaskCounter
+from app.models.task import TaskStatus
+from app.constants import GeneralConstants
+from tortoise.transactions import in_transaction
+from tortoise import connections
+from typing import Dict, Iterable, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class TaskCounterManager:
+    """
+    Task counts per project, by status and in total, shared by every screen that shows them.
+
+    Counts are materialized in project_task_counters, so reading them is a primary-key lookup
+    per project. Every TaskManager write adjusts its project's row in the transaction that
+    changes the tasks, and reconcile() periodically recounts from the tasks table to repair
+    drift from writes that bypassed TaskManager.
+    """
+
+    STATUSES = tuple(GeneralConstants.TASK_STATUSES)
+    _COLUMNS = STATUSES + ("total",)
+
+    @classmethod
+    async def get_counts(cls, project_ids: Iterable[str]) -> Dict[str, Dict[str, int]]:
+        """{project_id: {status: count, ..., "total": count}}, with zeros for projects without tasks."""
+        project_ids = list(dict.fromkeys(str(project_id) for project_id in project_ids))
+        if not project_ids:
+            return {}
+
+        counts = {project_id: dict.fromkeys(cls._COLUMNS, 0) for project_id in project_ids}
+        for row in await ProjectTaskCounter.filter(project_id__in=project_ids).values('project_id', *cls._COLUMNS):
+            counts[str(row['project_id'])] = {column: row[column] for column in cls._COLUMNS}
+        return counts
+
+    @classmethod
+    async def get_organization_counts(cls, org_id: str) -> Dict[str, int]:
+        """The same counts summed over the organization's non-archived projects."""
+        sums = ", ".join(f"COALESCE(sum(c.{column}), 0) AS {column}" for column in cls._COLUMNS)
+        rows = await connections.get("default").execute_query_dict(
+            f"""
+            SELECT {sums}
+            FROM project_task_counters AS c
+            JOIN projects AS p ON p.id = c.project_id
+            WHERE p.org_id = $1 AND NOT p.is_archieved
+            """,
+            [org_id]
+        )
+        return {column: int(rows[0][column]) for column in cls._COLUMNS}
+
+    @classmethod
+    async def record_transitions(cls, project_id: str, transitions: Iterable[Tuple[Optional[str], Optional[str]]]):
+        """
+        Count tasks moving between statuses: (None, status) for a new task, (status, None) for a
+        deleted one and (old, new) for a status change. Call it inside the transaction that wrote
+        the tasks, last, since it holds the project's counter row locked until commit.
+        """
+        delta = dict.fromkeys(cls.STATUSES, 0)
+        for old, new in transitions:
+            if old is not None:
+                delta[TaskStatus(old).value] -= 1
+            if new is not None:
+                delta[TaskStatus(new).value] += 1
+        await cls.adjust(project_id, delta)
+
+    @classmethod
+    async def adjust(cls, project_id: str, delta: Dict[str, int]):
+        """Add per-status differences to the project's counters, within the caller's transaction."""
+        values = [delta.get(status, 0) for status in cls.STATUSES]
+        if not any(values):
+            return
+
+        placeholders = ", ".join(f"${i}" for i in range(2, len(cls._COLUMNS) + 2))
+        increments = ", ".join(
+            f"{column} = project_task_counters.{column} + EXCLUDED.{column}" for column in cls._COLUMNS
+        )
+        await connections.get("default").execute_query(
+            f"""
+            INSERT INTO project_task_counters (project_id, {', '.join(cls._COLUMNS)}, "updatedAt")
+            VALUES ($1, {placeholders}, CURRENT_TIMESTAMP)
+            ON CONFLICT (project_id) DO UPDATE SET {increments}, "updatedAt" = CURRENT_TIMESTAMP
+            """,
+            [project_id, *values, sum(values)]
+        )
+
+    @classmethod
+    async def reconcile(cls) -> int:
+        """
+        Recount every project from the tasks table and fix counters that drifted; returns how many.
+        Workers that find it already running skip it.
+        """
+        batch_size = GeneralConstants.TASK_COUNTER_RECONCILE_BATCH_SIZE
+        conn = connections.get("default")
+        fixed = 0
+        after = None
+        while True:
+            project_ids = await conn.execute_query_dict(
+                "SELECT id FROM projects WHERE $1::uuid IS NULL OR id > $1::uuid ORDER BY id LIMIT $2",
+                [after, batch_size]
+            )
+            if not project_ids:
+                break
+            after = project_ids[-1]['id']
+
+            batch_fixed = await cls._reconcile_batch([row['id'] for row in project_ids])
+            if batch_fixed is None:
+                return fixed
+            fixed += batch_fixed
+
+        if fixed:
+            logger.warning(f"Reconciled {fixed} drifted project task counters")
+        return fixed
+
+    @classmethod
+    async def _reconcile_batch(cls, project_ids: list) -> Optional[int]:
+        counts = ", ".join(f"count(*) FILTER (WHERE status = '{status}') AS {status}" for status in cls.STATUSES)
+        columns = ", ".join(cls._COLUMNS)
+        async with in_transaction() as conn:
+            locked = await conn.execute_query_dict(
+                "SELECT pg_try_advisory_xact_lock(hashtextextended('task_counters', 0)) AS locked"
+            )
+            if not locked[0]['locked']:
+                return None
+
+            # Writers adjust the counter row last, so once it is locked their task changes are either
+            # committed, and seen by the recount below, or still to come as increments after ours
+            await conn.execute_query(
+                "SELECT project_id FROM project_task_counters WHERE project_id = ANY($1::uuid[]) ORDER BY project_id FOR UPDATE",
+                [project_ids]
+            )
+            rows = await conn.execute_query_dict(
+                f"""
+                WITH actual AS (
+                    SELECT p.id AS project_id, {', '.join(f'COALESCE(t.{column}, 0) AS {column}' for column in cls._COLUMNS)}
+                    FROM unnest($1::uuid[]) AS p(id)
+                    LEFT JOIN (
+                        SELECT project_id, {counts}, count(*) AS total
+                        FROM tasks
+                        WHERE project_id = ANY($1::uuid[])
+                        GROUP BY project_id
+                    ) AS t ON t.project_id = p.id
+                ), updated AS (
+                    UPDATE project_task_counters AS c
+                    SET {', '.join(f'{column} = a.{column}' for column in cls._COLUMNS)}, "updatedAt" = CURRENT_TIMESTAMP
+                    FROM actual AS a
+                    WHERE c.project_id = a.project_id AND ({', '.join(f'c.{column}' for column in cls._COLUMNS)})
+                          IS DISTINCT FROM ({', '.join(f'a.{column}' for column in cls._COLUMNS)})
+                    RETURNING c.project_id
+                ), inserted AS (
+                    -- Rows a writer created since the lock are left to that writer's increments
+                    INSERT INTO project_task_counters (project_id, {columns}, "updatedAt")
+                    SELECT project_id, {columns}, CURRENT_TIMESTAMP FROM actual AS a
+                    WHERE a.total > 0 AND NOT EXISTS (SELECT 1 FROM project_task_counters AS c WHERE c.project_id = a.project_id)
+                    ON CONFLICT (project_id) DO NOTHING
+                    RETURNING project_id
+                )
+                SELECT project_id FROM updated UNION ALL SELECT project_id FROM inserted
+                """,
+                [project_ids]
+            )
+        return len(rows)
@@ -0,0 +1,258 @@
+from app.models import Task, TaskDependency
+from app.models.task import TaskStatus
+from app.exceptions import BadRequestException, NotFoundException, ConflictException
+from app.schemas.task import ADD_DEPENDENCY_SCHEMA
+from app.constants import ErrorMessages
+from app.utils.validator import Validator
+from app.dependencies.auth import ProjectAccessContext
+from tortoise.transactions import in_transaction
+from tortoise import connections
+from typing import Optional, List, Dict, Any
+from collections import defaultdict, deque
+import logging
+import uuid
+
+logger = logging.getLogger(__name__)
+
+
+class TaskDependencyManager:
+    """
+    "Blocked by" edges between tasks of one project.
+
+    Every task with an edge carries a graph_order such that blockers always sort before the
+    tasks they block. Most new edges already agree with that order and are accepted after a
+    constant-time check; otherwise only the tasks ordered between the two endpoints are searched
+    and renumbered (Pearce-Kelly), so inserting an edge never walks the whole graph.
+    """
+
+    @classmethod
+    async def add_dependency(cls, task_id: str, payload: dict, access: ProjectAccessContext):
+        task_id = cls._normalize_id(task_id, "task_id")
+        project_id = access.project_id
+
+        validated_data = ADD_DEPENDENCY_SCHEMA(**payload)
+        blocker_id = cls._normalize_id(validated_data.blocker_id, "blocker_id")
+        if blocker_id == task_id:
+            raise BadRequestException(ErrorMessages.DEPENDENCY_SELF)
+
+        async with in_transaction():
+            await cls._lock_graph(project_id)
+
+            orders = {
+                str(row['id']): row['graph_order']
+                for row in await Task.filter(id__in=[task_id, blocker_id], project_id=project_id).values('id', 'graph_order')
+            }
+            if task_id not in orders:
+                raise NotFoundException(ErrorMessages.TASK_NOT_FOUND)
+            if blocker_id not in orders:
+                raise NotFoundException(ErrorMessages.DEPENDENCY_BLOCKER_NOT_FOUND)
+
+            if await TaskDependency.filter(task_id=task_id, blocker_id=blocker_id).exists():
+                raise ConflictException(ErrorMessages.DEPENDENCY_EXISTS)
+
+            await cls._order_edge(project_id, blocker_id, task_id, orders)
+            dependency = await TaskDependency.create(
+                project_id=project_id,
+                task_id=task_id,
+                blocker_id=blocker_id,
+                created_by_id=access.user_id
+            )
+
+        return cls._serialize(dependency)
+
+    @classmethod
+    async def remove_dependency(cls, task_id: str, blocker_id: str, access: ProjectAccessContext):
+        task_id = cls._normalize_id(task_id, "task_id")
+        blocker_id = cls._normalize_id(blocker_id, "blocker_id")
+
+        # Removing an edge never invalidates the existing order, so no lock or renumbering is needed
+        deleted = await TaskDependency.filter(
+            project_id=access.project_id, task_id=task_id, blocker_id=blocker_id
+        ).delete()
+        if not deleted:
+            raise NotFoundException(ErrorMessages.DEPENDENCY_NOT_FOUND)
+
+    @classmethod
+    async def list_task_dependencies(cls, task_id: str, access: ProjectAccessContext):
+        task_id = cls._normalize_id(task_id, "task_id")
+        if not await Task.filter(id=task_id, project_id=access.project_id).exists():
+            raise NotFoundException(ErrorMessages.TASK_NOT_FOUND)
+
+        blocked_by = await TaskDependency.filter(task_id=task_id).order_by('createdAt').values(
+            'blocker_id', 'blocker__title', 'blocker__status'
+        )
+        blocking = await TaskDependency.filter(blocker_id=task_id).order_by('createdAt').values(
+            'task_id', 'task__title', 'task__status'
+        )
+
+        return {
+            "blocked_by": [
+                {"id": str(row['blocker_id']), "title": row['blocker__title'], "status": TaskStatus(row['blocker__status']).value}
+                for row in blocked_by
+            ],
+            "blocking": [
+                {"id": str(row['task_id']), "title": row['task__title'], "status": TaskStatus(row['task__status']).value}
+                for row in blocking
+            ],
+        }
+
+    @classmethod
+    async def get_dependency_graph(cls, access: ProjectAccessContext):
+        """
+        Topological order and critical path of the project's dependency graph.
+
+        The edges (with both endpoints' statuses) are fetched in one query and everything else
+        runs in memory in O(tasks + edges). The critical path is the chain of dependent tasks
+        holding the most unfinished work, each open task counting as one unit and done tasks as none.
+        """
+        rows = await connections.get("default").execute_query_dict(
+            """
+            SELECT d.blocker_id, d.task_id, b.status AS blocker_status, t.status AS task_status
+            FROM task_dependencies AS d
+            JOIN tasks AS b ON b.id = d.blocker_id
+            JOIN tasks AS t ON t.id = d.task_id
+            WHERE d.project_id = $1
+            """,
+            [access.project_id]
+        )
+
+        successors: Dict[uuid.UUID, List[uuid.UUID]] = defaultdict(list)
+        indegree: Dict[uuid.UUID, int] = {}
+        weight: Dict[uuid.UUID, int] = {}
+        for row in rows:
+            blocker, task = row['blocker_id'], row['task_id']
+            successors[blocker].append(task)
+            indegree[task] = indegree.get(task, 0) + 1
+            indegree.setdefault(blocker, 0)
+            weight[blocker] = 0 if row['blocker_status'] == TaskStatus.DONE.value else 1
+            weight[task] = 0 if row['task_status'] == TaskStatus.DONE.value else 1
+
+        # Kahn's algorithm; a task is only dequeued once all its blockers are settled,
+        # so the longest-path relaxation can ride along in the same pass
+        queue = deque(node for node, degree in indegree.items() if degree == 0)
+        distance = dict(weight)
+        previous: Dict[uuid.UUID, uuid.UUID] = {}
+        order = []
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            for successor in successors.get(node, ()):
+                if distance[node] + weight[successor] > distance[successor]:
+                    distance[successor] = distance[node] + weight[successor]
+                    previous[successor] = node
+                indegree[successor] -= 1
+                if indegree[successor] == 0:
+                    queue.append(successor)
+
+        if len(order) != len(indegree):
+            # Inserts are checked under a lock, so this means the stored edges were edited by hand
+            logger.error(f"Dependency graph of project {access.project_id} contains a cycle")
+            raise ConflictException(ErrorMessages.DEPENDENCY_CYCLE)
+
+        critical_path = []
+        end = max(distance, key=distance.get, default=None)
+        if end is not None and distance[end] > 0:
+            node: Optional[uuid.UUID] = end
+            while node is not None:
+                critical_path.append(node)
+                node = previous.get(node)
+            critical_path.reverse()
+
+        return {
+            "tasks": len(order),
+            "edges": len(rows),
+            "order": [str(node) for node in order],
+            "critical_path": [str(node) for node in critical_path],
+            "critical_path_length": distance[end] if critical_path else 0,
+        }
+
+    @classmethod
+    async def _order_edge(cls, project_id: str, blocker_id: str, task_id: str, orders: Dict[str, Optional[int]]):
+        """Make sure blocker sorts before task in graph_order, or raise if that would need a cycle."""
+        conn = connections.get("default")
+        low, high = orders[blocker_id], orders[task_id]
+
+        if low is None or high is None:
+            # A task without edges can take any free slot: the blocker goes first, the blocked task last
+            bounds = (await conn.execute_query_dict(
+                "SELECT min(graph_order) AS first, max(graph_order) AS last FROM tasks WHERE project_id = $1",
+                [project_id]
+            ))[0]
+            first, last = bounds['first'] or 0, bounds['last'] or 0
+            positions = {}
+            if low is None:
+                positions[blocker_id] = first - 1 if high is not None else last + 1
+            if high is None:
+                positions[task_id] = last + (2 if low is None else 1)
+            await cls._set_orders(positions)
+            return
+
+        if low < high:
+            return
+
+        # Only tasks ordered between the two endpoints can need to move: those reachable from the
+        # blocked task up to the blocker's position, and those reaching the blocker down to the task's
+        forward = await cls._reach(task_id, "blocker_id", "task_id", "<=", low)
+        if blocker_id in forward:
+            raise BadRequestException(ErrorMessages.DEPENDENCY_CYCLE)
+        backward = await cls._reach(blocker_id, "task_id", "blocker_id", ">=", high)
+
+        # Reuse the same slots, placing everything that leads to the blocker ahead of everything after the task
+        nodes = sorted(backward, key=backward.get) + sorted(forward, key=forward.get)
+        slots = sorted(list(backward.values()) + list(forward.values()))
+        await cls._set_orders(dict(zip(nodes, slots)))
+
+    @classmethod
+    async def _reach(cls, start_id: str, from_column: str, to_column: str, comparison: str, bound: int) -> Dict[str, int]:
+        """Tasks reachable from start_id along edges from_column -> to_column without leaving the bound."""
+        rows = await connections.get("default").execute_query_dict(
+            f"""
+            WITH RECURSIVE reach(id, graph_order) AS (
+                SELECT id, graph_order FROM tasks WHERE id = $1
+                UNION
+                SELECT t.id, t.graph_order
+                FROM reach
+                JOIN task_dependencies AS d ON d.{from_column} = reach.id
+                JOIN tasks AS t ON t.id = d.{to_column}
+                WHERE t.graph_order {comparison} $2
+            )
+            SELECT id, graph_order FROM reach
+            """,
+            [start_id, bound]
+        )
+        return {str(row['id']): row['graph_order'] for row in rows}
+
+    @classmethod
+    async def _set_orders(cls, positions: Dict[str, int]):
+        if not positions:
+            return
+        await connections.get("default").execute_query(
+            """
+            UPDATE tasks AS t SET graph_order = v.graph_order
+            FROM unnest($1::uuid[], $2::bigint[]) AS v(id, graph_order)
+            WHERE t.id = v.id
+            """,
+            [list(positions.keys()), list(positions.values())]
+        )
+
+    @classmethod
+    async def _lock_graph(cls, project_id: str):
+        # Serializes edge inserts per project so two concurrent edges can't close a cycle together
+        await connections.get("default").execute_query(
+            "SELECT pg_advisory_xact_lock(hashtextextended($1, 0))", [f"task_graph:{project_id}"]
+        )
+
+    @classmethod
+    def _normalize_id(cls, value: str, field_name: str) -> str:
+        return str(uuid.UUID(Validator.validate_uuid(value, field_name)))
+
+    @classmethod
+    def _serialize(cls, dependency: TaskDependency) -> Dict[str, Any]:
+        return {
+            "id": str(dependency.id),
+            "project_id": str(dependency.project_id),
+            "task_id": str(dependency.task_id),
+            "blocker_id": str(dependency.blocker_id),
+            "created_by_id": str(dependency.created_by_id) if dependency.created_by_id else None,
+            "createdAt": dependency.createdAt.isoformat(),
+        }
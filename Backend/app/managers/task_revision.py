@@ -0,0 +1,155 @@
+from app.models import Task, TaskRevision
+from app.models.task import TaskStatus
+from app.exceptions import NotFoundException
+from app.constants import GeneralConstants, ErrorMessages
+from app.utils.validator import Validator
+from app.utils.text_diff import diff_or_value, apply_text_diff
+from app.dependencies.auth import ProjectAccessContext
+from tortoise.functions import Max
+from typing import Optional, List, Dict, Any, Tuple
+from datetime import datetime
+import uuid
+
+
+class TaskRevisionManager:
+    """
+    Version history of a task's content.
+
+    Each revision stores only what changed, long text as a line diff, so the table grows with the
+    size of edits rather than of the documents. Every TASK_REVISION_SNAPSHOT_INTERVAL versions a
+    full snapshot is written, which bounds how many diffs a reconstruction has to replay.
+    """
+
+    TRACKED_FIELDS = ("title", "description", "status", "due_at")
+
+    # Fields stored as a diff against the previous value rather than in full
+    _DIFFED_FIELDS = ("description",)
+
+    @classmethod
+    def state_of(cls, source: Any) -> Dict[str, Any]:
+        """Tracked fields, JSON-ready, from a Task or from a dict with the same keys."""
+        get = source.get if isinstance(source, dict) else lambda field: getattr(source, field)
+        due_at = get("due_at")
+        return {
+            "title": get("title"),
+            "description": get("description"),
+            "status": TaskStatus(get("status")).value,
+            "due_at": due_at.isoformat() if isinstance(due_at, datetime) else due_at,
+        }
+
+    @classmethod
+    async def record_revisions(cls, changes: List[Tuple[Optional[Dict[str, Any]], Task]], user_id: Optional[str]):
+        """
+        Record the new version of each task; pass the old state (see state_of) or None for new tasks.
+        Call it inside the transaction that wrote the tasks. Writes that left every tracked field
+        unchanged are skipped, and a task edited before history existed first gets a baseline snapshot.
+        """
+        pending = []
+        for old, task in changes:
+            new = cls.state_of(task)
+            changed = [field for field in cls.TRACKED_FIELDS if old is None or old[field] != new[field]]
+            if changed:
+                pending.append((str(task.id), task.version, old, new, changed))
+        if not pending:
+            return
+
+        # Every history starts with a snapshot, so a task without one has no history yet
+        last_snapshots = {
+            str(row['task_id']): row['last_version']
+            for row in await TaskRevision.filter(
+                task_id__in=[task_id for task_id, *_ in pending], is_snapshot=True
+            ).annotate(last_version=Max('version')).group_by('task_id').values('task_id', 'last_version')
+        }
+
+        revisions = []
+        for task_id, version, old, new, changed in pending:
+            if old is not None and task_id not in last_snapshots:
+                revisions.append(TaskRevision(
+                    task_id=task_id, version=version - 1, is_snapshot=True, data=old, changed_fields=[], user_id=None
+                ))
+                last_snapshots[task_id] = version - 1
+
+            last_snapshot = last_snapshots.get(task_id)
+            if old is None or last_snapshot is None or version - last_snapshot >= GeneralConstants.TASK_REVISION_SNAPSHOT_INTERVAL:
+                revisions.append(TaskRevision(
+                    task_id=task_id, version=version, is_snapshot=True, data=new, changed_fields=changed, user_id=user_id
+                ))
+                continue
+
+            data = {}
+            for field in changed:
+                if field in cls._DIFFED_FIELDS and old[field] is not None and new[field] is not None:
+                    data[field] = diff_or_value(old[field], new[field])
+                else:
+                    data[field] = new[field]
+            revisions.append(TaskRevision(
+                task_id=task_id, version=version, is_snapshot=False, data=data, changed_fields=changed, user_id=user_id
+            ))
+
+        await TaskRevision.bulk_create(revisions)
+
+    @classmethod
+    async def list_revisions(
+        cls, task_id: str, access: ProjectAccessContext, limit: int = 20, before_version: Optional[int] = None
+    ):
+        """One page of a task's history, newest first, without content; fetch a version to see it."""
+        task_id = await cls._get_task_id(task_id, access)
+        limit = Validator.validate_positive_integer(limit, "limit", min_value=1, max_value=GeneralConstants.TASK_REVISION_PAGE_LIMIT)
+
+        query = TaskRevision.filter(task_id=task_id)
+        if before_version is not None:
+            query = query.filter(version__lt=before_version)
+
+        rows = await query.order_by('-version').limit(limit + 1).values(
+            'version', 'changed_fields', 'createdAt', 'user_id', 'user__firstName', 'user__lastName'
+        )
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        return {
+            "items": [
+                {
+                    "version": row['version'],
+                    "changed_fields": row['changed_fields'],
+                    "user_id": str(row['user_id']) if row['user_id'] else None,
+                    "user_name": f"{row['user__firstName']} {row['user__lastName']}".strip() if row['user_id'] else None,
+                    "createdAt": row['createdAt'].isoformat(),
+                }
+                for row in rows
+            ],
+            "next_before_version": rows[-1]['version'] if has_more else None,
+            "has_more": has_more,
+        }
+
+    @classmethod
+    async def get_revision(cls, task_id: str, version: int, access: ProjectAccessContext):
+        """
+        The task's tracked fields as of `version`: the nearest snapshot at or below it plus the diffs after it.
+        Versions that changed nothing tracked (assignees, rank) resolve to the revision before them.
+        """
+        task_id = await cls._get_task_id(task_id, access)
+        version = Validator.validate_positive_integer(version, "version", min_value=1)
+
+        snapshot_version = await TaskRevision.filter(
+            task_id=task_id, is_snapshot=True, version__lte=version
+        ).order_by('-version').first().values_list('version', flat=True)
+        if snapshot_version is None:
+            raise NotFoundException(ErrorMessages.REVISION_NOT_FOUND)
+
+        revisions = await TaskRevision.filter(
+            task_id=task_id, version__gte=snapshot_version, version__lte=version
+        ).order_by('version').values('version', 'data')
+
+        state = dict(revisions[0]['data'])
+        for revision in revisions[1:]:
+            for field, value in revision['data'].items():
+                state[field] = apply_text_diff(state[field] or "", value) if isinstance(value, list) else value
+
+        return {"task_id": task_id, "version": revisions[-1]['version'], **state}
+
+    @classmethod
+    async def _get_task_id(cls, task_id: str, access: ProjectAccessContext) -> str:
+        task_id = str(uuid.UUID(Validator.validate_uuid(task_id, "task_id")))
+        if not await Task.filter(id=task_id, project_id=access.project_id).exists():
+            raise NotFoundException(ErrorMessages.TASK_NOT_FOUND)
+        return task_id
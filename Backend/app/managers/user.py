@@ -2,6 +2,7 @@ from app.models import User
 from app.exceptions import BadRequestException
 from app.utils.validator import Validator
 from app.schemas.user import UserSerializer
+from app.managers.entity_name import EntityNameManager
 from typing import Dict
 
 class UserManager:
@@ -42,5 +43,6 @@ class UserManager:
             setattr(user, key, value)
         
         await user.save()
+        await EntityNameManager.invalidate(EntityNameManager.USER, user_id)
         
         return UserSerializer.from_orm(user).dict()
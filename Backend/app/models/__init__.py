@@ -6,7 +6,13 @@ from .membership import Membership
 from .project import Project
 from .task import Task
 from .task_assignee import TaskAssignee
+from .task_tombstone import TaskTombstone
+from .task_dependency import TaskDependency
+from .task_reminder import TaskReminder
+from .task_revision import TaskRevision
 from .activity import Activity
+from .activity_rollup import ActivityRollup
+from .project_task_counter import ProjectTaskCounter
 from .notification import Notification
 from .meeting import Meeting
 from .comment import Comment
\ No newline at end of file
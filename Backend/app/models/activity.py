@@ -15,6 +15,7 @@ class ActionType(str, Enum):
     TASK_ASSIGNED = 'task_assigned'
     TASK_UNASSIGNED = 'task_unassigned'
     TASK_TITLE_UPDATED = 'task_title_updated'
+    TASKS_IMPORTED = 'tasks_imported'
 
     # Project actions
     PROJECT_CREATED = 'project_created'
@@ -54,7 +55,16 @@ class Activity(models.Model):
     created_at = fields.DatetimeField(auto_now_add=True)
 
     class Meta:
+        # Range-partitioned by month on created_at (see ActivityPartitionManager),
+        # so the primary key in the database is (id, created_at)
         table = "activities"
+        # The org feed pages newest first, optionally narrowed to an entity type or action;
+        # id breaks timestamp ties so keyset cursors can seek straight to the next page
+        indexes = [
+            ("org_id", "created_at", "id"),
+            ("org_id", "entity_type", "created_at", "id"),
+            ("org_id", "action", "created_at", "id"),
+        ]
 
     def __str__(self):
         return f"{self.action} on {self.entity_type} by user {self.user_id}"
\ No newline at end of file
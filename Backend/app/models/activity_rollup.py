@@ -0,0 +1,23 @@
+from tortoise import fields, models
+import uuid
+
+class ActivityRollup(models.Model):
+    """
+    Activity counts per organization, project, UTC day and action, kept current by the activity writer.
+    Status changes are counted per target status ('task_status_changed:done'), and imports count
+    the tasks they created rather than the one activity row.
+    """
+    id = fields.UUIDField(pk=True, default=uuid.uuid4)
+    org_id = fields.UUIDField()
+    project_id = fields.UUIDField()
+    day = fields.DateField()
+    action = fields.CharField(max_length=64)
+    count = fields.IntField(default=0)
+
+    class Meta:
+        table = "activity_rollups"
+        unique_together = ("org_id", "project_id", "day", "action")
+        indexes = [("org_id", "day")]
+
+    def __str__(self):
+        return f"ActivityRollup: {self.project_id} {self.day} {self.action}={self.count}"
@@ -8,6 +8,7 @@ class NotificationType(str, Enum):
     ORG_INVITE = "org_invite"
     MEETING = "meeting"
     CHAT = "chat"
+    TASK_DUE = "task_due"
 
 class Notification(Model):
     id = fields.UUIDField(pk=True, default=uuid.uuid4)
@@ -8,6 +8,9 @@ class Organization(models.Model):
     website = fields.CharField(max_length=255, null=True)
     description = fields.TextField(null=True)
 
+    # Days of activity history shown and kept; null means GeneralConstants.ACTIVITY_RETENTION_DAYS
+    activity_retention_days = fields.IntField(null=True)
+
     createdAt = fields.DatetimeField(auto_now_add=True)
     updatedAt = fields.DatetimeField(auto_now=True)
 
@@ -0,0 +1,25 @@
+from tortoise import fields, models
+
+class ProjectTaskCounter(models.Model):
+    """
+    Number of tasks in a project per status, updated in the same transaction as every task write
+    and periodically reconciled against the tasks table. Projects without a row have no tasks.
+    """
+    project = fields.OneToOneField(
+        'models.Project',
+        related_name='task_counter',
+        on_delete=fields.CASCADE,
+        pk=True
+    )
+    todo = fields.IntField(default=0)
+    in_progress = fields.IntField(default=0)
+    review = fields.IntField(default=0)
+    done = fields.IntField(default=0)
+    total = fields.IntField(default=0)
+    updatedAt = fields.DatetimeField(auto_now=True)
+
+    class Meta:
+        table = "project_task_counters"
+
+    def __str__(self):
+        return f"ProjectTaskCounter: {self.project_id} total={self.total}"
@@ -1,6 +1,7 @@
 from tortoise import fields, models
 import uuid
 from enum import Enum
+from app.utils.ranking import RANK_ZERO
 
 class TaskStatus(str, Enum):
     TODO = 'todo'
@@ -28,8 +29,27 @@ class Task(models.Model):
         on_delete=fields.CASCADE
     )
 
+    # Subtasks: the parent link plus the materialized path of ancestor ids (hex, each followed
+    # by '.'), so a whole subtree is one prefix range scan on (project_id, path)
+    parent = fields.ForeignKeyField(
+        'models.Task',
+        related_name='children',
+        on_delete=fields.SET_NULL,
+        null=True
+    )
+    path = fields.CharField(max_length=512, default="")
+
+    due_at = fields.DatetimeField(null=True)
+
+    # Position in a topological order of the project's dependency graph; null until the task
+    # gets its first dependency edge (maintained incrementally by TaskDependencyManager)
+    graph_order = fields.BigIntField(null=True)
+
     version = fields.IntField(default=1)
 
+    # Fractional index for manual ordering within a status column (see app.utils.ranking)
+    rank = fields.CharField(max_length=255, default=RANK_ZERO)
+
     created_by = fields.ForeignKeyField(
         'models.User',
         related_name='created_tasks',
@@ -46,6 +66,11 @@ class Task(models.Model):
             ("project",),
             ("project", "status"),
             ("project", "assignee"),
+            ("project", "updatedAt"),
+            ("project", "status", "rank"),
+            ("parent",),
+            ("project", "graph_order"),
+            ("project", "due_at"),
         ]
 
     def __str__(self):
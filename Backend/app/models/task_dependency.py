@@ -0,0 +1,41 @@
+from tortoise import fields, models
+import uuid
+
+class TaskDependency(models.Model):
+    """A "blocked by" edge: `task` cannot start until `blocker` is finished."""
+    id = fields.UUIDField(pk=True, default=uuid.uuid4)
+
+    # Both ends live in this project; keeping it on the edge lets a whole graph load in one query
+    project = fields.ForeignKeyField(
+        'models.Project',
+        related_name='task_dependencies',
+        on_delete=fields.CASCADE
+    )
+    task = fields.ForeignKeyField(
+        'models.Task',
+        related_name='blocked_by',
+        on_delete=fields.CASCADE
+    )
+    blocker = fields.ForeignKeyField(
+        'models.Task',
+        related_name='blocking',
+        on_delete=fields.CASCADE
+    )
+    created_by = fields.ForeignKeyField(
+        'models.User',
+        related_name='created_task_dependencies',
+        on_delete=fields.SET_NULL,
+        null=True
+    )
+    createdAt = fields.DatetimeField(auto_now_add=True)
+
+    class Meta:
+        table = "task_dependencies"
+        unique_together = ("task", "blocker")
+        indexes = [
+            ("project",),
+            ("blocker",),
+        ]
+
+    def __str__(self):
+        return f"TaskDependency: {self.blocker_id} -> {self.task_id}"
@@ -0,0 +1,22 @@
+from tortoise import fields, models
+import uuid
+
+class TaskReminder(models.Model):
+    """The pending (or last sent) due-date reminder of a task; one row per task."""
+    id = fields.UUIDField(pk=True, default=uuid.uuid4)
+    task = fields.OneToOneField(
+        'models.Task',
+        related_name='reminder',
+        on_delete=fields.CASCADE
+    )
+    remind_at = fields.DatetimeField()
+    # Null while pending. The scheduler polls a partial index on remind_at over pending rows
+    # only (created in the migration), so sent reminders never slow the poll down
+    sent_at = fields.DatetimeField(null=True)
+    createdAt = fields.DatetimeField(auto_now_add=True)
+
+    class Meta:
+        table = "task_reminders"
+
+    def __str__(self):
+        return f"TaskReminder: {self.task_id} at {self.remind_at}"
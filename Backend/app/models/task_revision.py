@@ -0,0 +1,33 @@
+from tortoise import fields, models
+import uuid
+
+class TaskRevision(models.Model):
+    id = fields.UUIDField(pk=True, default=uuid.uuid4)
+    task = fields.ForeignKeyField(
+        'models.Task',
+        related_name='revisions',
+        on_delete=fields.CASCADE
+    )
+    # The task version this revision produced
+    version = fields.IntField()
+
+    # Snapshots hold every tracked field; other revisions hold only the fields that changed,
+    # with long text stored as a diff against the previous revision (see app.utils.text_diff)
+    is_snapshot = fields.BooleanField(default=False)
+    data = fields.JSONField()
+    changed_fields = fields.JSONField(default=list)
+
+    user = fields.ForeignKeyField(
+        'models.User',
+        related_name='task_revisions',
+        on_delete=fields.SET_NULL,
+        null=True
+    )
+    createdAt = fields.DatetimeField(auto_now_add=True)
+
+    class Meta:
+        table = "task_revisions"
+        unique_together = ("task", "version")
+
+    def __str__(self):
+        return f"TaskRevision: {self.task_id} v{self.version}"
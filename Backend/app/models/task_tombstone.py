@@ -0,0 +1,25 @@
+from tortoise import fields, models
+import uuid
+
+class TaskTombstone(models.Model):
+    id = fields.UUIDField(pk=True, default=uuid.uuid4)
+
+    # The deleted task no longer exists, so this is a plain id rather than a foreign key
+    task_id = fields.UUIDField()
+
+    project = fields.ForeignKeyField(
+        'models.Project',
+        related_name='task_tombstones',
+        on_delete=fields.CASCADE
+    )
+
+    deletedAt = fields.DatetimeField(auto_now_add=True)
+
+    class Meta:
+        table = "task_tombstones"
+        indexes = [
+            ("project", "deletedAt"),
+        ]
+
+    def __str__(self):
+        return f"TaskTombstone: {self.task_id}"
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, Request, Query
 from fastapi.responses import JSONResponse
-from typing import Optional
+from typing import Optional, List
+from datetime import date
 from app.dependencies import require_user, require_org_membership, require_role
 from app.utils import ApiResponse
 from app.managers.activity import ActivityManager
@@ -21,7 +22,9 @@ async def get_organization_activities(
     page: int = Query(1, ge=1, description="Page number (1-indexed)"),
     page_size: int = Query(50, ge=1, le=100, description="Number of items per page (max 100)"),
     entity_type: Optional[str] = Query(None, description="Filter by entity type (task, project, organization)"),
-    action_type: Optional[str] = Query(None, description="Filter by action type")
+    action_type: Optional[str] = Query(None, description="Filter by action type"),
+    cursor: Optional[str] = Query(None, description="Opaque keyset cursor from next_cursor; pass an empty value to start cursor pagination"),
+    include_total: Optional[bool] = Query(None, description="Include the total count (default: on for page mode, off for cursor mode)")
 ):
     result = await ActivityManager.get_organization_activities(
         org_id=org_id,
@@ -29,7 +32,32 @@ async def get_organization_activities(
         page=page,
         page_size=page_size,
         entity_type=entity_type,
-        action_type=action_type
+        action_type=action_type,
+        cursor=cursor,
+        include_total=include_total
     )
     content = ApiResponse(success=True, message="Activities retrieved successfully", data=result)
     return JSONResponse(content=content, status_code=200)
+
+
+@router.get("/timeseries")
+async def get_activity_timeseries(
+    org_id: str,
+    request: Request,
+    user=Depends(require_user),
+    membership=Depends(require_org_membership()),
+    role=Depends(require_role(["admin", "owner"])),
+    start: Optional[date] = Query(None, description="First day (UTC), default 29 days before end"),
+    end: Optional[date] = Query(None, description="Last day (UTC), default today"),
+    project_id: Optional[str] = Query(None, description="Only this project"),
+    action: Optional[List[str]] = Query(None, description="Only these actions; status changes are 'task_status_changed:<status>'")
+):
+    result = await ActivityManager.get_activity_timeseries(
+        org_id=org_id,
+        start=start,
+        end=end,
+        project_id=project_id,
+        actions=action
+    )
+    content = ApiResponse(success=True, message="Activity time series retrieved successfully", data=result)
+    return JSONResponse(content=content, status_code=200)
@@ -4,6 +4,7 @@ from typing import Optional
 
 from app.dependencies import require_user
 from app.utils import ApiResponse
+from app.utils.etag import make_etag, etag_matches, etag_headers, not_modified
 from app.managers.common import CommonManager
 from app.managers.task import TaskManager
 from app.managers.dashboard import DashboardManager
@@ -32,19 +33,34 @@ async def list_my_tasks(
     page: int = Query(1, ge=1, description="Page number (1-indexed)"),
     page_size: int = Query(20, ge=1, le=100, description="Number of items per page (max 100)"),
     status: Optional[str] = Query(None, description="Filter by task status (todo, in_progress, review, done)"),
-    sort_by: str = Query("updatedAt", description="Field to sort by (updatedAt, createdAt, title, status)"),
-    sort_order: str = Query("desc", description="Sort order (asc or desc)")
+    sort_by: str = Query("updatedAt", description="Field to sort by (updatedAt, createdAt, title, status, rank)"),
+    sort_order: str = Query("desc", description="Sort order (asc or desc)"),
+    cursor: Optional[str] = Query(None, description="Opaque keyset cursor from next_cursor; pass an empty value to start cursor pagination"),
+    include_total: Optional[bool] = Query(None, description="Include the total count (default: on for page mode, off for cursor mode)")
 ):
+    # As for project task lists: tagged on revalidation, never in cursor mode
+    etag = None
+    if cursor is None and request.headers.get("if-none-match"):
+        fingerprint = await TaskManager.get_my_tasks_fingerprint(str(user.get('user_id')))
+        etag = make_etag(
+            user.get('user_id'), fingerprint['count'], fingerprint['last_updated'], fingerprint['assignees_updated'],
+            request.url.query
+        )
+        if etag_matches(request, etag):
+            return not_modified(etag)
+
     result = await TaskManager.list_my_tasks(
         user_id=str(user.get('user_id')),
         page=page,
         page_size=page_size,
         status=status,
         sort_by=sort_by,
-        sort_order=sort_order
+        sort_order=sort_order,
+        cursor=cursor,
+        include_total=include_total
     )
     content = ApiResponse(success=True, message="My tasks retrieved successfully", data=result)
-    return JSONResponse(content=content, status_code=200)
+    return JSONResponse(content=content, status_code=200, headers=etag_headers(etag) if etag else None)
 
 @router.get("/dashboard/analytics")
 async def get_dashboard_analytics(
@@ -1,9 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Request, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from app.dependencies import require_user, require_org_membership, require_role
 from app.utils import ApiResponse
 from app.managers.organization import OrganizationManager
 from app.managers.notification import NotificationManager
+from app.managers.task import TaskManager
+from app.constants import GeneralConstants
 from app.models import Organization, User
 from app.core.websocket_manager import websocket_manager
 
@@ -64,6 +66,23 @@ async def get_organization(
     return JSONResponse(content=content, status_code=200)
 
 
+@router.get('/{org_id}/tasks/export')
+async def export_organization_tasks(
+    org_id: str,
+    request: Request,
+    membership=Depends(require_org_membership()),
+    role=Depends(require_role(["member", "admin", "owner"])),
+    format: str = Query("ndjson", description="Export format (ndjson or csv)")
+):
+
+    stream = await TaskManager.export_organization_tasks(org_id, format)
+    return StreamingResponse(
+        stream,
+        media_type=GeneralConstants.EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="tasks-{org_id}.{format}"'}
+    )
+
+
 @router.get('/{org_id}/members')
 async def get_organization_members(
     org_id: str,
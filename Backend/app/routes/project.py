@@ -2,6 +2,7 @@ from fastapi import APIRouter, Request, Depends, HTTPException, status
 from fastapi.responses import JSONResponse
 from app.dependencies import require_org_membership, require_user, require_role, project_access
 from app.utils import ApiResponse
+from app.utils.etag import make_etag, etag_matches, etag_headers, not_modified
 from app.managers.project import ProjectManager
 
 router = APIRouter(
@@ -31,10 +32,15 @@ async def list_projects(
     role=Depends(require_role(["member", "admin", "owner"]))
 ):
 
+    fingerprint = await ProjectManager.get_projects_fingerprint(membership.organizationId)
+    etag = make_etag(membership.organizationId, fingerprint['count'], fingerprint['last_updated'])
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
     payload = {}
     result = await ProjectManager.list_all_projects(payload, membership, role)
     content = ApiResponse(success=True, message="Projects retrieved successfully", data=result)
-    return JSONResponse(content=content, status_code=200)
+    return JSONResponse(content=content, status_code=200, headers=etag_headers(etag))
 
 @router.get('/archived')
 async def list_archived_projects(
@@ -55,9 +61,13 @@ async def get_project(
     project=Depends(project_access())
 ):
     # project_access() already fetched and validated the project
+    etag = make_etag(project.id, project.updatedAt)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
     result = ProjectManager.get_project_from_orm(project)
     content = ApiResponse(success=True, message="Project retrieved successfully", data=result)
-    return JSONResponse(content=content, status_code=200)
+    return JSONResponse(content=content, status_code=200, headers=etag_headers(etag))
 
 @router.put('/{project_id}')
 async def update_project(
@@ -1,10 +1,16 @@
-from fastapi import APIRouter, Request, Depends, HTTPException, status, Query
-from fastapi.responses import JSONResponse
-from app.dependencies import require_user, require_org_membership, require_role, project_access
+from fastapi import APIRouter, Request, Depends, HTTPException, status, Query, BackgroundTasks, UploadFile, File
+from fastapi.responses import JSONResponse, StreamingResponse
+from app.dependencies import require_org_membership, require_role, project_access_context
 from app.utils import ApiResponse
+from app.utils.etag import make_etag, etag_matches, etag_headers, not_modified
 from app.managers.task import TaskManager
+from app.managers.task_dependency import TaskDependencyManager
+from app.managers.task_revision import TaskRevisionManager
+from app.constants import GeneralConstants
 from app.schemas.task import CREATE_TASK_SCHEMA, UPDATE_TASK_SCHEMA, ASSIGN_TASK_SCHEMA, CHANGE_STATUS_SCHEMA
 from typing import Optional
+from datetime import datetime
+import uuid
 
 router = APIRouter(
     prefix="/organizations/{org_id}/projects/{project_id}/tasks",
@@ -17,15 +23,12 @@ async def create_task(
     org_id: str,
     project_id: str,
     request: Request,
-    user=Depends(require_user),
-    project=Depends(project_access())
+    access=Depends(project_access_context(require_write=True))
 ):
 
     payload = await request.json()
 
-    await TaskManager.validate_project_access(project_id, str(user.get('user_id')), require_write=True)
-
-    result = await TaskManager.create_task(payload, project_id, str(user.get('user_id')))
+    result = await TaskManager.create_task(payload, access)
     content = ApiResponse(success=True, message="Task created successfully", data=result)
     return JSONResponse(content=content, status_code=201)
 
@@ -35,25 +38,183 @@ async def list_tasks(
     org_id: str,
     project_id: str,
     request: Request,
-    project=Depends(project_access()),
+    access=Depends(project_access_context()),
     page: int = Query(1, ge=1, description="Page number (1-indexed)"),
     page_size: int = Query(20, ge=1, le=100, description="Number of items per page (max 100)"),
     status: Optional[str] = Query(None, description="Filter by task status (todo, in_progress, review, done)"),
     assignee_id: Optional[str] = Query(None, description="Filter by assignee user ID"),
-    sort_by: str = Query("updatedAt", description="Field to sort by (updatedAt, createdAt, title, status)"),
-    sort_order: str = Query("desc", description="Sort order (asc or desc)")
+    sort_by: str = Query("updatedAt", description="Field to sort by (updatedAt, createdAt, title, status, rank, due_at)"),
+    sort_order: str = Query("desc", description="Sort order (asc or desc)"),
+    cursor: Optional[str] = Query(None, description="Opaque keyset cursor from next_cursor; pass an empty value to start cursor pagination"),
+    include_total: Optional[bool] = Query(None, description="Include the total count (default: on for page mode, off for cursor mode)"),
+    due_before: Optional[datetime] = Query(None, description="Only tasks due before this time"),
+    due_after: Optional[datetime] = Query(None, description="Only tasks due at or after this time")
 ):
 
+    # Only revalidations pay for the fingerprint query, and cursor pages aren't tagged at all.
+    # The tag covers the whole project, so any task write changes it whatever the filters
+    etag = None
+    if cursor is None and request.headers.get("if-none-match"):
+        fingerprint = await TaskManager.get_project_tasks_fingerprint(access)
+        etag = make_etag(
+            project_id, fingerprint['count'], fingerprint['last_updated'], fingerprint['assignees_updated'],
+            request.url.query
+        )
+        if etag_matches(request, etag):
+            return not_modified(etag)
+
     result = await TaskManager.list_tasks_by_project(
-        project_id=project_id,
+        access=access,
         page=page,
         page_size=page_size,
         status=status,
         assignee_id=assignee_id,
         sort_by=sort_by,
-        sort_order=sort_order
+        sort_order=sort_order,
+        cursor=cursor,
+        include_total=include_total,
+        due_before=due_before,
+        due_after=due_after
     )
     content = ApiResponse(success=True, message="Tasks retrieved successfully", data=result)
+    return JSONResponse(content=content, status_code=200, headers=etag_headers(etag) if etag else None)
+
+@router.get('/board')
+async def get_board(
+    org_id: str,
+    project_id: str,
+    request: Request,
+    access=Depends(project_access_context()),
+    per_column: int = Query(20, ge=1, le=100, description="Number of tasks returned per status column (max 100)"),
+    assignee_id: Optional[str] = Query(None, description="Filter by assignee user ID")
+):
+
+    result = await TaskManager.get_board(access=access, per_column=per_column, assignee_id=assignee_id)
+    content = ApiResponse(success=True, message="Board retrieved successfully", data=result)
+    return JSONResponse(content=content, status_code=200)
+
+@router.get('/changes')
+async def list_task_changes(
+    org_id: str,
+    project_id: str,
+    request: Request,
+    access=Depends(project_access_context()),
+    since: Optional[str] = Query(None, description="Watermark cursor from a previous next_cursor; omit for a full sync"),
+    limit: int = Query(100, ge=1, le=500, description="Maximum tasks and tombstones per response (max 500)")
+):
+
+    result = await TaskManager.list_task_changes(access=access, since=since, limit=limit)
+    content = ApiResponse(success=True, message="Task changes retrieved successfully", data=result)
+    return JSONResponse(content=content, status_code=200)
+
+@router.get('/export')
+async def export_tasks(
+    org_id: str,
+    project_id: str,
+    request: Request,
+    access=Depends(project_access_context()),
+    format: str = Query("ndjson", description="Export format (ndjson or csv)")
+):
+
+    stream = TaskManager.export_project_tasks(access, format)
+    return StreamingResponse(
+        stream,
+        media_type=GeneralConstants.EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="tasks-{access.project_id}.{format}"'}
+    )
+
+@router.post('/import')
+async def import_tasks(
+    org_id: str,
+    project_id: str,
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(..., description="NDJSON or CSV file, e.g. a previous export"),
+    format: Optional[str] = Query(None, description="Import format (ndjson or csv); defaults to the file extension"),
+    access=Depends(project_access_context(require_write=True))
+):
+
+    job, path = await TaskManager.start_import(file, format, access)
+    background_tasks.add_task(TaskManager.run_import, job, path, access)
+    content = ApiResponse(success=True, message="Task import started", data=job)
+    return JSONResponse(content=content, status_code=202)
+
+@router.get('/import/{import_id}')
+async def get_import(
+    org_id: str,
+    project_id: str,
+    import_id: str,
+    access=Depends(project_access_context())
+):
+
+    result = await TaskManager.get_import(import_id, access)
+    content = ApiResponse(success=True, message="Task import fetched successfully", data=result)
+    return JSONResponse(content=content, status_code=200)
+
+@router.get('/dependency-graph')
+async def get_dependency_graph(
+    org_id: str,
+    project_id: str,
+    access=Depends(project_access_context())
+):
+
+    result = await TaskDependencyManager.get_dependency_graph(access)
+    content = ApiResponse(success=True, message="Dependency graph fetched successfully", data=result)
+    return JSONResponse(content=content, status_code=200)
+
+@router.post('/bulk')
+async def bulk_create_tasks(
+    org_id: str,
+    project_id: str,
+    request: Request,
+    access=Depends(project_access_context(require_write=True))
+):
+
+    payload = await request.json()
+
+    result = await TaskManager.bulk_create_tasks(payload, access)
+    content = ApiResponse(success=True, message="Tasks created successfully", data=result)
+    return JSONResponse(content=content, status_code=201)
+
+@router.put('/bulk')
+async def bulk_update_tasks(
+    org_id: str,
+    project_id: str,
+    request: Request,
+    access=Depends(project_access_context(require_write=True))
+):
+
+    payload = await request.json()
+
+    result = await TaskManager.bulk_update_tasks(payload, access)
+    content = ApiResponse(success=True, message="Tasks updated successfully", data=result)
+    return JSONResponse(content=content, status_code=200)
+
+@router.put('/bulk/status')
+async def bulk_change_task_status(
+    org_id: str,
+    project_id: str,
+    request: Request,
+    access=Depends(project_access_context(require_write=True))
+):
+
+    payload = await request.json()
+
+    result = await TaskManager.bulk_change_task_status(payload, access)
+    content = ApiResponse(success=True, message="Task statuses updated successfully", data=result)
+    return JSONResponse(content=content, status_code=200)
+
+@router.put('/bulk/assign')
+async def bulk_assign_tasks(
+    org_id: str,
+    project_id: str,
+    request: Request,
+    access=Depends(project_access_context(require_write=True))
+):
+
+    payload = await request.json()
+
+    result = await TaskManager.bulk_assign_tasks(payload, access)
+    content = ApiResponse(success=True, message="Tasks assigned successfully", data=result)
     return JSONResponse(content=content, status_code=200)
 
 @router.get('/{task_id}')
@@ -62,12 +223,21 @@ async def get_task(
     project_id: str,
     task_id: str,
     request: Request,
-    project=Depends(project_access())
+    access=Depends(project_access_context())
 ):
 
-    result = await TaskManager.get_task(task_id, project_id=project_id)
+    # Revalidation only needs the version, not the serialized task
+    if request.headers.get("if-none-match"):
+        version = await TaskManager.get_task_version(task_id, access)
+        if version is not None:
+            # Same canonical id as the full response's ETag, however the path spelled it
+            etag = make_etag(str(uuid.UUID(task_id)), version)
+            if etag_matches(request, etag):
+                return not_modified(etag)
+
+    result = await TaskManager.get_task(task_id, access)
     content = ApiResponse(success=True, message="Task retrieved successfully", data=result)
-    return JSONResponse(content=content, status_code=200)
+    return JSONResponse(content=content, status_code=200, headers=etag_headers(make_etag(result['id'], result['version'])))
 
 @router.put('/{task_id}')
 async def update_task(
@@ -75,15 +245,12 @@ async def update_task(
     project_id: str,
     task_id: str,
     request: Request,
-    user: dict = Depends(require_user),
-    project=Depends(project_access())
+    access=Depends(project_access_context(require_write=True))
 ):
 
     payload = await request.json()
 
-    await TaskManager.validate_project_access(project_id, str(user.get('user_id')), require_write=True)
-
-    result = await TaskManager.update_task(task_id, payload, str(user.get('user_id')), project_id=project_id)
+    result = await TaskManager.update_task(task_id, payload, access)
     content = ApiResponse(success=True, message="Task updated successfully", data=result)
     return JSONResponse(content=content, status_code=200)
 
@@ -93,15 +260,12 @@ async def assign_task(
     project_id: str,
     task_id: str,
     request: Request,
-    user: dict = Depends(require_user),
-    project=Depends(project_access())
+    access=Depends(project_access_context(require_write=True))
 ):
 
     payload = await request.json()
 
-    await TaskManager.validate_project_access(project_id, str(user.get('user_id')), require_write=True)
-
-    result = await TaskManager.assign_task(task_id, payload, str(user.get('user_id')), project_id=project_id)
+    result = await TaskManager.assign_task(task_id, payload, access)
     content = ApiResponse(success=True, message="Task assigned successfully", data=result)
     return JSONResponse(content=content, status_code=200)
 
@@ -111,29 +275,153 @@ async def change_task_status(
     project_id: str,
     task_id: str,
     request: Request,
-    user=Depends(require_user),
-    project=Depends(project_access())
+    access=Depends(project_access_context(require_write=True))
 ):
 
     payload = await request.json()
 
-    await TaskManager.validate_project_access(project_id, str(user.get('user_id')), require_write=True)
-
-    result = await TaskManager.change_task_status(task_id, payload, str(user.get('user_id')), project_id=project_id)
+    result = await TaskManager.change_task_status(task_id, payload, access)
     content = ApiResponse(success=True, message="Task status updated successfully", data=result)
     return JSONResponse(content=content, status_code=200)
 
+@router.put('/{task_id}/move')
+async def move_task(
+    org_id: str,
+    project_id: str,
+    task_id: str,
+    request: Request,
+    background_tasks: BackgroundTasks,
+    access=Depends(project_access_context(require_write=True))
+):
+
+    payload = await request.json()
+
+    result = await TaskManager.move_task(task_id, payload, access)
+
+    # Repeated moves into the same gap lengthen ranks; renumber that column after responding
+    if TaskManager.rank_needs_rebalance(result['rank']):
+        background_tasks.add_task(TaskManager.rebalance_ranks, result['project_id'], result['status'])
+
+    content = ApiResponse(success=True, message="Task moved successfully", data=result)
+    return JSONResponse(content=content, status_code=200)
+
+@router.put('/{task_id}/parent')
+async def set_task_parent(
+    org_id: str,
+    project_id: str,
+    task_id: str,
+    request: Request,
+    access=Depends(project_access_context(require_write=True))
+):
+
+    payload = await request.json()
+
+    result = await TaskManager.set_parent(task_id, payload, access)
+    content = ApiResponse(success=True, message="Task parent updated successfully", data=result)
+    return JSONResponse(content=content, status_code=200)
+
+@router.get('/{task_id}/subtasks')
+async def list_subtasks(
+    org_id: str,
+    project_id: str,
+    task_id: str,
+    access=Depends(project_access_context()),
+    recursive: bool = Query(False, description="Include all descendants, not only direct children"),
+    limit: int = Query(100, ge=1, le=GeneralConstants.SUBTASK_LIST_LIMIT, description="Maximum number of subtasks to return"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page")
+):
+
+    result = await TaskManager.list_subtasks(task_id, access, recursive=recursive, limit=limit, cursor=cursor)
+    content = ApiResponse(success=True, message="Subtasks fetched successfully", data=result)
+    return JSONResponse(content=content, status_code=200)
+
+@router.get('/{task_id}/rollup')
+async def get_subtask_rollup(
+    org_id: str,
+    project_id: str,
+    task_id: str,
+    access=Depends(project_access_context())
+):
+
+    result = await TaskManager.get_subtask_rollup(task_id, access)
+    content = ApiResponse(success=True, message="Subtask rollup fetched successfully", data=result)
+    return JSONResponse(content=content, status_code=200)
+
+@router.get('/{task_id}/dependencies')
+async def list_task_dependencies(
+    org_id: str,
+    project_id: str,
+    task_id: str,
+    access=Depends(project_access_context())
+):
+
+    result = await TaskDependencyManager.list_task_dependencies(task_id, access)
+    content = ApiResponse(success=True, message="Task dependencies fetched successfully", data=result)
+    return JSONResponse(content=content, status_code=200)
+
+@router.post('/{task_id}/dependencies')
+async def add_task_dependency(
+    org_id: str,
+    project_id: str,
+    task_id: str,
+    request: Request,
+    access=Depends(project_access_context(require_write=True))
+):
+
+    payload = await request.json()
+
+    result = await TaskDependencyManager.add_dependency(task_id, payload, access)
+    content = ApiResponse(success=True, message="Task dependency added successfully", data=result)
+    return JSONResponse(content=content, status_code=201)
+
+@router.delete('/{task_id}/dependencies/{blocker_id}')
+async def remove_task_dependency(
+    org_id: str,
+    project_id: str,
+    task_id: str,
+    blocker_id: str,
+    access=Depends(project_access_context(require_write=True))
+):
+
+    await TaskDependencyManager.remove_dependency(task_id, blocker_id, access)
+    content = ApiResponse(success=True, message="Task dependency removed successfully")
+    return JSONResponse(content=content, status_code=200)
+
+@router.get('/{task_id}/revisions')
+async def list_task_revisions(
+    org_id: str,
+    project_id: str,
+    task_id: str,
+    access=Depends(project_access_context()),
+    limit: int = Query(20, ge=1, le=GeneralConstants.TASK_REVISION_PAGE_LIMIT, description="Maximum number of revisions to return"),
+    before_version: Optional[int] = Query(None, ge=1, description="next_before_version from the previous page")
+):
+
+    result = await TaskRevisionManager.list_revisions(task_id, access, limit=limit, before_version=before_version)
+    content = ApiResponse(success=True, message="Task revisions fetched successfully", data=result)
+    return JSONResponse(content=content, status_code=200)
+
+@router.get('/{task_id}/revisions/{version}')
+async def get_task_revision(
+    org_id: str,
+    project_id: str,
+    task_id: str,
+    version: int,
+    access=Depends(project_access_context())
+):
+
+    result = await TaskRevisionManager.get_revision(task_id, version, access)
+    content = ApiResponse(success=True, message="Task revision fetched successfully", data=result)
+    return JSONResponse(content=content, status_code=200)
+
 @router.delete('/{task_id}')
 async def delete_task(
     org_id: str,
     project_id: str,
     task_id: str,
-    user=Depends(require_user),
-    project=Depends(project_access())
+    access=Depends(project_access_context(require_write=True))
 ):
 
-    await TaskManager.validate_project_access(project_id, str(user.get('user_id')), require_write=True)
-
-    await TaskManager.delete_task(task_id, project_id=project_id)
+    await TaskManager.delete_task(task_id, access)
     content = ApiResponse(success=True, message="Task deleted successfully")
     return JSONResponse(content=content, status_code=200)
\ No newline at end of file
@@ -1,4 +1,5 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+from app.constants import GeneralConstants
 from app.models import Organization
 from datetime import datetime
 
@@ -13,6 +14,10 @@ class UPDATE_ORGANIZATION_SCHEMA(BaseModel):
     address: str | None = None
     website: str | None = None
     description: str | None = None
+    # Null restores the default retention
+    activity_retention_days: int | None = Field(
+        None, ge=GeneralConstants.ACTIVITY_RETENTION_MIN_DAYS, le=GeneralConstants.ACTIVITY_RETENTION_MAX_DAYS
+    )
 
 # Custom serializer for Organization model to handle UUID and datetime serialization
 class OrganizationSerializer(BaseModel):
@@ -21,6 +26,7 @@ class OrganizationSerializer(BaseModel):
     address: str | None
     website: str | None
     description: str | None
+    activity_retention_days: int
     createdAt: str
     updatedAt: str
 
@@ -35,6 +41,7 @@ class OrganizationSerializer(BaseModel):
             address=org.address,
             website=org.website,
             description=org.description,
+            activity_retention_days=org.activity_retention_days or GeneralConstants.ACTIVITY_RETENTION_DAYS,
             createdAt=org.createdAt.isoformat(),
             updatedAt=org.updatedAt.isoformat(),
         )
\ No newline at end of file
@@ -1,19 +1,26 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, AfterValidator
 from app.models import Task
-from datetime import datetime
-from typing import Optional, List
+from app.constants import GeneralConstants
+from datetime import datetime, timezone
+from typing import Optional, List, Dict, Tuple, Annotated
+
+# Due dates without an offset are taken as UTC
+DueDate = Annotated[datetime, AfterValidator(lambda value: value if value.tzinfo else value.replace(tzinfo=timezone.utc))]
 
 class CREATE_TASK_SCHEMA(BaseModel):
     title: str
     description: str | None = None
     status: str = "todo"
     assignee_ids: List[str] = Field(default_factory=list)
+    parent_id: str | None = None
+    due_at: DueDate | None = None
 
 class UPDATE_TASK_SCHEMA(BaseModel):
     title: str | None = None
     description: str | None = None
     status: str | None = None
     assignee_ids: List[str] | None = None
+    due_at: DueDate | None = None  # Send null to clear the due date
     version: int  # Required for optimistic locking
 
 class ASSIGN_TASK_SCHEMA(BaseModel):
@@ -24,11 +31,66 @@ class CHANGE_STATUS_SCHEMA(BaseModel):
     status: str
     version: int
 
+class MOVE_TASK_SCHEMA(BaseModel):
+    status: str | None = None  # Target column; defaults to the task's current status
+    after_id: str | None = None  # Place directly below this task
+    before_id: str | None = None  # Place directly above this task
+    version: int
+
+class SET_PARENT_SCHEMA(BaseModel):
+    parent_id: str | None = None  # None detaches the task to the top level
+    version: int
+
+class ADD_DEPENDENCY_SCHEMA(BaseModel):
+    blocker_id: str  # The task that must be finished first
+
+# Bulk operation schemas: each item carries its own task id and version
+class BULK_CREATE_TASK_SCHEMA(BaseModel):
+    tasks: List[CREATE_TASK_SCHEMA] = Field(min_length=1, max_length=GeneralConstants.BULK_TASK_LIMIT)
+
+class BULK_UPDATE_TASK_ITEM_SCHEMA(UPDATE_TASK_SCHEMA):
+    id: str
+
+class BULK_UPDATE_TASK_SCHEMA(BaseModel):
+    tasks: List[BULK_UPDATE_TASK_ITEM_SCHEMA] = Field(min_length=1, max_length=GeneralConstants.BULK_TASK_LIMIT)
+
+class BULK_CHANGE_STATUS_ITEM_SCHEMA(CHANGE_STATUS_SCHEMA):
+    id: str
+
+class BULK_CHANGE_STATUS_SCHEMA(BaseModel):
+    tasks: List[BULK_CHANGE_STATUS_ITEM_SCHEMA] = Field(min_length=1, max_length=GeneralConstants.BULK_TASK_LIMIT)
+
+class BULK_ASSIGN_TASK_ITEM_SCHEMA(ASSIGN_TASK_SCHEMA):
+    id: str
+
+class BULK_ASSIGN_TASK_SCHEMA(BaseModel):
+    tasks: List[BULK_ASSIGN_TASK_ITEM_SCHEMA] = Field(min_length=1, max_length=GeneralConstants.BULK_TASK_LIMIT)
+
+async def load_assignees(task_ids: List[str]) -> Dict[str, Tuple[List[str], List[str]]]:
+    """Fetch assignee ids and display names for many tasks with a single JOIN query."""
+    from app.models import TaskAssignee
+
+    assignees: Dict[str, Tuple[List[str], List[str]]] = {}
+    if not task_ids:
+        return assignees
+
+    rows = await TaskAssignee.filter(task_id__in=task_ids).values(
+        'task_id', 'user_id', 'user__firstName', 'user__lastName'
+    )
+    for row in rows:
+        ids, names = assignees.setdefault(str(row['task_id']), ([], []))
+        ids.append(str(row['user_id']))
+        names.append(f"{row['user__firstName']} {row['user__lastName']}".strip())
+    return assignees
+
 # Lightweight list response schema (excludes description and other heavy fields)
 class TaskListSerializer(BaseModel):
     id: str
     title: str
     status: str
+    rank: str
+    parent_id: str | None = None
+    due_at: str | None = None
     assignee_ids: List[str] = Field(default_factory=list)
     assignee_names: List[str] = Field(default_factory=list)
     project_id: str
@@ -52,6 +114,18 @@ class TaskListSerializer(BaseModel):
             if ta.user
         ]
         
+        return cls._build(task, assignee_ids, assignee_names)
+
+    @classmethod
+    async def from_orm_batch(cls, tasks: List[Task]) -> List["TaskListSerializer"]:
+        assignees = await load_assignees([str(task.id) for task in tasks])
+        return [
+            cls._build(task, *assignees.get(str(task.id), ([], [])))
+            for task in tasks
+        ]
+
+    @classmethod
+    def _build(cls, task: Task, assignee_ids: List[str], assignee_names: List[str]):
         # Get org_id from project if available
         org_id = None
         if hasattr(task, 'project') and task.project:
@@ -64,6 +138,9 @@ class TaskListSerializer(BaseModel):
             id=str(task.id),
             title=task.title,
             status=task.status,
+            rank=task.rank,
+            parent_id=str(task.parent_id) if task.parent_id else None,
+            due_at=task.due_at.isoformat() if task.due_at else None,
             assignee_ids=assignee_ids,
             assignee_names=assignee_names,
             project_id=str(task.project_id),
@@ -79,6 +156,9 @@ class TaskDetailSerializer(BaseModel):
     title: str
     description: str | None
     status: str
+    rank: str
+    parent_id: str | None = None
+    due_at: str | None = None
     assignee_ids: List[str] = Field(default_factory=list)
     assignee_names: List[str] = Field(default_factory=list)
     project_id: str
@@ -112,6 +192,9 @@ class TaskDetailSerializer(BaseModel):
             title=task.title,
             description=task.description,
             status=task.status,
+            rank=task.rank,
+            parent_id=str(task.parent_id) if task.parent_id else None,
+            due_at=task.due_at.isoformat() if task.due_at else None,
             assignee_ids=assignee_ids,
             assignee_names=assignee_names,
             project_id=str(task.project_id),
@@ -136,6 +219,9 @@ class TaskSerializer(BaseModel):
     title: str
     description: str | None
     status: str
+    rank: str
+    parent_id: str | None = None
+    due_at: str | None = None
     assignee_ids: List[str] = Field(default_factory=list)
     assignee_names: List[str] = Field(default_factory=list)
     project_id: str
@@ -159,11 +245,26 @@ class TaskSerializer(BaseModel):
             if ta.user
         ]
         
+        return cls._build(task, assignee_ids, assignee_names)
+
+    @classmethod
+    async def from_orm_batch(cls, tasks: List[Task]) -> List["TaskSerializer"]:
+        assignees = await load_assignees([str(task.id) for task in tasks])
+        return [
+            cls._build(task, *assignees.get(str(task.id), ([], [])))
+            for task in tasks
+        ]
+
+    @classmethod
+    def _build(cls, task: Task, assignee_ids: List[str], assignee_names: List[str]):
         return cls(
             id=str(task.id),
             title=task.title,
             description=task.description,
             status=task.status,
+            rank=task.rank,
+            parent_id=str(task.parent_id) if task.parent_id else None,
+            due_at=task.due_at.isoformat() if task.due_at else None,
             assignee_ids=assignee_ids,
             assignee_names=assignee_names,
             project_id=str(task.project_id),
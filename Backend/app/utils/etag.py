@@ -0,0 +1,34 @@
+from fastapi import Request
+from fastapi.responses import Response
+from datetime import datetime
+from typing import Any, Dict
+import hashlib
+
+
+def make_etag(*parts: Any) -> str:
+    """Weak validator built from whatever identifies the current representation."""
+    raw = ":".join(part.isoformat() if isinstance(part, datetime) else str(part) for part in parts)
+    return f'W/"{hashlib.sha1(raw.encode()).hexdigest()}"'
+
+
+def etag_headers(etag: str) -> Dict[str, str]:
+    # Responses are per-user, so only the client may keep them and it must revalidate
+    return {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+
+    # If-None-Match uses weak comparison: W/"x" and "x" are the same tag
+    tag = etag.removeprefix("W/")
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == tag:
+            return True
+    return False
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers=etag_headers(etag))
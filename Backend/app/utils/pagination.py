@@ -0,0 +1,43 @@
+from app.exceptions import BadRequestException
+from datetime import datetime
+from enum import Enum
+from typing import Any, List, Tuple
+import base64
+import json
+
+
+def encode_cursor(*values: Any) -> str:
+    parts = []
+    for value in values:
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        elif isinstance(value, Enum):
+            value = value.value
+        parts.append(str(value))
+    raw = json.dumps(parts, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        parts = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        raise BadRequestException("Invalid cursor")
+
+    if not isinstance(parts, list) or len(parts) != size or not all(isinstance(p, str) for p in parts):
+        raise BadRequestException("Invalid cursor")
+
+    return parts
+
+
+def parse_cursor_datetime(value: str) -> datetime:
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise BadRequestException("Invalid cursor")
+
+
+def keyset_page(rows: list, page_size: int) -> Tuple[list, bool]:
+    """Split a page fetched with limit(page_size + 1) into (items, has_more)."""
+    return rows[:page_size], len(rows) > page_size
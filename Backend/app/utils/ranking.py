@@ -0,0 +1,139 @@
+"""
+Fractional ranks for manual task ordering.
+
+A rank is an integer part followed by an optional fraction. The head digit of the
+integer part encodes its length, so appending at either end increments an integer
+(keys grow logarithmically), and inserting between two keys bisects the fraction.
+Only lowercase base-36 digits are used: they sort the same under the C collation and
+the usual locale collations, so Postgres ORDER BY rank agrees with Python's ordering.
+"""
+from typing import List, Optional
+
+RANK_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+# Heads 'n'..'z' start non-negative integers of 1..13 digits; 'm'..'0' negative ones of 1..23
+_FIRST_POSITIVE_HEAD = RANK_DIGITS.index("n")
+_SMALLEST_INTEGER = RANK_DIGITS[0] * (_FIRST_POSITIVE_HEAD + 1)
+RANK_ZERO = RANK_DIGITS[_FIRST_POSITIVE_HEAD] + RANK_DIGITS[0]
+
+
+def _integer_length(head: str) -> int:
+    index = RANK_DIGITS.index(head)
+    if index >= _FIRST_POSITIVE_HEAD:
+        return index - _FIRST_POSITIVE_HEAD + 2
+    return _FIRST_POSITIVE_HEAD - index + 1
+
+
+def _integer_part(rank: str) -> str:
+    return rank[:_integer_length(rank[0])]
+
+
+def _increment_integer(value: str) -> Optional[str]:
+    head, digits = value[0], list(value[1:])
+    for i in reversed(range(len(digits))):
+        index = RANK_DIGITS.index(digits[i]) + 1
+        if index < len(RANK_DIGITS):
+            digits[i] = RANK_DIGITS[index]
+            return head + "".join(digits)
+        digits[i] = RANK_DIGITS[0]
+
+    head_index = RANK_DIGITS.index(head)
+    if head_index == _FIRST_POSITIVE_HEAD - 1:
+        return RANK_ZERO
+    if head_index == len(RANK_DIGITS) - 1:
+        return None
+    if head_index + 1 > _FIRST_POSITIVE_HEAD:
+        digits.append(RANK_DIGITS[0])
+    else:
+        digits.pop()
+    return RANK_DIGITS[head_index + 1] + "".join(digits)
+
+
+def _decrement_integer(value: str) -> Optional[str]:
+    head, digits = value[0], list(value[1:])
+    for i in reversed(range(len(digits))):
+        index = RANK_DIGITS.index(digits[i]) - 1
+        if index >= 0:
+            digits[i] = RANK_DIGITS[index]
+            return head + "".join(digits)
+        digits[i] = RANK_DIGITS[-1]
+
+    head_index = RANK_DIGITS.index(head)
+    if head_index == _FIRST_POSITIVE_HEAD:
+        return RANK_DIGITS[head_index - 1] + RANK_DIGITS[-1]
+    if head_index == 0:
+        return None
+    if head_index - 1 < _FIRST_POSITIVE_HEAD - 1:
+        digits.append(RANK_DIGITS[-1])
+    else:
+        digits.pop()
+    return RANK_DIGITS[head_index - 1] + "".join(digits)
+
+
+def _midpoint(low: str, high: Optional[str]) -> str:
+    # Fractions never end in the zero digit, which guarantees a key exists below any key
+    if high is not None:
+        n = 0
+        while (low[n] if n < len(low) else RANK_DIGITS[0]) == high[n]:
+            n += 1
+        if n > 0:
+            return high[:n] + _midpoint(low[n:], high[n:])
+
+    digit_low = RANK_DIGITS.index(low[0]) if low else 0
+    digit_high = RANK_DIGITS.index(high[0]) if high is not None else len(RANK_DIGITS)
+
+    if digit_high - digit_low > 1:
+        return RANK_DIGITS[(digit_low + digit_high + 1) // 2]
+
+    if high is not None and len(high) > 1:
+        return high[:1]
+
+    return RANK_DIGITS[digit_low] + _midpoint(low[1:], None)
+
+
+def rank_between(before: Optional[str] = None, after: Optional[str] = None) -> str:
+    """
+    A rank that sorts strictly between two neighbours; None means the start or end of the column.
+    Tied or inverted neighbours (possible after status changes) yield a rank just after `before`.
+    """
+    if before is not None and after is not None and before >= after:
+        after = None
+
+    if before is None:
+        if after is None:
+            return RANK_ZERO
+        integer = _integer_part(after)
+        if integer == _SMALLEST_INTEGER:
+            return integer + _midpoint("", after[len(integer):])
+        if integer < after:
+            return integer
+        decremented = _decrement_integer(integer)
+        if decremented is None:
+            raise ValueError("Rank space exhausted")
+        return decremented
+
+    integer = _integer_part(before)
+    fraction = before[len(integer):]
+
+    if after is None:
+        incremented = _increment_integer(integer)
+        return integer + _midpoint(fraction, None) if incremented is None else incremented
+
+    after_integer = _integer_part(after)
+    if integer == after_integer:
+        return integer + _midpoint(fraction, after[len(after_integer):])
+
+    incremented = _increment_integer(integer)
+    if incremented is not None and incremented < after:
+        return incremented
+    return integer + _midpoint(fraction, None)
+
+
+def evenly_spaced_ranks(count: int) -> List[str]:
+    """Consecutive integer ranks starting at zero, used when a column is renumbered."""
+    ranks = []
+    rank = RANK_ZERO
+    for _ in range(count):
+        ranks.append(rank)
+        rank = _increment_integer(rank)
+    return ranks
@@ -1,5 +1,5 @@
 from app.core.redis_client import redis_client
-from typing import Optional, Callable, Any
+from typing import Optional, Callable, Any, Dict
 import hashlib
 import json
 import logging
@@ -81,6 +81,9 @@ class CacheKeys:
     ORGANIZATION = "org"
     PROJECT = "project"
     TASK = "task"
+    ACTIVITY = "activity"
+    ENTITY_NAMES = "names"
+    DASHBOARD = "dashboard"
     NOTIFICATION = "notification"
     SESSION = "session"
     RATE_LIMIT = "rate_limit"
@@ -101,6 +104,72 @@ class CacheKeys:
     def task(task_id: str) -> str:
         return f"{CacheKeys.TASK}:{task_id}"
     
+    @staticmethod
+    def task_version(task_id: str) -> str:
+        return f"{CacheKeys.TASK}:{task_id}:version"
+    
+    @staticmethod
+    def task_import(import_id: str) -> str:
+        return f"{CacheKeys.TASK}:import:{import_id}"
+    
+    @staticmethod
+    def entity_names(kind: str) -> str:
+        return f"{CacheKeys.ENTITY_NAMES}:{kind}"
+    
+    @staticmethod
+    def dashboard(user_id: str) -> str:
+        return f"{CacheKeys.DASHBOARD}:{user_id}"
+    
+    @staticmethod
+    def dashboard_version(org_id: str) -> str:
+        return f"{CacheKeys.DASHBOARD}:org:{org_id}:version"
+    
+    @staticmethod
+    def dashboard_user_version(user_id: str) -> str:
+        return f"{CacheKeys.DASHBOARD}:user:{user_id}:version"
+    
+    @staticmethod
+    def activity_pending() -> str:
+        return f"{CacheKeys.ACTIVITY}:pending"
+    
+    @staticmethod
+    def activity_dead() -> str:
+        return f"{CacheKeys.ACTIVITY}:dead"
+    
+    @staticmethod
+    def activity_flush_lock() -> str:
+        return f"{CacheKeys.ACTIVITY}:flush_lock"
+    
     @staticmethod
     def rate_limit(identifier: str) -> str:
         return f"{CacheKeys.RATE_LIMIT}:{identifier}"
+
+
+class CacheStats:
+    """Per-process hit/miss counters for a read-through cache."""
+    
+    _registry: Dict[str, 'CacheStats'] = {}
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+        CacheStats._registry[name] = self
+    
+    def hit(self):
+        self.hits += 1
+    
+    def miss(self):
+        self.misses += 1
+    
+    def snapshot(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else None
+        }
+    
+    @classmethod
+    def all(cls) -> Dict[str, dict]:
+        return {name: stats.snapshot() for name, stats in cls._registry.items()}
@@ -0,0 +1,49 @@
+"""
+Compact text diffs for revision history.
+
+A diff is a list of operations that rebuilds the new text from the old one: [start, end] copies
+old[start:end], a string is inserted as is. Matching runs on lines, so computing a diff stays fast
+for long documents while its size tracks the edited lines rather than the whole text.
+"""
+from difflib import SequenceMatcher
+from typing import List, Union
+import json
+
+TextDiff = List[Union[List[int], str]]
+
+
+def make_text_diff(old: str, new: str) -> TextDiff:
+    old_lines = old.splitlines(keepends=True)
+    new_lines = new.splitlines(keepends=True)
+
+    # Character offsets of every line start, so line ranges can be copied as character ranges
+    old_offsets = [0]
+    for line in old_lines:
+        old_offsets.append(old_offsets[-1] + len(line))
+
+    ops: TextDiff = []
+    matcher = SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            start, end = old_offsets[i1], old_offsets[i2]
+            if ops and isinstance(ops[-1], list) and ops[-1][1] == start:
+                ops[-1][1] = end
+            else:
+                ops.append([start, end])
+        elif j2 > j1:
+            text = "".join(new_lines[j1:j2])
+            if ops and isinstance(ops[-1], str):
+                ops[-1] += text
+            else:
+                ops.append(text)
+    return ops
+
+
+def apply_text_diff(old: str, ops: TextDiff) -> str:
+    return "".join(old[op[0]:op[1]] if isinstance(op, list) else op for op in ops)
+
+
+def diff_or_value(old: str, new: str) -> Union[TextDiff, str]:
+    """The diff from old to new, or new itself when the diff would not be smaller."""
+    ops = make_text_diff(old, new)
+    return ops if len(json.dumps(ops)) < len(json.dumps(new)) else new
@@ -0,0 +1,69 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_tasks_project_3211df" ON "tasks" ("project_id", "updatedAt");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_tasks_project_3211df";"""
+
+
+MODELS_STATE = (
+    "eJztXWtv27gS/SuGP/UC2aL2JtmtcXEBxVaz2iZSYMvponUhKBJja2NRXklOmi3y3y9JvS"
+    "jqEcvxQ7L5pY3JGT3O8DFzyKF+tm3HBHPvvWD41qPlP7d7rZ9tqNsA/ZGpO2m19cUiqcEF"
+    "vn43J8J6IGUBUqzfeb6LilDNvT73ACoygWe41sK3HIhK4XI+x4WOgQQtOE2KltD6Zwk035"
+    "kCfwZcVPHtOyq2oAl+oIuHPxcP2r0F5mbqgS0T35uUa/7zgpSNx9LgE5HEt7vTDGe+tGEi"
+    "vXj2Zw6MxZdLy3yPdXDdFEDg6j4wqdfATxm+c1QUPDEq8N0liB/VTApMcK8v5xiM9n/vl9"
+    "DAGLTInfA/p/9rV4DHcCCG1oI+xuLnS/BWyTuT0ja+Vf8PYfju1/P/kLd0PH/qkkqCSPuF"
+    "KOq+HqgSXBMgAfSRwQNQMoj2Z7orwqVNUJXQ0+jQABl0mUswMKNXWAfgqCBBOGldEcQRdC"
+    "k826ow+ozsoXsPE3gzVP4U+2qvtXCdv4HhT6AyvBRk6augSorcaznuVIfWvzrRXckKbVv/"
+    "oc0BnPoz9LPTLbHKrTAkhul0iWEc1EuCDiSHNV1She2TsUe19p1S2mQzX9sKO2nVCWq6EV"
+    "lwnQacaNeh7Wr9oSio4iBow5rhAnzrCSR1I1VQxyMNQSNfxiLotfylpxkzHU5jyYE46g+l"
+    "G9zOtfHNgLoidU9tuTCpqwujkXQpx4K651lTGNeOZaZ+CRkJVVKvROZuqGXOQXKfsEcmLx"
+    "n2zOQ9I4n4MpFE5hq4F0m3tIjuGjPrkZYZiiNVGdIyqBX5jotl6LEgeSB6TEieKiUbP1pK"
+    "Nn6+lOxAvBKzsmhSBUT2Wry+EIeaMBhgGRvYd8DVdNOk6obitXJL1brAdh7pegWBHreISM"
+    "hBqIctYp2RrXu6wsjWPS0c2XBVuo/awNfxNJTtpX+OFDl/YKN1mL45hgjHb6Zl+CetueX5"
+    "31foqeEkXY/hDb81fmbb8/6Z0+C9uxb+YnHtXykX7DiIL3DBgLz0kO2rTR6UyjFOHahbVg"
+    "Qs0ThGvMIRUdP9LGYDVONbNsjHLa3JYGeGqu+jP+qJYRu9g6nA+XM4mpRgqkrXaO4Rrm9S"
+    "nRxPHLimS0qfmdJ350zHjy/S+iKpf7Twz9ZXRRZZQ8Vy6tc2fiZ96TsadJ7wVJIMfFFpBM"
+    "wLjq/uH6jAABfc6cbDk+6aWqbG6TpFstkqu2uzJTrUp8QsGFz8mFHcuSRzTjYexeXlsWgk"
+    "waPQJkehjr/Id94LRuBAfM/e+uqDRsqzOl/BsWKHgcSvOmfdKjx9S5UnfOnY5y9h3elL4L"
+    "NXXWavVDcIgq/qZk0pcrPu1azk4Wvik/Qd2wbQz3NLoqpSz8QIhLbPkX/DAQmBPiA48J/J"
+    "WPWdOy/bdl7QTfywOaTRVMEPv2AuSVSa4sSUDSriX2o5kxGPKVeKfBmJs/QGn6cPbkDn8/"
+    "RBmjV8eE6irRuERGsR1TBLax0jbnujt2u1cvAKYBkHOtVPs9h9clxgTeFn8JxZJmUQC/1f"
+    "hVk1r21rS0oTE7r6U+wMU6NQvCZHABZGfWEgtvP67Abwu0mu1Fzo0oPR6/DhfrgB7MbhZe"
+    "raX1/FjRqPUqCNRLUlj6+u2i/7iXevAfKcyPtl4t2o6qQs3rUDoR3Gu6ipuL5G3D0e5W49"
+    "yiX7OKqQ9LFCUyJcZgPE2dkqOyDOzoq3QOC6tP9CP1kGymK6gFFbC9BaeTBbYQymjjOdAw"
+    "0PRNrcgg9VGmuebjPb7dlKexLPSjYlnmV3JVJDbQbU8rA9rdnMuL0hcXr02qX8C4DmWnak"
+    "9bgV923FBepUlmEtdIgdcC9rzOItdTmqfGcdY6K8nXWcjz4A4pLz0Qdp1gwfHW01vKuaSZ"
+    "FRPBLOkJP5nGOtAceadD9OFeYMRjUjDHGiiTezFu1czjCuPSmnDSO5LTCH36i9jnT6DSr5"
+    "zvf4bmUaKSYQ+UbVytMw3WCrTceM5jHihzPg8inA1zNCI93dUYDhQJjtte0gyy9K7JtAYX"
+    "Atyb2WbtoWnEDli4wrnScYKu93N3qQirou7In2DoFfAGiGq1sM8jeiPJDky14rFEHY91Xp"
+    "VkTg4yMQwASOxiMshPMuvaWHxdbLtvy4ghU+FlrhI2sFzlUcQFDLuYqDNGud9rjLjm/dW4"
+    "YeGiPjxKfqS914SEnyY2EOw1mvax55BtM6eJvR6TfruD2R7r5PH1GGl5ok30qqSE6r0Cz4"
+    "aPkAnzOBxkjsB4V7fCYQAaP2WsYsSOWufGrOhxXcnc6H4lNzPrAOz7FtTtnKIr8NPA/NE1"
+    "kYizemUCpNAXLXu1L4sSc7WJzFzmEW4AsHhfE6zMc4UmHwvUM622q4VR2h1UG9UJSrFKgX"
+    "Ets0x5hFeNchCCMhKyCRJVnl53scYpgRRI81iTNSi1k5cQa72FUcZ9DUJo8zmh9nkP8r+G"
+    "2R/Ga8jddhrP2OYtT/EdoFjGs+hpRKQ3YS78D5fQJ3Hp4TK+BIqTQSR77DvWmxBOf1D8Yz"
+    "47z+gZm1Kq9Pnx+SnBTDBLCh5qfPQzDXCwbH7KE09bNy0Y4nhilJMgjXx4FKVmwoDmFm7R"
+    "txaGSS8cs2o9AIkZwAlAKrOPak7bKDDFdUGKe6Wl5wtDV4BCZPdj30sJQHAjwQKA8EUuNB"
+    "dpoo471ZVc5/8xjr4JxxHmMdpFl5nhfP8+J5XjWJ1U54nldt8rw4mcTODPjbU28EQUWXaB"
+    "gC26RPCBw53EkEUzFxEttiy6xJdEIfYU6o4/rCtBK2OPx4GchUJC4fp1r4uWJv7q2cbGk2"
+    "2dLAnDbfMZ1sT2+rykBBFkOVEyjJ2s1QuRyKo1GvZUENjX+413oTOBRvJfFLr+WCRws8Te"
+    "AAhW69lunA4OWqbvburLLZu1O82bvDNvZH4Hq5DV2CBe2c0mCMYG3Pyem8YcSY4pv80u2c"
+    "/nb6+6/np78jEfIgcclvJaByTusgyQ/OaR2kWTORS+SWVuRmGLUj5LM4Gci/SLBvUjCOKT"
+    "MgHh+txYxIBaQWP2J/Y0fsc1Z1W6xq1JQ3wCgK1AjRnKa5dWYxhqWAYaRhK2catZSxNn2g"
+    "mB+yneRzFuwhYmE14RMTAc4fbpM/DK29TsIio8oDoZrFt6Q3V+solMqxeKO1+D5WoxAr8d"
+    "+j4f2NzlPzlg5Z74nqSHX7tlONUSv6uFOM2n7yrwmwOY5VBHixQ4VfiOdZN99Lurdcz5cr"
+    "7mpPKfHV1hjMuV4dS1qHQ5l8jsbWrXkVHGMFfgJA/C0Yz3ty3JyRshhFWoe3Riqt4ha4Fr"
+    "pg9aQKWpGnVPDl5yMIz/ny8wGYtTlp6/VZachddNl19nrN4dh1EntN4Ygp5t3tR68pElHD"
+    "OHogqDWqDYyffEmxkPEaAc8jxwQWMF9x/clrDJjm0aKcCWsyE8Y/Q1RtSckF96hypjoPIG"
+    "fLdTHFwOo1k2bYylmDPB4+gMApiIcrRE7bnO4E4FrGLG+iC2tKpzg9kanN3FaYy5E7teWk"
+    "cYQW2yv5u5E0juKprDARpnhULs6EaciAvJ1DdBeLKiCG4s0EsPNhta9vlH1+I/P9DXRHP2"
+    "Rx0iAWf+OAUtnAJw7q5V5t7BsHe51eXv4P7dr9Tw=="
+)
@@ -0,0 +1,77 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "task_tombstones" (
+    "id" UUID NOT NULL PRIMARY KEY,
+    "task_id" UUID NOT NULL,
+    "deletedAt" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "project_id" UUID NOT NULL REFERENCES "projects" ("id") ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS "idx_task_tombst_project_cc4edd" ON "task_tombstones" ("project_id", "deletedAt");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "task_tombstones";"""
+
+
+MODELS_STATE = (
+    "eJztXWtv27gS/SuGP/UC2aLOJtmtcXEBJVaz2iZSYMvponUhKBZja2NRXolOmi3y3y9JvS"
+    "jqEcvxQ7L5pY3JGT3O8DFzyKF+th3XAjP/vTRG9qONntvd1s82NB2A/8jUHbXa5nye1JAC"
+    "ZN7NqLAZSNmAFpt3PvJwEa65N2c+wEUW8MeePUe2C3EpXMxmpNAdY0EbTpKiBbT/WQADuR"
+    "OApsDDFd++42IbWuAHvnj4c/5g3NtgZqUe2LbIvWm5gZ7ntGw4VHqfqCS53Z0xdmcLBybS"
+    "82c0dWEsvljY1nuiQ+omAALPRMBiXoM8ZfjOUVHwxLgAeQsQP6qVFFjg3lzMCBjt/94v4J"
+    "hg0KJ3Iv+c/K9dAZ6xCwm0NkQEi58vwVsl70xL2+RWF39I/Xe/nv2HvqXro4lHKyki7Req"
+    "aCIzUKW4JkACiLDBA1AyiF5MTU+GC4eiquCnMeEYZNDlLsHBjF9hFYCjggThpHVFEEfQpf"
+    "Bs69LgM7aH6T+M4E1f+1O+0Lutuef+DcZoBLX+paQqXyVd0dRuy/UmJrT/NanuUlZoO+YP"
+    "YwbgBE3xz85xiVVupT41TOeYGsbFvSToQGpYc0yriH0y9qjWvlNK62zmK1thK606Qc0cRx"
+    "ZcpQEn2nVou8ZFX5Z0uRe0YWPsAXLrEaR1A13ShwMDQ6NexiL4tdDCN8ZTE05iyZ48uOgr"
+    "N6SdG8ObHnNF5p7GYm4xV5cGA+VSjQVN37cnMK4dqlz9AnISuqJfydzdcMucgeQ+YY9MXj"
+    "Lsmcl7RhLxZSKJzDVIL1JuWRHTG0/tR1amLw90rc/K4FaEXI/IsGNB8kDsmJA8VUo2frSU"
+    "bPx8KdmefCVnZfGkCqjstXx9LvcNqdcjMg5w7oBnmJbF1PXla+2WqfWA4z6y9RoGPW4RkZ"
+    "CLUQ9bxCoj2/HJEiPb8UnhyEaq0n3UAcgk01C2l/450NT8gY3V4frmEGIcv1n2GB21ZraP"
+    "vi/RU8NJuh7DG3lr8syO7/8zY8F7dy39xeN6caWd8+MgucA5B/LCx7avNnkwKoc4deBuWR"
+    "GwROMQ8QpHRMNEWcx6uAbZDsjHLa3JYWeFqu+jP+qJYRu/g6XB2XM4mpRgqivXeO6Rrm9S"
+    "nZxMHKTmmJY+c6XvzriOH1+k9UXR/2iRn62vmirzhorl9K9t8kzmArkGdJ/IVJIMfFFpBM"
+    "wLia/uH5jAgBTcmeOHJ9OzjEyNe+wWyWarnGOHLzGhOaFmIeCSx4zizgWdc7LxKCkvj0Uj"
+    "CRGFNjkKddE833kvGIED8R1768sPGinP6mwJx4ofBhK/6ox3q8j0rVSe8JVDn7+kVacvSc"
+    "xedZm9Ut0gCL6qmzWlKMy6U7PSh6+JT3LhOg6AKM8tiapKPZNxILR5jvwbCUgo9AHBQf5M"
+    "xqrvwnnZtPOCb4LC5pBGUwc/UMFckqg0xYkpG1Tkv/RyJiMeU6409TIS5+kNMU/v3YAu5u"
+    "m9NGv48IJEWzUIidYiqmGW1jpE3HZGb9dq5eAVwDIOdKqfZrH75HrAnsDP4DmzTMohFvq/"
+    "GrdqXtvWlpQmJvTMp9gZZkaheE2OAiwNLqSe3M7rs2vA7ya5UnOhSw9Gr8NH+uEasBuGl6"
+    "lrf30VN2Y8SoE2kPWWOry6ar/sJt69Bthzou+XiXejqqOyeNcJhLYY7+Km4iGDunsiyt14"
+    "lEv3cVQh6WOFpkS43AaI09NldkCcnhZvgSB1af+FfbIMlMV0Aae2EqC18mA2whhMXHcyAw"
+    "YZiIyZDR+qNNY83Wa229Ol9iSelmxKPM3uSmSG2gyo5WF7WrOZcXtD4vTotUv5FwCtlezI"
+    "6gkr7tqKc9yp7LE9NyFxwP2sMYu31OWoip11nInydtYJPnoPiEvBR++lWTN8dLTV8K5qJk"
+    "VG8UA4Q0HmC461Bhxr0v0EVZgzGNWMMCSJJv7UnrdzOcO49qicNozkNsAcfmP2OrLpN7jk"
+    "u9jju5FppJhAFBtVK0/DbIOtNh1zmoeIH8mAy6cAX88IjXS3RwGGA2G217aDLL8osW8Epd"
+    "61onZbpuXYcAS1LyqpdJ9gqLzb3ehBKuqqsCfaWwR+DqAVrm5xyN/Iak9RL7utUARjf6Er"
+    "tzIGnxyBAEZwMBwQIZJ36S98IrZatuXHJazwsdAKH3krCK5iD4JawVXspVnrtMdddZF9b4"
+    "/N0BgZJz5VX+rGQ0ZSHAuzH856XfPIM5jWwduMTr9Zxe2JdHd9+ojWvzQU9VbRZXpahWHD"
+    "RxsBcs4EHiOJHxTu8RlBDIzebY2nQSp35VNzPizh7nQ+FJ+a84F3eA5tc8pGFvkd4Pt4ns"
+    "jCWLwxhVFpCpDb3pUijj3ZwuIscQ6zAJ+7OIw3YT7GkQqH7x3W2VTDreoILQ/quaZdpUA9"
+    "V/imOSQswrsORRgL2QGJrKi6ON9jH8OMIHqsSZyRWszKiTP4xa7iOIOlNkWc0fw4g/5fwW"
+    "+L5NfjbbwOY+13FOP+j9EuYFzzMWRUGrKTeAvO7xO488mcWAFHRqWROIod7k2LJQSvvzee"
+    "meD198ysVXl99vyQ5KQYLoANNT997oOZWTA4Zg+lqZ+Vi3Y8cUxJkkG4Og5MsmJDcQgza9"
+    "+IQyOTjF82GYVGiOQEoAxYxbEna5ctZLjiwjjV1faDo63BI7BEsuu+h6UiEBCBQHkgkBoP"
+    "stNEGe/Nqwr+W8RYe+eMixhrL80q8rxEnpfI86pJrHYk8rxqk+clyCR+ZiDfnnojCDq+RM"
+    "MRMJDr3PnIhWANWOjRtRoGyiY5JdpGcgilqO0Us0lxA90wlRQdW0jpJOYMwzDXhi8Ov+gG"
+    "MhWJHyz4J3HY2pt7q2Cgms1ANTDRD7mWm+3pbV3radhiuHIEFdW46WuXfXkw6LZsaODxj/"
+    "RafwT78q0if+m2PPBog6cR7OF4ttuywtmw8g74zjI74DvFO+A7fGN/BJ6f29AVWNDOGQ3O"
+    "CPbmPL/OG0aMCbnJL8edk99Ofv/17OR3LEIfJC75rQRUQfTtJSMkiL69NGsmmInc0oqEFa"
+    "d2gCSfYEjFZxp2zZTGMWUGxMPj+rgRqYDpE98dWNt3BwTVvCmqOWrKa6AWJWaEaE7T3Diz"
+    "GMNSwDCysJUzjUbKWOs+ZQ2FbCf9xgd/slpYTfnEREDwh5vkD0Nrr5LFyamKQKhm8S3tzd"
+    "U6CqNyKN5oLT4a1ijESvz3aHh/o/PUvPVU3ntiOlLdPnhVY9SKvngVo7abpPT0knaBh5Va"
+    "837FxUqvtW9pWZdeliAqVma3szIrpt+K02/SPCt6oilF4YfWzA8V3OhafCvB7lVm93bjLl"
+    "A/LMdLiPyzYueA+D/irJrmT/33tucjtWJmYEpJbM6KwZyZ1bFkdQSUySf9HNOeVcExVhCn"
+    "KMXf0/P9J9fLGSmLUWR1RGtkUlNvgWfjC1ZPTGUVRVqq2K12AFGU2K22B2ZtztE/9dmYkL"
+    "tHY9snANUcjm0fBFRTOOIV6e3l9NUUiahhHDwQzJaWNYyfYgdSIeM1AL5Pj1ouYL7i+qPX"
+    "GDDDZ0UFE9ZkJkx8yrHaEpgH7nHlVHcfQE6GVjHFwOs1k2bYyHnNIh7eg8ApiIcrRE6bnO"
+    "4k4Nnjad5EF9aUTnFmIlObua0w9TN3asvJ+gwttlPydy1Zn8VTWWHebPGoXJw425ABeTMf"
+    "IpjPq4AYijcTwM6H5b5gVvYJs8w3zPAdUcjipEEs/k4Uo7KGz0TVy71a23eidjq9vPwf95"
+    "0EoA=="
+)
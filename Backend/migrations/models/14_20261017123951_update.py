@@ -0,0 +1,89 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "tasks" ADD "rank" VARCHAR(255) NOT NULL DEFAULT 'n0';
+        CREATE INDEX IF NOT EXISTS "idx_tasks_project_0f6b25" ON "tasks" ("project_id", "status", "rank");
+        -- Seed ranks with the previous board order (newest first): fixed-width integer keys 'r00000', 'r00001', ...
+        UPDATE "tasks" AS t
+        SET "rank" = 'r' || (
+            SELECT string_agg(
+                substr('0123456789abcdefghijklmnopqrstuvwxyz', ((r.position / power(36, k)::bigint) % 36)::int + 1, 1),
+                '' ORDER BY k DESC
+            )
+            FROM generate_series(0, 4) AS k
+        )
+        FROM (
+            SELECT id, ROW_NUMBER() OVER (
+                PARTITION BY project_id, status ORDER BY "updatedAt" DESC, id DESC
+            ) - 1 AS position
+            FROM "tasks"
+        ) AS r
+        WHERE r.id = t.id;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_tasks_project_0f6b25";
+        ALTER TABLE "tasks" DROP COLUMN "rank";"""
+
+
+MODELS_STATE = (
+    "eJztXW1zozYQ/isef7rOpDdxmqS9TKczJOZSeglkbJzr3PmGIaDYNEa4gJNLb/LfK4k3IV"
+    "5iHGODrS/tRdrF8Ky02n3Qih9d2zHBzHsvGL71aPnP3bPOjy7UbYD+kek76HT1+TzpwQ2+"
+    "fjcjwnogZQHSrN95vouaUM+9PvMAajKBZ7jW3LcciFrhYjbDjY6BBC04SZoW0Pp3ATTfmQ"
+    "B/ClzU8fUbaragCb6ji4d/zh+0ewvMzNQNWyb+bdKu+c9z0jYaSf2PRBL/3J1mOLOFDRPp"
+    "+bM/dWAsvlhY5nusg/smAAJX94FJPQa+y/CZo6bgjlGD7y5AfKtm0mCCe30xw2B0f79fQA"
+    "Nj0CG/hP9z/Ee3AjyGAzG0FvQxFj9egqdKnpm0dvFPXfwpDN79cvoTeUrH8ycu6SSIdF+I"
+    "ou7rgSrBNQESQB8ZPAAlg+jFVHdFuLAJqhK6Gx0aIIMucwkGZvQIqwAcNSQIJ6MrgjiCLo"
+    "VnVxWGn5A9dO9hDG8Gyl/ihXrWmbvOP8Dwx1AZXAqy9EVQJUU+6zjuRIfWfzrRXcoKXVv/"
+    "rs0AnPhT9GfvqMQqt8KAGKZ3RAzjoFkSTCA57DkiXdg+GXtUG98ppXUO85WtsJFRnaCmG5"
+    "EFVxnAiXYTxq52MRAFVewHY1gzXIB/egxJ31AV1NFQQ9DIl7EIeix/4WnGVIeTWLIvDi8G"
+    "0g0e59ropk9dkfpNbTE3qasLw6F0KceCuudZExj3jmSmfwEZCVVSr0Tm19DInIHkd8IZmT"
+    "xkODOT54wk4stEEplr4Fkk3dIiumtMrUdaZiAOVWVAy6BR5DsulqF9QXJDtE9I7iolG99a"
+    "Sja+v5RsX7wSs7JoUQVE9lq8PhcHmtDvYxkb2HfA1XTTpPoG4rVyS/W6wHYe6X4FgR6PiE"
+    "jIQaiHI2IVz3Z0vIRnOzou9Gy4Kz1HbeDreBnKztK/hoqc79hoHWZujiDC8atpGf5BZ2Z5"
+    "/rclZmq4SDfDveGnxvdse96/Mxq8d9fC3yyuF1fKOesH8QXOGZAXHrJ9tcWDUtnHpQNNy4"
+    "qAJRr7iFfoETXdz2LWRz2+ZYN83NKaDHZmqPo++kczMeyiZzAVOHsOvUkJpqp0jdYe4fom"
+    "NcnxwoF7jkjrM9P67pSZ+PFFOp8l9c8O/rPzRZFF1lCxnPqli+9JX/iOBp0nvJQkji9qjY"
+    "B5wfnV/QOVGOCGO914eNJdU8v0OEdOkWy2yz6y2RYd6hNiFgwuvs0o71yQNSebj+L28lw0"
+    "kuBZaJuzUMef5wfvBR44EN9ytL6800hFVqdLBFasG0jiqlM2rMLLt1R5wZf2ff0SVl2+BL"
+    "56NWX1Sk2DIPmqbtaUIjfrVs1Kbr4hMcmFY9sA+nlhSdRVGpkYgVD9HPlXnJAQ6AOCA/8z"
+    "8VXfePBSd/CCfsQPh0MaTRV89wvWkkSlLUFMmVMR/1bLmYzYp1wp8mUkztIbfJ3eOYfO1+"
+    "mdNGt485xEWzUJid5FVMMsrbWPuG2N3m7Um4NXAMsE0Kl5msXuo+MCawI/gefMa1IGsTD+"
+    "VZi35o0dbUlrYkJXf4qDYcoLxe/kCMDC8ELoi928ObsG/G6SK7UXurQzeh0+PA/XgN0ovE"
+    "xT5+uruFH+KAXaUFQ78ujqqvuynXz3GqDIiTxfJt+Nug7K8l07ENpgvouGiutrJNzjWW7t"
+    "WS7Zx1GFpI8V2pLhMhsgTk6W2QFxclK8BQL3peMX+s4yUBbTBYzaSoA2KoKphTGYOM5kBj"
+    "TsiLSZBR+qDNY83XaO25Ol9iSelGxKPMnuSqRcbQbU8rQ9rdnOvL0leXr02KX8C4DmSnak"
+    "9bgVt23FOZpUlmHNdYgDcC9rzOItdTmqfGcdY6K8nXWcj94B4pLz0Ttp1gwfHW01vKtaSZ"
+    "FR3BPOkJP5nGNtAMeaTD9OFeY4o4YRhrjQxJta824uZxj3HpTThpFcDczhV2qvI11+g1q+"
+    "8T2+tSwjxQQi36haeRmmB2y15ZjR3Ef8cAVcPgX4ekVopLs5CjB0hNlZ2w2q/KLCvjEU+t"
+    "eSfNbRTduCY6h8lnGn8wRD5e3uRg9KUVeFPdHeIPBzAM3w7RaD/I0o9yX58qwTiiDsL1Tp"
+    "VkTg4yMQwBgOR0MshOsuvYWHxVartvywhBU+FFrhA2sFzlXsQFLLuYqdNGuT9rjLjm/dW4"
+    "YeGiMTxKf6S8N4SEnyY2F2I1hvah15BtMmRJvR6TerhD2R7rZPH1EGl5ok30qqSE6r0Cz4"
+    "aPkAnzOBfCSOg8I9PmOIgFHPOsY0KOWufGrO4RLhTu+w+NScQzbg2bfNKbW85LeB56F1Ig"
+    "tj8cYUSqUtQG56Vwo/9mQDL2dxcJgF+NxBabwO8zGOVBh875BOXQO3aiC0PKjninKVAvVc"
+    "YofmCLMI73oEYSRkBSSyJKv8fI9dTDOC7LEheUbqZVZOnsG+7CrOM2hqk+cZ7c8zyP8rxG"
+    "2R/HqijddhbPyOYjT/EdoFjGs+hpRKS3YSbyD4fQJ3Hl4TK+BIqbQSR77DvW25BOf1dyYy"
+    "47z+jpm1Kq9Pnx+SnBTDJLCh5sdPAzDTC5xj9lCa5lm5aMcTw5QkFYSr40AVK7YUh7Cy9o"
+    "04tLLI+KXOLDRCJCcBpcAqzj1pu2ygwhU1xqWulhccbQ0egcmLXXc9LeWJAE8EyhOBlD/I"
+    "LhNlvDeryvlvnmPtXDDOc6ydNCuv8+J1XrzOqyG52gGv82pMnRcnk9iVAX976o0gqOgSLU"
+    "dA8x37zvMdCNaAhRpdq2Wg1MkpkTGSQyhFY6eYTYoHaM1UUnRsIaGTqDMMw1obtjn8ohvI"
+    "dCRxcMGViFeDD5yeqp+e2rftrpygahtB1cI6QN8xnexM76pKX0EWQ51jKMnazUC5HIjD4V"
+    "nHghpygnjWemM4EG8l8fNZxwWPFngawz5Kd886ZrhYVt4g31tmg3yveIN8jx3sj8D1cge6"
+    "BAvGOaXBGMGqLzDsvcFjTPCP/HzUO/71+LdfTo9/QyLkRuKWX0tAzfKAZC2r4GIj+Q2OWH"
+    "j4hpVpAx6WU6k7wLlxKnUnzZpJF6PAvyIlyKjtIY3KOWj+IYxtc9Fx1p4Bcf/YVMYjFXCp"
+    "/MsOa/uyAyfz6yLzo6G8BvJWoDxEe4Zm7dxtDEsBh0vDVs7lailjrfscOz/kk8lXVNiz68"
+    "JuwssmApyCrZOCDa29Sp0so8oToYblt2Q2V5solMq+RKON+CxbqxArid8j9/7G4Kl9b6zZ"
+    "6ImaSE37pFiDUSv6pliM2nbK/tObBgoirNSugldCrPRuhg29OCeXxYjyz2lv5uU2X34rLr"
+    "/J8KwYiaYUeRzasDiUc6Nria04u1eZ3dtOuEDisJwoIYrPioMDHP/w04Dav/TfW67nyxVr"
+    "L1NKfH9bDOZMr44lrcOhTD6aaOvWrAqOsQI/pyr+YqHnPTlujqcsRpHW4aORKv69Ba6FLl"
+    "i99JdW5IW/fLfaHmRRfLfaDpi1PYcrNWdjQu4ejU2fsdRwODZ91FJD4YjfSG+uarKhSEQD"
+    "Y++BoLa0rMF/8h1IhYzXEHgeOcy6gPmK+w9eY8A0jxblTFibmTD+scxqr8BccI86p6rzAH"
+    "KK3Eqqthi9dtIMtZyIzfPhHUicgny4QuZU53InANcypnkLXdhTusTpiUxj1rbC6tncpS2n"
+    "cDa02FbJ37UUzhYvZYWlx8Veubj2uCUOuZ5PPcznVUAMxdsJYO9wuW/ElX0kLvOVOPSLfs"
+    "jipEEs/hIXpbKGD3E1K7xa25e4trq8vPwPnnlzjA=="
+)
@@ -0,0 +1,102 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        COMMENT ON COLUMN "activities"."action" IS 'TASK_CREATED: task_created
+TASK_STATUS_CHANGED: task_status_changed
+TASK_DESCRIPTION_UPDATED: task_description_updated
+TASK_ASSIGNED: task_assigned
+TASK_UNASSIGNED: task_unassigned
+TASK_TITLE_UPDATED: task_title_updated
+TASKS_IMPORTED: tasks_imported
+PROJECT_CREATED: project_created
+PROJECT_UPDATED: project_updated
+PROJECT_ARCHIVED: project_archived
+PROJECT_RESTORED: project_restored
+ORGANIZATION_CREATED: organization_created
+ORGANIZATION_UPDATED: organization_updated
+ORGANIZATION_DELETED: organization_deleted
+MEMBER_ADDED: member_added
+MEMBER_REMOVED: member_removed
+MEMBER_ROLE_CHANGED: member_role_changed';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        COMMENT ON COLUMN "activities"."action" IS 'TASK_CREATED: task_created
+TASK_STATUS_CHANGED: task_status_changed
+TASK_DESCRIPTION_UPDATED: task_description_updated
+TASK_ASSIGNED: task_assigned
+TASK_UNASSIGNED: task_unassigned
+TASK_TITLE_UPDATED: task_title_updated
+PROJECT_CREATED: project_created
+PROJECT_UPDATED: project_updated
+PROJECT_ARCHIVED: project_archived
+PROJECT_RESTORED: project_restored
+ORGANIZATION_CREATED: organization_created
+ORGANIZATION_UPDATED: organization_updated
+ORGANIZATION_DELETED: organization_deleted
+MEMBER_ADDED: member_added
+MEMBER_REMOVED: member_removed
+MEMBER_ROLE_CHANGED: member_role_changed';"""
+
+
+MODELS_STATE = (
+    "eJztXW1zozYQ/isef7rOpDdxmqS9TKczJOZSeglkbJzr3PmGIaDYNEa4gJNLb/LfK4k3IV"
+    "5iHGODrS/tRdoF/Ky02n3Qih9d2zHBzHsvGL71aPnP3bPOjy7UbYD+kek76HT1+TzpwQ2+"
+    "fjcjwnogZQHSrN95vouaUM+9PvMAajKBZ7jW3LcciFrhYjbDjY6BBC04SZoW0Pp3ATTfmQ"
+    "B/ClzU8fUbaragCb6ji4d/zh+0ewvMzNQDWya+N2nX/Oc5aRuNpP5HIolvd6cZzmxhw0R6"
+    "/uxPHRiLLxaW+R7r4L4JgMDVfWBSPwM/Zfibo6bgiVGD7y5A/Khm0mCCe30xw2B0f79fQA"
+    "Nj0CF3wv85/qNbAR7DgRhaC/oYix8vwa9KfjNp7eJbXfwpDN79cvoT+ZWO509c0kkQ6b4Q"
+    "Rd3XA1WCawIkgD4yeABKBtGLqe6KcGETVCX0NDo0QAZd5hIMzOgnrAJw1JAgnIyuCOIIuh"
+    "SeXVUYfkL20L2HMbwZKH+JF+pZZ+46/wDDH0NlcCnI0hdBlRT5rOO4Ex1a/+lEdykrdG39"
+    "uzYDcOJP0Z+9oxKr3AoDYpjeETGMg2ZJMIHksOeIdGH7ZOxRbXynlNY5zFe2wkZGdYKabk"
+    "QWXGUAJ9pNGLvaxUAUVLEfjGHNcAG+9RiSvqEqqKOhhqCRL2MR9LP8hacZUx1OYsm+OLwY"
+    "SDd4nGujmz51Reqe2mJuUlcXhkPpUo4Fdc+zJjDuHclM/wIyEqqkXonM3dDInIH0fYaadH"
+    "2jDGIZT7PsueOS/nDGJiCEMzfBIZKIbxNJxPeIJPAsk25pEd01ptYjLTMQh6oyoGXQKPMd"
+    "F8vQviJ5INpnJE+Vko0fLSUbP19Kti9eiVlZtOgCInstXp+LA03o97GMDew74Gq6aVJ9A/"
+    "FauaV6XWA7j3S/gowSj5hIyEFWCUfMKp7v6HgJz3d0XOj5cFd6DtvA1/EylZ3Ffw0VOd/x"
+    "0TrM3B1BhONX0zL8g87M8vxvS8zkcBFvhvvDvxo/s+15/85o8N5dC3+zuF5cKeesn8QXOG"
+    "dAXnjI9tUWF0plH5cWNC0rApZo7CNeoUfUdD+LWR/1+JYN8nFLazLYmaHq++gfzcSwi36D"
+    "qcDZc+hNSjBVpWu09gjXN6lJjhcO3HNEWp+Z1nenzMSPL9L5LKl/dvCfnS+KLLKGiuXUL1"
+    "38TPrCdzToPOGlJHF8UWsEzAvOv+4fqMQBN9zpxsOT7ppapsc5copks132kc226FCfELNg"
+    "cPFjRnnpgqw52XwVt5fnqpEEz1LbnKU6/jw/uC/wwIH4lqP55Z1GKrI6XSKwYt1AEledsm"
+    "EVXr6lygu+tO/rl7Dq8iXw1aspq1dqGgTJV3WzphS5WbdqVvLwDYlJLhzbBtDPC0uirtLI"
+    "xAiE6ufQv+KEhEAfEBz4n4mv+saDl7qDF3QTPxwOaTRV8N0vWEsSlbYEMWVORfxbLWcyYp"
+    "9ypciXkThLb/B1euccOl+nd9Ks4cNzEm3VJCR6F1ENs7TWPuK2NXq7UW8OXgEsE0Cn5mkW"
+    "u4+OC6wJ/ASeM69RGcTC+Fdh3qo3drQlrYkJXf0pDoYpLxS/kyMAC8MLoS928+bsGvC7Sa"
+    "7UXujSzuh1+PA8XAN2o/AyTZ2vr+JG+aMUaENR7cijq6vuy3by3WuAIify+zL5btR1UJbv"
+    "2oHQBvNdNFRcXyPhHs9ya89yyT6PKiR9rNCWDJfZAHFysswOiJOT4i0QuC8dv9BPloGymC"
+    "5g1FYCtFERTC2MwcRxJjOgYUekzSz4UGWw5um2c9yeLLVn8aRk0+JJdtci5WozoJan7WnN"
+    "dubtLcnTo59dyr8AaK5kR1qPW3HbVpyjSWUZ1lyHOAD3ssYs3lKXo8p31jEmyttZx/noHS"
+    "AuOR+9k2bN8NHRVsO7qpUWGcU94Qw5mc851gZwrMn041RhjjNqGGGIC028qTXv5nKGce9B"
+    "OW0YydXAHH6l9jrS5Teo5Rvf41vLMlJMIPKNqpWXYXrAVluOGc19xA9XwOVTgK9XjEa6m6"
+    "MAQ0eYnbXdoMovKuwbQ6F/LclnHd20LTiGymcZdzpPMFTe7m70oFR1VdgT7Q0CPwfQDN9u"
+    "McjfiHJfki/POqEIwv5ClW5FBD4+IgGM4XA0xEK47tJbeFhstWrLD0tY4UOhFT6wVuBcxQ"
+    "4ktZyr2EmzNmmPu+z41r1l6KExMkF8qr80jIeUJD82ZjeC9abWkWcwbUK0GZ2Os0rYE+lu"
+    "+3QSZXCpSfKtpIrktArNgo+WD/A5E8hH4jgo3OMzhggY9axjTINS7sqn6hwuEe70DotP1T"
+    "lkA55925xSy0t+G3geWieyMBZvTKFU2gLkpnel8GNPNvByFgeHWYDPHZTG6zAf40iFwfcO"
+    "6dQ1cKsGQsuDeq4oVylQzyV2aI4wi/CuRxBGQlZAIkuyys/32MU0I8geG5JnpF5m5eQZ7M"
+    "uu4jyDpjZ5ntH+PIP8v0LcFsmvJ9p4HcbG7yhG8x+hXcC45mNIqbRkJ/EGgt8ncOfhNbEC"
+    "jpRKK3HkO9zblktwXn9nIjPO6++YWavy+vT5IclJMUwCG2p+/DQAM73AOWYPpWmelYt2PD"
+    "FMSVJBuDoOVLFiS3EIK2vfiEMri4xf6sxCI0RyElAKrOLck7bLBipcUWNc6mp5wdHW4BGY"
+    "vNh119NSngjwRKA8EUj5g+wyUcZ7s6qc/+Y51s4F4zzH2kmz8jovXufF67wakqsd8Dqvxt"
+    "R5cTKJXRnId6feBoKKLtFyBDTfse8834FgDVio0bVaBkqdnBIZIzmEUjR2itmkeIDWTCVF"
+    "xxYSOok6wzCstWGbwy++gUxHEgcXXIl4NfjA6an66al92+7KCaq2EVQtrAP0HdPJzvSuqv"
+    "QVZDHUOYaSrN0MlMuBOByedSyoISeIZ603hgPxVhI/n3Vc8GiBpzHso3T3rGOGi2XlDfK9"
+    "ZTbI94o3yPfYwf4IXC93oEuwYJxTGowRrPoCw94bPMYE3+Tno97xr8e//XJ6/BsSIQ8St/"
+    "xaAmqWByRrWQUXG8lvcMTCwzesTBvwsJxK3QHOjVOpO2nWTLoYBf4VKUFGbQ9pVM5B8w9h"
+    "bJuLjrP2DIj7x6YyHqmAS+Vfdljblx04mV8XmR8N5TWQtwLlIdozNGvnbmNYCjhcGrZyLl"
+    "dLGWvd59j5IZ9MvqLCnl0XdhNeNhHgFGydFGxo7VXqZBlVngg1LL8ls7naRKFU9iUabcRn"
+    "2VqFWEn8Hrn3NwZP7XtjzUZP1ERq2ifFGoxa0TfFYtS2U/af3jRQEGGldhW8EmKldzNs6M"
+    "U5uSxGlH9OezMvt/nyW3H5TYZnxUg0pcjj0IbFoZwbXUtsxdm9yuzedsIFEoflRAlRfFYc"
+    "HOD4h58G1P6l/95yPV+uWHuZUuL722IwZ3p1LGkdDmXy0URbt2ZVcIwV+DlV8RcLPe/JcX"
+    "M8ZTGKtA4fjVTx7y1wLXTB6qW/tCIv/OW71fYgi+K71XbArO05XKk5GxNy92hs+oylhsOx"
+    "6aOWGgpH/EZ6c1WTDUUiGhh7DwS1pWUN/pPvQCpkvIbA88hh1gXMV9x/8BoDpnm0KGfC2s"
+    "yE8Y9lVnsF5oJ71DlVnQeQU+RWUrXF6LWTZqjlRGyeD+9A4hTkwxUypzqXOwG4ljHNW+jC"
+    "ntIlTk9kGrO2FVbP5i5tOYWzocW2Sv6upXC2eCkrLD0u9srFtcctccj1fOphPq8CYijeTg"
+    "B7h8t9I67sI3GZr8ShO/ohi5MGsfhLXJTKGj7E1azwam1f4trq8vLyP36ffuI="
+)
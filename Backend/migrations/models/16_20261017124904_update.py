@@ -0,0 +1,82 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "tasks" ADD "parent_id" UUID;
+        ALTER TABLE "tasks" ADD "path" VARCHAR(512) NOT NULL DEFAULT '';
+        ALTER TABLE "tasks" ADD CONSTRAINT "fk_tasks_tasks_1ce5d4cc" FOREIGN KEY ("parent_id") REFERENCES "tasks" ("id") ON DELETE SET NULL;
+        CREATE INDEX IF NOT EXISTS "idx_tasks_parent__f22067" ON "tasks" ("parent_id");
+        -- Subtree scans compare paths bytewise (~>=~ / ~<~), which needs the pattern opclass
+        CREATE INDEX IF NOT EXISTS "idx_tasks_project_path" ON "tasks" ("project_id", "path" text_pattern_ops);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_tasks_project_path";
+        DROP INDEX IF EXISTS "idx_tasks_parent__f22067";
+        ALTER TABLE "tasks" DROP CONSTRAINT IF EXISTS "fk_tasks_tasks_1ce5d4cc";
+        ALTER TABLE "tasks" DROP COLUMN "parent_id";
+        ALTER TABLE "tasks" DROP COLUMN "path";"""
+
+
+MODELS_STATE = (
+    "eJztXW1v27YW/iuGP/UCWRFnSbcGFxdwYjXTmliBLadD60JgLMbmYlGeJCfNivz3S1JvFP"
+    "USy7EcyeaXrSHPkeTnkOeNh+TPtmWbcO6+70489IC8p/Zp62cbAwuSf6T6DlptsFjEPbTB"
+    "A7dzRgx8KgRZM7h1PYc0kZ47MHchaTKhO3HQwkM2Jq14OZ/TRntCCBGexk1LjP5ZQsOzp9"
+    "CbQYd0fPtOmhE24Q/y8ODPxb1xh+DcTHwwMum7WbvhPS1Y22ik9j4xSvq6W2Niz5cWjqkX"
+    "T97MxhH5conM95SH9k0hhg7woMn9DPqVwW8Om/wvJg2es4TRp5pxgwnvwHJOwWj/926JJx"
+    "SDFnsT/c/x/9ol4JnYmEKLsEex+Pns/6r4N7PWNn3V+R/dwbtfP/yH/Urb9aYO62SItJ8Z"
+    "I/CAz8pwjYGE2CMC90FJIXo+A46ClxZDVSVfA/AEptAVHiHATH7COgCHDTHC8egKIQ6hS+"
+    "DZ1rvDz0QewL0f4+uB9qdyrp+2Fo79N5x4Y6wNLrp99WtXV7X+act2pgCjfwHjXUkKbQv8"
+    "MOYQT70Z+bNzVCCVm+6ACaZzxARjk1niT6B+0HPEuqh8UvIoN74TTJsc5mtLYSujOkYNTE"
+    "IJrjOAY+46jF3jfKB0daXnj2Fj4kD66jFmfUO9q4+GBoGmfxGRkJ/lLV1jMgN4GlH2lOH5"
+    "QL2m49wYXfe4J3LvNJYLk3t6dzhUL/oRIXBdNMVR76gv9C+xQKGr+qUivI2MzDlMvmdoqF"
+    "fX2iCicQ1kLWyH9QczNgYhmLkxDiFF9JqQInpHSEFnmXrDkwBnMkMPPM1AGeragKcho8yz"
+    "HUrD64r4g3idEX9Vgjb6tARt9H0J2p5yqaRpidGFjPZKuTpTBka316M0FrRuoWMA0+T6Bs"
+    "qVdsP1OtCyH/h+jQglGjEhkU2kEoyYdTTf0fEKmu/oOFfz0a7kHLagB6iZSs/iP4daP1vx"
+    "8TzC3B1hguM3E028g9Ycud73FWZyYMTrof7or6bfbLnuP3MevHdX3b9EXM8vtTNRT9IHnA"
+    "kgL10i+3LGhWPZR9NCpmVJwGKOfcQr0IgG8NKY9UiPhyyYjVuSU8DODFjfh/+oJ4Zt8htM"
+    "Dc+fAm1SgKmuXhHb0726TkxyajhozxFrfRJa330QJn70kNYXVf+jRf9sfdX6iiioiE7/2q"
+    "bfBJaebWD7kZqSWPGFrSEwzzT+urvnAgfacAsm94/AMY1Uj31k59Gmu6wjS2wBGEyZWCi4"
+    "9DPDuHTJbE46XqXtxbFqSCGj1CZHqba3yHbuczSwT/7G3vzqSiPhWX1YwbES1UDsV30Q3S"
+    "pqvtXSBl/dd/vVXdd8daX1qov1SkwDP/gqL9YEoxTrm4qVfXxNfJJz27Ig9rLckrCr0DOZ"
+    "+ETV59C/0YCEQe8nOOg/Y131XTovVTsv5CVeMBySaOrwh5djS2KWpjgxRUpF+UsvzmREOu"
+    "VS61+E5GJ6Q9rpnVPo0k7vpFiDj5dJtHWDkHAtohxmSa59xO3N0tu1Wjl4AbCUA52Yp2ns"
+    "PtkORFP8GT6lllEFxAL/VxNW1Ws72uLWWIQOeIycYU4LRWtyDODu8LzbU9pZc3YD+F3HT2"
+    "oudEll9DJ8dB5uALtR8Ji6ztcXceP0UQK0oaK3+qPLy/bz28S7V5B4Tuz3peLdsOugKN61"
+    "fKItxrtkqDiewdw9GeVWHuWyOo8ySfqIoSkRrlAAcXKySgXEyUl+CQTtS/ov/JeloMxPFw"
+    "hsawFaKw+mkozB1Lanc2hQRWTMEb4vM1izeJs5bk9Wqlk8KShaPElXLXKqNgVqcdie5Gxm"
+    "3N6QOD382YX5F4jNteTI80kpvrUUF2RSoQlaAEwdcDctzPySugxWWVkniCirsk7mo3cgcS"
+    "nz0Tsp1lQ+Oiw1vC270yLFuCc5Q5nMlznWGuRY4+knU4UZyqhmCUO60cSdoUU7M2cY9R4U"
+    "pw1Dugoyh9+4Wkd++w1p+S5rfCsxI/kJRFmoWtoM8wO2nDkWOPcRP7oDLjsF+PKO0ZB3ey"
+    "nAQBGmZ23b3+UXbuwb427vSu2ftoBpITzG2pc+7bQfccD8ttXo/lbVdWGPubcI/AJiM1jd"
+    "EpC/Vvo9tX9x2gpICPbnunqjEPDpEQlwjIejISWi+y7dpUvJ1ttt+XEFKXzMlcJHUQoyV7"
+    "EDQa3MVeykWOtU4963PXSHJiAQRsqJT/QXuvGYo5THxuyGs17XfeQpTOvgbYan46zj9oS8"
+    "b306iTa4MNT+jaor7LQKA+EH5EF6zgTRkdQPCmp8xpgAo5+2JjN/K3fpU3UOV3B3Oof5p+"
+    "ocig7PvhWnVLLIb0HXJXYiDWN+YQrH0hQgt12VIo892cLiLHUO0wCf2SSMBzgb45BFwPeW"
+    "8FQ1cMs6QquDeqZplwlQz1RxaI5oFuFdhyFMiJCfRFb7ujzfYxfDDD96rEmckVjMyogzxM"
+    "Wu/DiDT23KOKP5cQb7fwm/LaTfjLfxMoy1rygm85+gnZNxzcaQY2lIJfEWnN9HeOtSm1gC"
+    "R46lkTjKCvemxRIyr78znpnM6++YWMvm9fnzQ+KTYoQANuD89HkA5yBHOaYPpamflPMqno"
+    "RMSbyDcH0cuM2KDcUh2Fn7Shwaucn4ucooNEQkIwDlwMqPPXm5bGGHK2mMtroi1z/aGj5A"
+    "U2523fWwVAYCMhAoDgQS+iBtJory3iKrzH/LGGvnnHEZY+2kWOU+L7nPS+7zqkmsdiD3ed"
+    "Vmn5dMJomWgd079ToQdPKIhiNgeLZ163o2hhvAQg+f1TBQqswpsTGSkVAKx05+NikaoBWn"
+    "ksJjC1k6iTvDMNhrIzYHN77BVEfsB+c8iWk1fB90A4fqD5mqkueyvXpiy2RVs5NVDdwT6N"
+    "mmnZ7pbV3raURipHOM1b5xPdAuBspweNpC2CAKkc5ad4wHyo2qfDltOfABwccx7pHQ97Rl"
+    "BoazdLF8Z5Vi+U5+sXxHHOwL4N+ZtarCCOm3iP8rtOwWaoUeoONmagoV5ygKjkNAEVXnZX"
+    "deAeKUvuSXo87xb8e///rh+HdCwj4kavmtANZ0UpU5BiWGXEi/xSGHDzc26CoxUTIvvQMJ"
+    "TJmX3kmxpmLvMIoqmV8V2PYwJy0T+q+5VYQF3WUvFeGZ9hE0eRXLJlZDorxRCsT9y+cLaj"
+    "wnmy/vFtnY3SJBtvH16K2Y8q/v0Eto8xUGnlyIq2whbobmJhHGVtag6gNpphu8gcWnLmdf"
+    "mqPYKl97imDJWYPiYSteizISwtr0OZxeMI7ZLVDi2ZtBN1s4ignkslGVy0aBtNfZ5y+wyt"
+    "xDzVJKbDaXmygcy77EMrW4VrJRiBVEf6F63477XSMDL3qQ3ESq25WINUYt707ECLV8h7tq"
+    "BysuesrxsBJVUS+4WMlqrC0V/rDHUkRZ7Y70rCovyJHmt6T5jYdnSU80wSj90Jr5oTKzvh"
+    "HfSuaGS+eG38ZdYH5YhpcQ+mf5zgH1f+RpZs03/XfIcb1+yb3jCSZZkxuBOQflseR5JJTx"
+    "pa8WQPMyOEYM8py9aInRdR9tJ0NTFhXOxjxyNHKHF9xAB5EHlj+6gGeUBxfIAtE9iKJkge"
+    "gOiLU5h8PVtJIgrMzY9hlxNYdj20fF1RSOaEV6e7u+a4pEODD2HgiupGUD+lNWIOVmvIbQ"
+    "ddlh/DmZr6j/4KUMmOHypDIT1uRMmLzst9wSmAPvSOdMt++zKkYLNkoKfM1MM1SyS1fGwz"
+    "sQOPnxcInIqUpz14UOmsyyDF3QU2jiQExTG9uWu2E907Rl7FUPJPamyd+N7FXPN2W5u/3z"
+    "tXL+dv+GKORqrqohU6MEiAF5MwHsHK52x2XRJZepWy7JG73MfU75NwlyLBu4SLBe7tXGbh"
+    "J8U/Py/H8LuwsP"
+)
@@ -0,0 +1,93 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "task_dependencies" (
+    "id" UUID NOT NULL PRIMARY KEY,
+    "createdAt" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "blocker_id" UUID NOT NULL REFERENCES "tasks" ("id") ON DELETE CASCADE,
+    "created_by_id" UUID REFERENCES "users" ("id") ON DELETE SET NULL,
+    "project_id" UUID NOT NULL REFERENCES "projects" ("id") ON DELETE CASCADE,
+    "task_id" UUID NOT NULL REFERENCES "tasks" ("id") ON DELETE CASCADE,
+    CONSTRAINT "uid_task_depend_task_id_e4682a" UNIQUE ("task_id", "blocker_id")
+);
+CREATE INDEX IF NOT EXISTS "idx_task_depend_project_639e44" ON "task_dependencies" ("project_id");
+CREATE INDEX IF NOT EXISTS "idx_task_depend_blocker_c8831d" ON "task_dependencies" ("blocker_id");
+COMMENT ON TABLE "task_dependencies" IS 'A \"blocked by\" edge: `task` cannot start until `blocker` is finished.';
+        ALTER TABLE "tasks" ADD "graph_order" BIGINT;
+        CREATE INDEX IF NOT EXISTS "idx_tasks_project_88bae0" ON "tasks" ("project_id", "graph_order");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_tasks_project_88bae0";
+        ALTER TABLE "tasks" DROP COLUMN "graph_order";
+        DROP TABLE IF EXISTS "task_dependencies";"""
+
+
+MODELS_STATE = (
+    "eJztXW1z2rgW/isePvXOZDsJTdI2c+fOkOBm3SaQAZPutHRcYyugjZFZ2yTNdvLfryT8Is"
+    "svwQSDDfqy20jnGPs50nmTjvS7MbVNYLlvW4YHH6D31DiTfjeQPgX4H4m+A6mhz2ZRD2nw"
+    "9JFFifUFFQS0WR+5noObcM+dbrkAN5nANRw486CNcCuaWxZptA1MCNE4apoj+M8caJ49Bt"
+    "4EOLjj+w/cDJEJfuGH+3/O7rU7CCwz9sLQJL9N2zXvaUbbBgOl/YlSkp8baYZtzacoop49"
+    "eRMbheTzOTTfEh7SNwYIOLoHTOYzyFv63xw0Ld4YN3jOHISvakYNJrjT5xYBo/HfuzkyCA"
+    "YS/SXyn+P/NQrAY9iIQAuRR7D4/bz4quibaWuD/NTFn63em3en/6Ffabve2KGdFJHGM2XU"
+    "PX3BSnGNgATIwwJfgJJA9GKiOzKaTymqCn4bHRkggS73CA5m/AmrABw0RAhHoyuAOIAuhm"
+    "dDbfW/YHno7v0Q3fS6n+UL9UyaOfbfwPCGqNu7bHWUby1V6XbOJNsZ6wj+q1PepaTQmOq/"
+    "NAugsTfBfx41c6Ry2+pRwRw1qWBsPEsWE6jj9zRpF5FPQh7FxneMaZ3DfGUpbGRUR6jpRi"
+    "DBVQZwxF2Fsatd9OSWKrcXY1gzHEB+eohoX19tqYO+hqHpXIYk+LO8uasZEx2NQ8q23L/o"
+    "KTdknGuDmzbzROY3tfnMZJ7e6veVy05IqLsuHKOwd9Dh+ueIo1AV9Urmfg2PTAvEf6evKd"
+    "c33V5I42pwOrMd2u/P2AgEf+ZGOAQU4c8EFOFvBBRklim3LInuGBP4wNL05L7a7bE0eJR5"
+    "tkNoWF0RvRCrM6K3itGGrxajDd8vRtuWr+QkLTa6gNJey9fnck9rtduEZgqmI+BoumkyfT"
+    "35unvL9Dpgaj+w/V0slHDEBEQ2loo/YlbRfM3jJTRf8zhT85Gu+ByeAk8nZio5iz/3u510"
+    "xcfycHN3gDCO301oeAeSBV3vxxIz2Tfi1VB/5KvJO09d9x+LBe/NdesvHteLq+45ryfJA8"
+    "45kOculn0x48Kw7KNpwdOyIGARxz7i5WtETfeSmLVxjwenIB23OCeHnemzvg3+UU0MG/gb"
+    "zC6ynnxtkoOpqlxj29O6volNcmI4SE+Ttj5xrW9OuYkfPkT6qqh/SuRP6Vu3I/OCCunUbw"
+    "3yTvrcszVkPxJTEim+oDUA5pnEX3f3TOBAGka6cf+oO6aW6LGbdhZtsmvanPItOtLHVCwE"
+    "XPKaQVw6pzYnGa+S9vxYNaAQUWqdo1Tbm6U79xkaeEG+ZW9+eaUR86xOl3CseDUQ+VWnvF"
+    "tFzLdS2OAr+26/Wquar5awXlWxXrFpsAi+ios1xijEulWx0peviE9yYU+nAHlpbknQleuZ"
+    "GAui8nPo30lAQqFfJDjIPyNd9UM4L2U7L/hHPH84xNFUwS8vw5ZELHVxYvKUivyXmp/JCH"
+    "XKVbdzGZDz6Q1hp3dOoQs7vZNi9V9eJNFWDUKCtYhimMW59hG3raW3K7Vy8AJgCQc6Nk+T"
+    "2H2yHQDH6At4Siyjcoj5/m+XW1Wv7GiLWiMROvpj6AwzWihck6MAt/oXrbbcSJuza8DvJn"
+    "pSfaGLK6OX4SPzcA3YDfzHVHW+vogbo49ioPVlVeoMrq4az9uJd68B9pzo9yXi3aDrIC/e"
+    "nS6INhjv4qHieBp190SUW3qUS/d5FEnShwx1iXC5DRAnJ8vsgDg5yd4CQfri/gv7Zgkos9"
+    "MFHNtKgFbKgyklYzC27bEFNKKINAui+yKDNY23nuP2ZKk9iyc5mxZPkrsWGVWbADU/bI9z"
+    "1jNur0mcHnx2bv4FIHMlObJ8QorbluIMTypowJmOiAPuJoWZvaUuhVXsrONElLazTuSjdy"
+    "BxKfLROynWRD462Go4KlppkWDck5yhSOaLHGsFcqzR9BOpwhRlVLGEISk0cSdw1kjNGYa9"
+    "B/lpw4CuhMzhd2avI1t+g1t+iD2+pZiR7ASi2Kha2AyzA7aYOeY49xE/UgGXngJ8uWI04N"
+    "1cCtBXhMlZ21hU+QWFfUPUal8rnTNJN6cQDVH3a4d02o/IZ97ubvRFqeqqsEfcGwR+BpDp"
+    "r25xyN/InbbSuTyTfBKM/YWq3MoYfHJEAhii/qBPiEjdpTt3Cdlq1ZYfl5DCx0wpfOSlIH"
+    "IVOxDUilzFToq1SnvcO7YH76Ch+8JIOPGx/lw3HjGU4tiY3XDWq1pHnsC0Ct5mcDrOKm5P"
+    "wLvt00m6vUtN6dwqqkxPq9AgeoAeIOdMYB1J/CB/j88QYWDUM8mYLEq5C5+qc7iEu3N0mH"
+    "2qziHv8Ozb5pRSFvmnwHWxnUjCmL0xhWGpC5Cb3pUijj3ZwOIscQ6TAJ/bOIzXUTrGAQuH"
+    "7wjzlDVwizpCy4N63u1exUA9V/ihOSBZhDdHFGFMBBdJZKWjivM9djHMWESPFYkzYotZKX"
+    "EGv9iVHWewqU0RZ9Q/zqD/L+C3BfTr8TZehrHyO4rx/MdoZ2Rc0zFkWGqyk3gDzu8jGLnE"
+    "JhbAkWGpJY5ih3vdYgmR198Zz0zk9XdMrEXz+uz5IdFJMVwA63N++tIDlp6hHJOH0lRPyl"
+    "k7nrhMSVRBuDoOTLFiTXHwK2tfiUMti4yfy4xCA0RSAlAGrOzYk5XLBipccWNY6grdxdHW"
+    "4AGYoth118NSEQiIQCA/EIjpg6SZyMt786wi/y1irJ1zxkWMtZNiFXVeos5L1HlVJFY7EH"
+    "VelanzEskk3jLQe6deB4KKH1FzBPAwokUJyPBvc3wdGu3gaU91x8WzpyPXs9E6UFGDZ9UM"
+    "lDJzbXTupCTagjmVnWULJ27JKbbgOEeaZmPOdvRrkPhm/yY8kOiI4oOMJ1Ftj+79bt0hep"
+    "UnHTv6bKLZjolfVqT3xFl2r570IsFX7wRfDesoPdu0kzO9oXbbXSwx3DlESke76XUve3K/"
+    "fyZBpGENSGatO0Q9+VaRv55JDniA4HGI2t2OfCaZvlEtXGBwtEyBwVF2gcERP9hn+uKesW"
+    "UVRkC/QfxfoWU3sL+KtXBJjwuOFZShLzhGDlC4VJCyhZ1WY/I7f3xsNt+9e988fHf64eT4"
+    "/fuTD4cfMC19p2TX+7wEt3JJUtUxvJO56wfguKnqOBNdhmMlZFcaqkevxrV5dPz++MO70+"
+    "MQzrAlD8UkYtQzKzCvA/oNzmt0uLaZXYofIBZMdiCzLhZMdlKsieRHEMYWTPxzbHu4WCJW"
+    "ml5z3Q3NehS97YZl2kfQxB1B61imCxN3CRD3b6GJU+MZy0zi0pu1XXrjp3tfj96Sa1HVHX"
+    "oxbb7EwBMrxKWtEE+gZWJhbGRxtDqQprrBa1j9azH2pT6KLYbGyLKNe79mQiwQL+DIUD17"
+    "A0jZi8PhtMlYJGanVf5isRabzOs+QNjz9Ry9vo4/NNjvpqu5EYFYuy1z7daX9ioHlHCsIj"
+    "dVsZQjnc3FJgrDsi+xbiXuw60VYjnZgUC9byY8q5CBP+AiDGYiVe0u1wqjlnWZa4hadkBW"
+    "toPFeJ4ZLlbcN33ByeI3kr7oZzVa0jBwpaXR07AhAXMMzqSf5HE/JUNHyPYkej2gNEcetK"
+    "SfC2rnpwRd6Q4i6E6A+Zbf/7HO5+Z6fD5XitMX2zoYIxOuX5mun1hp3km3z59BBf2YONe+"
+    "uDJiSVKsrm33nGsRoy2BWE7EIVbUXrWiJgK2VQK2wEkVwPGOg6hV3aU7CePleBlxb6xe74"
+    "WwN14nuKGSNPpYAimtKhNxZenlYMKnKegFRsMzgVl+JB5jFJF4xSJxERQJF387Lv523AXq"
+    "jaV4CYGXlu0ckMS/uH+g/qb/Djqu1yl42mOMSVSEh2BaenEsWR4BZQglmOrQKoJjyCBuxg"
+    "j3Xrvuo+2kaMq8su2IR4xG5rjRW+BA/MDih42yjOKoUVE5uwdRlKic3QGx1uc6h+rkilPT"
+    "5pu+1aHicGz6coeKwhFuxd7cOY0VRSIYGHsPBFPLsQb9uSOlWezo2OZhnhUaM2UnBPvAde"
+    "ntohmJwbD/4KUEoeaypCJRWOdEIZGnUrjQQtmrJZH4jdx3uHOi2vdplcY5B2xxfPXMwpRy"
+    "hJ5IF+xAXLlIFxQILMs0dy3gQGOSZuj8nlwTp0c0lbFtmQcdppq2lDMOfYltNTe+ljMOs0"
+    "1Z5imR2Vo5+5jImijkcu7exlOjAIg+eT0BPDo8XAJATJV9qC7p4yyajbzU83E+97udDFsW"
+    "sXBADhD+wO8mNLwDyYKu96OasOagSL46ZrQSJ0nzh0Zz1og84Dxtb8omzcvz/wFQPuNr"
+)
@@ -0,0 +1,103 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "task_reminders" (
+    "id" UUID NOT NULL PRIMARY KEY,
+    "remind_at" TIMESTAMPTZ NOT NULL,
+    "sent_at" TIMESTAMPTZ,
+    "createdAt" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "task_id" UUID NOT NULL UNIQUE REFERENCES "tasks" ("id") ON DELETE CASCADE
+);
+COMMENT ON TABLE "task_reminders" IS 'The pending (or last sent) due-date reminder of a task; one row per task.';
+-- Only pending reminders are indexed, so polling stays a short range scan however many were sent
+CREATE INDEX IF NOT EXISTS "idx_task_remind_pending" ON "task_reminders" ("remind_at") WHERE "sent_at" IS NULL;
+        COMMENT ON COLUMN "notifications"."type" IS 'ORG_INVITE: org_invite
+MEETING: meeting
+CHAT: chat
+TASK_DUE: task_due';
+        ALTER TABLE "tasks" ADD "due_at" TIMESTAMPTZ;
+        CREATE INDEX IF NOT EXISTS "idx_tasks_project_6618e7" ON "tasks" ("project_id", "due_at");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_tasks_project_6618e7";
+        COMMENT ON COLUMN "notifications"."type" IS 'ORG_INVITE: org_invite
+MEETING: meeting
+CHAT: chat';
+        ALTER TABLE "tasks" DROP COLUMN "due_at";
+        DROP TABLE IF EXISTS "task_reminders";"""
+
+
+MODELS_STATE = (
+    "eJztXW1zm7oS/iuMP/XM5HQSN0nb3Dt3xolpDm1iMjZOz7TuUAKKzY0tfAAnze3kv19JIB"
+    "DiJcavYOtLXqRdAc9Kq92VtPrdmDgWGHtvW6ZvP9r+c+NM+t2AxgSgP1J1B1LDmE7jGlzg"
+    "G3djQmwEVDYgxcad57uoCNXcG2MPoCILeKZrT33bgagUzsZjXOiYiNCGw7hoBu1/ZkD3nS"
+    "HwR8BFFd9/oGIbWuAXajz8d/qg39tgbCVe2Lbws0m57j9PSVm/r7Q/EUr8uDvddMazCYyp"
+    "p8/+yIER+WxmW28xD64bAghcwwcW8xn4LcNvpkXBG6MC352B6FWtuMAC98ZsjMFo/Pt+Bk"
+    "2MgUSehH8c/6dRAh7TgRhaG/oYi98vwVfF30xKG/hRF3+1um/enf5BvtLx/KFLKgkijRfC"
+    "aPhGwEpwjYEE0EcCD0BJIXoxMlwZziYEVQW9jQFNkEKXa4KDGX3CIgDTghjhuHdRiCl0CT"
+    "wbWqv3BcnD8B4G8KarfpYvtDNp6jr/BaY/gGr3stVRvrU0Re2cSY47NKD9P4PwziWFxsT4"
+    "pY8BHPoj9O9Rs0Aqt60uEcxRkwjGQaMkGECdsKZJqrB8UvIo178TTKvs5gtLYSO9OkbNMK"
+    "kEF+nAMXcV+q5+0ZVbmtwO+rBuugA/egBJXU9raf2ejqDpXEYk6LP8maebIwMOI8q23Lvo"
+    "Kje4n+v9mzbTIvNMfTa1mNZbvZ5y2YkIDc+zhzCq7Xe4+hnkKDRFu5K5p6GeOQbJ5/R05f"
+    "pG7UY0nm5Ppo5L6sMRG4MQjtwYB0oRPYZSRM+gFHiUKbcsieGaI/uRpenKPU3tsjSol/mO"
+    "i2lYXRG/EKsz4rdK0EavlqCN3i9B25av5DQtmnQBob2Wr8/lrt5qtzHNBEzugKsblsXUde"
+    "Vr9ZapdcHEeWTrVSSUqMdQIgdJJewxi2i+5vEcmq95nKv5cFVyDE+Ab+BpKj2KP/fUTrbi"
+    "Y3m4sduHCMfvlm36B9LY9vwfc4zkcBKvhvrDX43feeJ5/4xZ8N5ct/7mcb24Us95PYkbOO"
+    "dAnnlI9uUmF4ZlH6cWNCxLAhZz7CNeoUbUDT+NWRvV+PYEZOOW5OSws0LWt/SPamLYQN9g"
+    "qXD8HGqTAkw15RrNPa3rm8QgxxMHrmmS0meu9M0pN/CjRqSvivaXhP+VvqkdmRdURKd9a+"
+    "B3Mma+o0PnCU8lseKjpRSYF+x/3T8wjgMuuDPMhyfDtfRUjdN08mjTVZPmhC8xoDEkYsHg"
+    "4tekfumMzDlpfxWXF/uqlEJ4qXX2Uh1/mm3c52jggHzL1vz8SiNhWZ3OYVjxaiC2q055sw"
+    "pP30rpCV/Z9/mrtej01RKzV1Vmr8QwCJyv8mJNMAqxblWs5OUrYpNcOJMJgH6WWUKrCi0T"
+    "MyBafwz9O3ZICPRBgAP/GeuqH8J4Wbfxgh7ih90hiaYGfvk5c0nMUhcjpkipyH9rxZGMSK"
+    "dcqZ1LSs6HN8Q8vXMKXczTOynW8OVFEG1RJ4SuRZTDLMm1j7htLbxdqZWDVwBLGdCJcZrG"
+    "7pPjAnsIv4Dn1DIqh1ho/6rcqnple1tcGovQNZ4iY5jRQtGaHAG41btoteVG1phdAX43cU"
+    "v1hS6pjF6HD4/DFWDXD5up6nh9FTdGHyVA68ma1OlfXTVetuPvXgNkOZHvS/m7tOqgyN+d"
+    "BEQb9HdRV3F9nZh7wstdu5dL9nmUCdJHDHXxcLkNECcn8+yAODnJ3wKB65L2C/tmKSjzww"
+    "Uc20KAVsqCWUvEYOg4wzHQsSLSxzZ8KNNZs3jr2W9P5tqzeFKwafEkvWuRUbUpUIvd9iRn"
+    "Pf32mvjp9LML4y8AWgvJkeUTUty2FKdoUNmmPTUgNsC9tDDzt9RlsIqddZyIsnbWiXj0Dg"
+    "QuRTx6J8WaikfTrYZ3ZU9apBj3JGYogvkixlqBGGs8/ESoMEMZVSxgiA+aeCN72siMGUa1"
+    "B8VhQ0q3hsjhd2avI3v8BpX8EHt81zKN5AcQxUbV0tMw22HLTccc5z7ih0/AZYcAXz8xSn"
+    "k3FwIMFWF61DaCU370YN8AttrXSudMMqyJDQdQ/drBlc4TDJm3uxs9OKq6KOwx9waBnwJo"
+    "hatbHPI3cqetdC7PpJAEYX+hKbcyAh+nSAAD2Ov3MBE+d+nNPEy22GnLj3NI4WOuFD7yUh"
+    "Cxih1wakWsYifFWqU97h3Ht+9t0wiFkTLiE/WFZjxkKEXamN0w1qt6jjyFaRWsTZodZxGz"
+    "h/JuOzuJ2r3Ulc6toskkW4Vuw0fbBzjPBNKR2A4K9/gMIAJGO5PMkeHTbCR9mWYfmYFFLK"
+    "CjwzlMoKPD/Ew7h7wRtG8bVtay8D8BnofmjjSM+ZtVGJa6ALnpnSoiFcoGFmyxwZgG+NxB"
+    "rr0BszGmLBy+d4hnXR23rHE0P6jnqnqVAPVc4btmH0cW3hwRhBGRHQSWlY4mcn7sousReJ"
+    "QV8T0SC1wZvge/AJbve7DhTuF71N/3IL9L2G2UfjXWxuswVn6XMRr/CO2cKGw2hgxLTXYX"
+    "b8D4fQJ3Hp4TS+DIsNQSR7HrvW6+hIj174xlJmL9OybWsrF+NqdInD2Gc2BDzk9fumBs5C"
+    "jHdKKa6kk5bxcUFymJTxUujgNzgLGmOISnbZfEoZYHj1/W6YVSRDIcUAasfN+TlcsGTr2i"
+    "wuj4q+0F6a7BI7DEAdhdd0uFIyAcgWJHIKEP0tNEUdybZxXxb+Fj7ZwxLnysnRSrOPslzn"
+    "6Js18V8dUOxNmvypz9EsEkfmYgd1EtB4KGmqg5AqgbkYMK0AxveFwOjTZt7bnuuPjO5M7z"
+    "HbgKVDTaVs1AWWesjYydjEAbHVP5UbZo4K45xEZTPJIwG5PvMTyXxBeHt+OBVEXsH+S0RL"
+    "Q9fAirDRfrVZ506BrTke64FnpZvs5CX2KI5O4i7Z2I+1XVwttY3K+GRy59x3LSI72hqW0V"
+    "SQxVDqDS0W+66mVX7vXOJBvqSPnhUesNYFe+VeSvZ5ILHm3wNIBttSOfSVY415Y+d3A0z7"
+    "mDo/xzB0d8Z58awZVk8yoMSr9B/JfQshvYdhVObikIi2NyMdcKAnLV0hoVir/Rzy6Mq7KW"
+    "S9qStocKzFH4HCMnSHsu53MLO+iG+Dl/fmw237173zx8d/rh5Pj9+5MPhx8QLXmndNX7oo"
+    "UL5RIvQSTEl16TeASulzmf5qLLcCyE7EK65mhpXJtHx++PP7w7PY7gjEqKUEwjRizuEoqZ"
+    "0m9QMcPDlanmtRhyYiFsB1ZMxELYToo1FdSi4YmSCzoc2x4ugokVxGWuNiLRrLI3G7FM+w"
+    "iauA9qFcuvUUA2BeL+LSByajxn+VBccLSyC47CMP7y6M25xljdrpfQ5nN0PLHyv7aV/5E9"
+    "tpAwNrLoXR1IM83gFazqtpj5pT6KLYHG3dgxH8KzMGLhP4AjR/XsDSClFv3ZBCsT/LJZMd"
+    "6QVYVAc9CP+fDrMu3VR9UssAkiUiM5myFYNVO8KUJPKLdVJ8/2Q71Prm7kE2aH1WRnQkwg"
+    "NiOsczNCKO1FEvFwrCJWV7EQLBnN5QYKw7Ivvn8l7oKuFWIF0RKq3jfjrlbI4DngPC5mIF"
+    "XtHuMKo5Z3kXGEWr6Duu5dpowlnmNiJW31V4wsfsP0q3ZWoyUNqGsh3T0PGhKwhuBM+omb"
+    "+ymZBoSOL5GrMaUZ9O2x9DOgdn9Ktifd29D2RsB62+AEtsp2Cy2+kCvD6EtskU2QCdNvna"
+    "afWHnfSbMvHEEl7Zgk176YMmKJVqw2bjfHu/DR5kCswOMQK4xLrTAKh20Rh40aqQI43nAQ"
+    "Z7J36T7OxBJKjtvLLrG84vTS1Z05PV5tBOg1adIbx5XGhoc8UQD9PyRrBv7EDoZEm5Sce8"
+    "kgt4X8S3IgKneeEK9LStI+70pbFvm9N2U25buygbAWWMNIMNbTla2J60o/u9B3xWNwASky"
+    "bOKk1pZFKKJKOxlVqo6juu7bFFboppax2l7zyejGlzU7FhtCd3l/bLVWbpxcJcfMTWRfec"
+    "XOTWZ92VCCEdIsRonkCBEm59qzeFRGIVY5cpdM2UG7Z0nLIMEoLIOKWQYi9C8C2dsJZG8n"
+    "KEZijhlWAo1F5hsHeHuLuE2u/lP/ve16fqdk7v4Ek0jkFYGJY69lsWR5BJQRlGBi2OMyOE"
+    "YM4p7D6MSl5z05boamLMq2FfOI3shcHnELXBs1WP7qCJZRXBwh8uXsgRcl8uXsgFjrczlf"
+    "dXZEZG4O2fQdfRWHY9NX9VUUjujA4eay7lcUCdox9h4I5sTyCvTnjiRkYHvHNq9mqFCfWX"
+    "dAsAc8nAg1MFQyAoNR/cFrAULdY0lFoLDOgUIsT6X0cWJlr5ZEEul0wT2qHGnOQ1Z+oYK0"
+    "uhxfPaMwa8l8LsIFO+BXBuGCpbYXrW66awHXNkdZE11YUzjFGTFNZea23PTmmVNbRmbzUG"
+    "JbjY2vJLN5/lSWmxs+XyvnJ4eviUJeS1gcD40SIIbk9QTw6PBwDgARVf5dKLiOm9Ec6Gdm"
+    "xfzcUzs5c1nMwgHZh+gDv1u26R9IY9vzf1QT1gIU8VcnJq3UBUD8XT/cbIQbOF929+qy08"
+    "vL/wGH/GJp"
+)
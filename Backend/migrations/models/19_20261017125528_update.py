@@ -0,0 +1,95 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "task_revisions" (
+    "id" UUID NOT NULL PRIMARY KEY,
+    "version" INT NOT NULL,
+    "is_snapshot" BOOL NOT NULL DEFAULT False,
+    "data" JSONB NOT NULL,
+    "changed_fields" JSONB NOT NULL,
+    "createdAt" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "task_id" UUID NOT NULL REFERENCES "tasks" ("id") ON DELETE CASCADE,
+    "user_id" UUID REFERENCES "users" ("id") ON DELETE SET NULL,
+    CONSTRAINT "uid_task_revisi_task_id_e68db2" UNIQUE ("task_id", "version")
+);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "task_revisions";"""
+
+
+MODELS_STATE = (
+    "eJztXetzm7gW/1cYf+rOZDuJm/SRe+fOODGbZZvYGZukO607FINic2MLL+CkuZ3871cSCI"
+    "R42NjGBltf+pDOwfA70tF5SfrVmNommLhvW4ZnPVneS+Nc+tWA+hSgfyT6jqSGPptFPbjB"
+    "04cTQqz7VBYgzfrQ9RzUhHoe9IkLUJMJXMOxZp5lQ9QK55MJbrQNRGjBUdQ0h9Y/c6B59g"
+    "h4Y+Cgjm/fUbMFTfATPTz47+xRe7DAxIy9sGXi3ybtmvcyI213d0r7D0KJf26oGfZkPoUR"
+    "9ezFG9swJJ/PLfMt5sF9IwCBo3vAZD4Dv2XwzbTJf2PU4DlzEL6qGTWY4EGfTzAYjX8/zK"
+    "GBMZDIL+E/Tv/TKACPYUMMrQU9jMWvV/+rom8mrQ38U5d/tnpv3r3/jXyl7Xojh3QSRBqv"
+    "hFH3dJ+V4BoBCaCHBO6DkkD0cqw7MpxPCaoKehsdGiCBLvcIDmb0CasATBsihKPRRSGm0M"
+    "XwbKit/mckD919HMDbXvcv+VI9l2aO/V9geAPY7V21OsrXlqp0O+eS7Yx0aP1PJ7xLSaEx"
+    "1X9qEwBH3hj996SZI5X7Vo8I5qRJBGOjWeJPoE7Q0yRdWD4JeRQb3zGmTQ7zlaWwlVEdoa"
+    "YbVIKrDOCIuwpjV7vsyS1VbvtjWDMcgH96AElfX22pd30NQdO5CknQZ3lzVzPGOhyFlG25"
+    "f9lTbvE41+5u28wTmd/U5jOTeXqr31euOiGh7rrWCIa9dx2ufw45ClVRr2Xu19DInID47/"
+    "Q15ea22wtpXM2azmyH9AczNgIhmLkRDpQi/BlKEf4GpcCzTLlnSXTHGFtPLE1P7qvdHkuD"
+    "RplnO5iG1RXRC7E6I3qrGG34ajHa8P1itG35Wk7SokUXENob+eZC7mmtdhvTTMF0CBxNN0"
+    "2mryffdO+ZXgdM7Se2v4uEEo4YSmQjqQQjZhXN1zxdQvM1TzM1H+6Kz+Ep8HS8TCVn8V/9"
+    "bidd8bE83Ny9gwjHb6ZleEfSxHK970vM5GARr4b6w1+N33nquv9MWPDe3LT+5nG9vO5e8H"
+    "oSP+CCA3nuItkXW1wYlkNcWtC0LAhYxHGIeAUaUdO9JGZt1ONZU5COW5yTw84MWN/Sf1QT"
+    "wwb6BrMLJy+BNsnBVFVu0NrTurmNTXK8cOCeJml94VrfvOcmfvgQ6Yui/inh/0pfux2ZF1"
+    "RIp35t4HfS556tQfsZLyWR4qOtFJhX7H89PDKOA24Y6sbjs+6YWqLHbtpZtMmuaXPKt+hQ"
+    "HxGxYHDxa1K/dE7WnKS/itvzfVVKIbzUOnuptjdLN+4zNLBPvmNrfnmlEbOs3i9hWPFqIL"
+    "Kr3vNmFV6+lcILvnLo61dr1eWrJVavqqxesWngO1/FxRpjFGLdqVjJy1fEJrm0p1MAvTSz"
+    "hHblWiaGT1R+DP0bdkgI9H6AA/8z0lXfhfFStvGCfsQLhkMcTRX89DLWkoilLkZMnlKR/1"
+    "bzIxmhTrnudq4oOR/eEOv03il0sU7vpViDlxdBtFWdEJqLKIZZnOsQcdtZeLtSmYMFgCUM"
+    "6Ng8TWL3h+0AawQ/g5dEGpVDLLB/u1xWvbKjLWqNROjoz6ExzGihMCdHAG71L1ttuZE2Zz"
+    "eA3230pPpCF1dGi+HD83AD2N0Fj6nqfF2IG6OPYqD1ZVXq3F1fN1534+/eAGQ5ke9L+Lu0"
+    "6yjP3536RFv0d9FQcTyNmHvCyy3dyyV1HkWC9CFDXTxcrgDi7GyZCoizs+wSCNwXt1/YN0"
+    "tAmR0u4NhWArRSFkwpEYORbY8mQMOKSJtY8LHIYE3jree4PVuqZvEsp2jxLFm1yKjaBKj5"
+    "bnucs55+e038dPrZufEXAM2V5MjyCSnuWoozNKksw5rpEBvgblKY2SV1Kayiso4TUVplnY"
+    "hH70HgUsSj91KsiXg0LTUcFt1pkWA8kJihCOaLGGsFYqzR9BOhwhRlVLGAId5o4o6tWSM1"
+    "Zhj2HuWHDSldCZHDb0ytI7v9BrV8FzW+pSwj2QFEUahaeBlmB2yx5ZjjPET88A649BDg4h"
+    "2jlHd7IcBAESZnbcPf5Uc39g1gq32jdM4l3ZxacAC7Xzq4036GAfNuq9H9raqrwh5xbxH4"
+    "GYBmkN3ikL+VO22lc3UuBSQI+0tVuZcR+PiIBDCA/bs+JsL7Lt25i8lW2235aQkpfMqUwi"
+    "deCiJWsQdOrYhV7KVYq1Tj3rE968Ey9EAYCSM+1p9rxkOGUhwbsx/GelX3kScwrYK1SU/H"
+    "WcXsoby7Pp2k27vSlM69osrktArNgk+WB/A5E0hHYjsoqPEZQASMei4ZY92jp5HcyfT0kT"
+    "lYxQI6OV7CBDo5zj5p55g3gg6tYKWUxP8UuC5aO5IwZherMCx1AXLblSriKJQtJGyxwZgE"
+    "+MJGrr0O0zGmLBy+Q8RT1sAtahwtD+pFt3sdA/VC4YfmHY4svDkhCCMiyw8sKx1VnPmxj6"
+    "6H71FWxPeIJbhSfA8+AZbte7DhTuF71N/3IH8XsNso/WasjcUwVr7KGM1/hHZGFDYdQ4al"
+    "JtXFWzB+n8HQxWtiARwZllriKKre6+ZLiFj/3lhmIta/Z2ItGutnzxSJTo/hHNiA84/PPT"
+    "DRM5Rj8qCa6kk5qwqKi5REuwpXx4HZwFhTHILdtmviUMuNx69leqEUkRQHlAEr2/dk5bKF"
+    "Xa+oMdz+arn+cdfgCZhiA+y+u6XCERCOQL4jENMHyWUiL+7Ns4r4t/Cx9s4YFz7WXopV7P"
+    "0Se7/E3q+K+GpHYu9XZfZ+iWASvzKQu6jWA0FFj6g5AmgYkY0K0AhueFwPjTZ92kvdcfHs"
+    "6dD1bLgJVFT6rJqBUmasjcydlEAbnVPZUbZw4pYcYqNHPJIwG3PeY7AviW8ObscDiY7IP8"
+    "h4EtH28DHo1h2sV3nSkaPPxprtmOhl+T4TfYkuDncXx96JuF9VLbytxf1quOXSs007OdMb"
+    "arfdRRJDnQOodLTbXveqJ/f755IFNaT88Kx1B7An3yvyl3PJAU8WeB7Adrcjn0tmsNYW3n"
+    "dwssy+g5PsfQcn/GCf6f6VZMsqDEq/RfzX0LJbKLsKFrcEhPkxuYhrAwG5ammNCsXf6Gfn"
+    "xlVZyyVpSVsjBWYofI6RE6S1lPO5gwq6Ef6d3z81m+/efWgev3v/8ez0w4ezj8cfES15p2"
+    "TXh7zEhXKFUxAx8SVzEk/AcVPX00x0GY6VkF1J15ysjWvz5PTD6cd3709DOMOWPBSTiBGL"
+    "u4BipvRbVMzweGOquRRDTiTC9iBjIhJheynWRFCLhicKJnQ4tgNMgokM4jpXG5FoVtGbjV"
+    "imQwRN3Ae1ifRrGJBNgHh4CUROjWekD8UFRxu74CgI46+P3pI5xuoOvZg2X2Lgicx/aZn/"
+    "sTUxkTC2kvSuDqSpZvAGsrotZn2pj2KLoTGc2MZjsBdGJP59ODJUz0ECgrMqLj1IYT08es"
+    "GjaoZGoRIIFrgpftm0iHfA2oVAtdEfy6IXPa8+ineFkpBQqWaUhrBKN79ERIup+k0fJe4F"
+    "qyC5yJI/PjzoJnUaEYEozSizNCOQ9irHEnGsInJZsYA0mc3FJgrDciiRkErcjF0rxHJiR1"
+    "S9b8d5r5DBc8T5n8xEqtqtzhVGLeta5xC1bHe97Jpbxi/JMLHinssCI4svH19oZzVa0oA6"
+    "WtLwZdCQgDkC59IP/LgfkqFDaHsSuShUmkPPmkg/fGrnh2S50oMFLXcMzLcNTmCbfG6uxR"
+    "dwpRh9sYLhGJkw/co0/UQdwl6afcEMKmjHxLkOxZQRCWuRe93tiffCR1sCsRyPQ+Rb18q3"
+    "CodtFYeNGqkCON5wEDvU9+l20lgKJcPtZVMsC5xemt1Z0uNVx4BeGie9sR1porvIEwXQ+0"
+    "0y5+B37GBI9JGS/SDp5O6Uf0k2RO32M+J1SEvS593ok8Vp59sym7JdWV9YK+QwYoz1dGVr"
+    "4rrSz871XfEcXEGKDJvYt7ZjEYqo0l5GlarjqJZ9t8QG3dQiVtsin4wWvpTsWGwJ3fX9sU"
+    "1buUGZVaaVG5VhLbRymeKvsupn6DZUPpsiTM2yTc2abBlecyHb8K5hy9VcqM/csZ1iFiw6"
+    "VZflFIfqcsc8FLwAcYOXH1bL1Snl9kNjrEO0ZFA9UADnJOeuEGfU6nBuTTwLum/xD5akWc"
+    "uRg/AphE9xqMmvShQoViomIuoTF6FW5/rE6iZrssoTq5Cmic5KzfBgY4epLnBh44e4bum8"
+    "UPJYDCk58lM4sqUfyilW34KrbzQ8C5qhMUZhhlbMDBW1a6ISazeVWLsxF4gdlmIlUPss2z"
+    "jABpC4HL7+S/+D5bhep+BVfDEmcS53CCYuHiqKJcsjoAyhBFPdmhTBMWTYDIhlJz+3AOFM"
+    "d91n20nRlHmHZ0c8YjQySat74FjogSlgLshZsYwiZSWC+QfgRYnjb/dArOHxM0uWMe3uer"
+    "TqRIlTdzdMARqucLQmHDf+U+oPB3vD++pwLB8XqCgc4Yk527tEr6JI0IFx8EAwR25tQH/u"
+    "yfmK7OjY5U2LVR4zuzljsEKIlB0i7QPXxzcjVBr2Hy0KmWouSypCp3UOnWJ5KoULcJSDSh"
+    "LFj0J9QJ1j1X5MO0A5594gjq+ecalSrnYTAZQ98LT9AMpaO4Y2t9y1gGMZ47SFLujJXeL0"
+    "iKYya1vmZozUpS1lH0YgsZ1mCzayCWOFnSzZWjl7K0tNFHIpiQI8NQqAGJDXE8CT4+MlAE"
+    "RU2Ze94j5uRbOhl3rtR84Gi4hF7GXhVyO6h2Kny8vr/wHI9d7o"
+)
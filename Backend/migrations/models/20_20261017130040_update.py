@@ -0,0 +1,90 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_activities_org_id_339efd" ON "activities" ("org_id", "action", "created_at", "id");
+        CREATE INDEX IF NOT EXISTS "idx_activities_org_id_821322" ON "activities" ("org_id", "created_at", "id");
+        CREATE INDEX IF NOT EXISTS "idx_activities_org_id_95a701" ON "activities" ("org_id", "entity_type", "created_at", "id");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_activities_org_id_95a701";
+        DROP INDEX IF EXISTS "idx_activities_org_id_821322";
+        DROP INDEX IF EXISTS "idx_activities_org_id_339efd";"""
+
+
+MODELS_STATE = (
+    "eJztXW1z2rgW/isePnVnsp2EJn3JvXNnSPBmvU0gA06609JxDVbAN1hmbZM0t5P/fiXZsm"
+    "X5BQwYbNCX7kY6x9jPkY7Om6RfDcs2wNR92xp55pPpvTTOpV8NqFsA/U+i70hq6LNZ1IMb"
+    "PH04JcS6T2UC0qwPXc9BTajnQZ+6ADUZwB055swzbYha4Xw6xY32CBGacBw1zaH5zxxonj"
+    "0G3gQ4qOPbd9RsQgP8RA9Hf35r2M5YMw38QyMH6B4wNN3Df6E2RMv2A+ihV9e8lxlYhhx/"
+    "BXq/VEr8FrNH7cEEUyOGk89K2v0fQm13d0r7D0KJv3Kojezp3IIR9ezFm9gwJJ/PTeMt5s"
+    "F9YwCBg3+cQQ+DE0BNm3ygUIPnzEGIkBE1GOBBn0+xDBr/fphD8mkS+SX8z+l/GgWkMrIh"
+    "lqgJPSyCX6/+V0XfTFob+Kcu/2z13rx7/xv5Stv1xg7pJIg0Xgmj7uk+KxFnBCQnrDiilx"
+    "PdkeHcIqgq6G10OAIJdLlHcDCjT1gFYNoQIRwNagoxhS6GZ0Nt9T8jeeju4wDe9rp/yZfq"
+    "uTRz7P+CkTeA3d5Vq6N8balKt3MuoVGoQ/N/Oh2Bi6XQsPSf2hTAsTdBf540c6Ry3+oRwZ"
+    "w0iWBsNDn9edsJepqkC8snIY9i4zvGtMlhvrIUtjKqI9QiHbLKAI64qzB2tcue3FLltj+G"
+    "tUApDiDp66st9a6vIWg6VyEJ+ixv7mqjiQ7HIWVb7l/2lFs8zrW72zbzROY3tfnMYJ7e6v"
+    "eVq05IqLuuOYZh712H659DjkJV1GuZ+zU0Mqcg/jt9Tbm57fZCGlczrZntkP5gxkYgBDM3"
+    "woFShD9DKcLfoBR4lin3LInujCbmE0vTk/tqt8fSoFHm2Q6mYXVF9EKszojeKkYbvlqMNn"
+    "y/GG1bvpaTtGitB4T2Rr65kHtaq93GNBawhsDRdMNg+nryTfee6XWAZT+x/V0klHDEUCIb"
+    "SSUYMatovubpEpqveZqp+XBXfA5bwNPxMpWcxX/1u510xcfycHP3DiIcvxnmyDuSpqbrfV"
+    "9iJgeLeDXUH/5q/M6W6/4zZcF7c9P6m8f18rp7wetJ/IALDuS5i2RfbHFhWA5xaYkM1WUB"
+    "izgOEa+4ER/HrI16PNMC6bjFOTnsjID1Lf2famLYQN9gdOH0JdAmOZiqyg1ae1o3t7FJjh"
+    "cO3NMkrS9c65v33MQPHyJ9UdQ/Jfyn9LXbkXlBhXTq1wZ+J33u2Rq0n/FSEik+2kqBecX+"
+    "18Mj4zjghqE+enzWHUNL9NhNO4s22WU1Lb5Fh/qYiAWDi1+TusNzsuYk3WTcfpTrIlOKMp"
+    "1j4aWW7aXa3izduM/QwD75jq355ZVGzLJ6v4RhxauByK56z5tVePlWCi/4yqGvX61Vl6+W"
+    "WL2qsnrFpoHvfBUXa4xRiHWnYiUvXxGb5NK2LAC9NLOEduVaJiOfaEuhewK9H+BgIu1oUI"
+    "sQe+nGC/oRLxgOcTRV8NPLWEsilroYMXlKRf5bzY9khDrlutu5ouR8eEOs03un0MU6vZdi"
+    "DV5eBNFWdUJoLqIYZnGuQ8RtZ+HtSmUOFgCWMKBj8zSJ3R+2A8wx/AxeEmlUDrHA/u1yWf"
+    "XKjraoNRKhoz+HxjCjhcKcHAG41b9steVG2pzdAH630ZPqC11cGS2GD8/DDWB3FzymqvN1"
+    "IW6MPoqB1pdVqXN3fd143Y2/ewOQ5US+L+Hv0q6jPH/X8om26O+ioeJ4GjH3hJdbupdL6j"
+    "yKBOlDhrp4uFwBxNnZMhUQZ2fZJRC4L26/sG+WgDI7XMCxrQRopSyYUiIGY9seT4GGFZE2"
+    "NeFjkcGaxlvPcXu2VM3iWU7R4lmyapFRtQlQ8932OGc9/faa+On0s3PjLwAaK8mR5RNS3L"
+    "UUZ2hSmSNzpkNsgLtJYWaX1KWwiso6TkRplXUiHr0HgUsRj95LsSbi0bTUcFh0p0WC8UBi"
+    "hiKYL2KsFYixRtNPhApTlFHFAoZ4o4k7MWeN1Jhh2HuUHzakdCVEDr8xtY7s9hsl2Hoqan"
+    "y3GEAUhaqFl2F2wBZbjjnOQ8QP74BLDwEu3jFKebcXAgwUYXLWNvxdfnRj3wC22jdK51zS"
+    "DcuEA9j90sGd9jMMmHdbje5vVV0V9oh7i8DPADSC7BaH/K3caSudq3MpIEHYX6rKvYzAxy"
+    "czgAHs3/UxEd536c5dTLbabstPS0jhU6YUPvFSELGKPXBqRaxiL8VapRr3ju2ZD+ZID4SR"
+    "MOJj/blmPGQoyy8BEMb6Noz1qu4jT2BaBWuTno6zitlDeXd9Okm3d6UpnXtFlclpFZoJn0"
+    "wP4HMmkI7EdlBQ4zOACBj1XBpNdI+eRnIn09NH5mAVC+jkeAkT6OQ4+6SdY94IOrSClVIS"
+    "/xZwXbR2JGHMLlZhWOoC5LYrVcRRKFtI2GKDMQnwhY1cex2mY0xZOHyHiKesgVvUOFoe1I"
+    "tu9zoG6oXCD807HFl4c0IQRkSmH1hWOqo482MfXQ/fo6yI7xFLcKX4HnwCLNv3YMOdwveo"
+    "v+9B/lvAbqP0m7E2FsNY+SpjNP8R2hlR2HQMGZaaVBdvwfh9BkMXr4kFcGRYaomjqHqvmy"
+    "8hYv17Y5mJWP+eibVorJ89UyQ6PYZzYAPOPz73wFTPUI7Jg2qqJ+WsKiguUhLtKlwdB2YD"
+    "Y01xCHbbrolDLTcev5bphVJEUhxQBqxs35OVyxZ2vX4PrlbAP2e6/nHX4AmImxT23i0Vjo"
+    "BwBPIdgZg+SC4TeXFvnlXEv4WPtXfGuPCx9lKsYu+X2Psl9n5VxFc7Enu/KrP3SwST+JWB"
+    "3EW1HggqekTNEUDDiGxUgKPgYsn10GjTp73UHRfPtoauZ8NNoKLSZ9UMlDJjbWTupATa6J"
+    "zKjrKFE7fkEBs94pGE2ZjzHoN9SXxzcDseSHRE/kHGk4i2h49Bt+5gvcqTjh19NtFsx0Av"
+    "y/cZ6Et0cbi7OPZOxP2qauFtLe5Xwy2Xnm3YyZneULvtLpIY6hxApaPd9rpXPbnfP5dMqC"
+    "Hlh2etO4A9+V6Rv5xLDngywfMAtrsd+VwygrW28L6Dk2X2HZxk7zs44Qf7TPevJFtWYVD6"
+    "LeK/hpbdQtlVsLglIMyPyUVcGwjIVUtrVCj+Rj87N67KWi5JS9ocKzBD4XOMnCDNpZzPHV"
+    "TQjfHv/P6p2Xz37kPz+N37j2enHz6cfTz+iGjJOyW7PuQlLpQrnIKIiS+Zk3gCjpu6nmai"
+    "y3CshOxKuuZkbVybJ6cfTj++e38awhm25KGYRIxY3AUUM6XfomKGxxtTzaUYciIRtgcZE5"
+    "EI20uxJoJaNDxRMKHDsR1gEkxkENe52ohEs4rebMQyHSJo4j6oTaRfw4BsAsTDSyByajwj"
+    "fSguONrYBUdBGH999JbMMVZ36MW0+RIDT2T+S8v8T8ypgYSxlaR3dSBNNYM3kNVtMetLfR"
+    "RbDI3h1B49BnthROLfhyND9RwkIDir4tKDFNbDoxc8qmZoFCqBYIGz8MumRbwD1i4Eqo3+"
+    "WRa96Hn1UbwrlISESjWjNIRVuvklIlpM1W/6KHEvWAXJRZb88eFBN6nTiAhEaUaZpRmBtF"
+    "c5lohjFZHLigWkyWwuNlEYlkOJhFTiZuxaIZYTO6LqfTvOe4UMniPO/2QmUtVuda4walnX"
+    "OoeoZbvrZdfcMn5JhokV91wWGFl8+fhCO6vRkgbU0ZKGL4OGBIwxOJd+4Mf9kEY6hLYnkY"
+    "tCpTn0zKn0w6d2fkimKz2Y0HQnwHjb4AS2yefmWnwBV4rRFysYjpEJ069M00/UIeyl2RfM"
+    "oIJ2TJzrUEwZkbAWudfdnngvfLQlEMvxOES+da18q3DYVnHYqJEqgOMNB7FDfZ9uJ42lUD"
+    "LcXjbFssDppdmdJT1edQLopXHSG9uRprqLPFEAvd8kYw5+xw6GRB8p2Q+STu5O+ZdkQ9Ru"
+    "PyNeh7Qkfd6NPlmcdr4tsynblfWFtUIOI8ZYT1e2Jq4r/exc3xXPwRWkyLCJfWs7FqGIKu"
+    "1lVKk6jmrZd0ts0E0tYrUt8slo4UvJjsWW0F3fH9u0lRuUWWVauVEZ1kIrlyn+Kqt+hm5D"
+    "5bMpwtQs29SsyZbhNReyDe8aNl3NhfrMndgpZsGiU3VZTnGoLnfMQ8ELEDd4+WG1XJ1Sbj"
+    "8cTXSIlgyqBwrgnOTcFeKMWh3OzalnQvct/sGSNGs5chA+hfApDjX5VYkCxUrFRER94iLU"
+    "6lyfWN1kTVZ5YhXSNNFZqRkebOww1QUubPwQ1y2dF0oeiyElR34KR7b0QznF6ltw9Y2GZ0"
+    "EzNMYozNCKmaGidk1UYu2mEms35gKxw1KsBGqfZRsH2AASl8PXf+l/MB3X6xS8ii/GJM7l"
+    "DsHExUNFsWR5BJQhlMDSzWkRHEOGzYBYdvJzCxDOdNd9tp0UTZl3eHbEI0Yjk7S6B46JHp"
+    "gC5oKcFcsoUlYimH8AXpQ4/nYPxBoeP7NkGdPurkerTpQ4dXeDBdBwheM14bjxn1J/ONgb"
+    "3leHY/m4QEXhCE/M2d4lehVFgg6MgweCOXJrA/pzT85XZEfHLm9arPKY2c0ZgxVCpOwQaR"
+    "+4Pr4ZodKw/2hRyFRzWVIROq1z6BTLUylcgKMcVJIofhTqA+qcqPZj2gHKOfcGcXz1jEuV"
+    "crWbCKDsgaftB1DW2jG0ueWuBRxzNElb6IKe3CVOj2gqs7ZlbsZIXdpS9mEEEttptmAjmz"
+    "BW2MmSrZWzt7LURCGXkijAU6MAiAF5PQE8OT5eAkBElX3ZK+7jVjQbeqnXfuRssIhYxF4W"
+    "fjWieyh2ury8/h9b9wQm"
+)
@@ -0,0 +1,126 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "organizations" ADD "activity_retention_days" INT;
+-- Rebuild activities as a table range-partitioned by month; the key has to include created_at
+CREATE TABLE "activities_partitioned" (
+    LIKE "activities" INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING COMMENTS
+) PARTITION BY RANGE ("created_at");
+ALTER TABLE "activities_partitioned" ADD CONSTRAINT "activities_partitioned_pkey" PRIMARY KEY ("id", "created_at");
+CREATE TABLE "activities_default" PARTITION OF "activities_partitioned" DEFAULT;
+-- One partition per UTC month from the oldest activity through three months ahead
+DO $$
+DECLARE
+    month TIMESTAMP := date_trunc('month', COALESCE((SELECT min("created_at") FROM "activities"), now()) AT TIME ZONE 'UTC');
+BEGIN
+    WHILE month <= date_trunc('month', now() AT TIME ZONE 'UTC') + INTERVAL '3 months' LOOP
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF "activities_partitioned" FOR VALUES FROM (%L) TO (%L)',
+            'activities_p' || to_char(month, 'YYYYMM'),
+            month AT TIME ZONE 'UTC',
+            (month + INTERVAL '1 month') AT TIME ZONE 'UTC'
+        );
+        month := month + INTERVAL '1 month';
+    END LOOP;
+END $$;
+INSERT INTO "activities_partitioned" SELECT * FROM "activities";
+DROP TABLE "activities";
+ALTER TABLE "activities_partitioned" RENAME TO "activities";
+ALTER TABLE "activities" RENAME CONSTRAINT "activities_partitioned_pkey" TO "activities_pkey";
+CREATE INDEX IF NOT EXISTS "idx_activities_org_id_339efd" ON "activities" ("org_id", "action", "created_at", "id");
+CREATE INDEX IF NOT EXISTS "idx_activities_org_id_821322" ON "activities" ("org_id", "created_at", "id");
+CREATE INDEX IF NOT EXISTS "idx_activities_org_id_95a701" ON "activities" ("org_id", "entity_type", "created_at", "id");
+CREATE SCHEMA IF NOT EXISTS "activity_archive";"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "organizations" DROP COLUMN "activity_retention_days";
+-- Back to a single table; partitions already moved to the archive schema are left there
+CREATE TABLE "activities_plain" (
+    LIKE "activities" INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING COMMENTS
+);
+INSERT INTO "activities_plain" SELECT * FROM "activities";
+DROP TABLE "activities";
+ALTER TABLE "activities_plain" RENAME TO "activities";
+ALTER TABLE "activities" ADD CONSTRAINT "activities_pkey" PRIMARY KEY ("id");
+CREATE INDEX IF NOT EXISTS "idx_activities_org_id_339efd" ON "activities" ("org_id", "action", "created_at", "id");
+CREATE INDEX IF NOT EXISTS "idx_activities_org_id_821322" ON "activities" ("org_id", "created_at", "id");
+CREATE INDEX IF NOT EXISTS "idx_activities_org_id_95a701" ON "activities" ("org_id", "entity_type", "created_at", "id");"""
+
+
+MODELS_STATE = (
+    "eJztXW1z2rgW/isePnVnsp2EJn3JvXNnSPBmvU0gA06609JxDVbAN1hmbZM0t5P/fiXZsm"
+    "X5BQwYbNCX7kY6x9jPkY7Om6RfDcs2wNR92xp55pPpvTTOpV8NqFsA/U+i70hq6LNZ1IMb"
+    "PH04JcS6T2UC0qwPXc9BTajnQZ+6ADUZwB055swzbYha4Xw6xY32CBGacBw1zaH5zxxonj"
+    "0G3gQ4qOPbd9RsQgP8RA9Hf35r2M5YMw38QyMH6B4wNN3Df6E2RMv2A+ihV9e8lxlYhhx/"
+    "BXq/VEr8FrNH7cEEUyOGk89K2v0fQm13d0r7D0KJv3Kojezp3IIR9ezFm9gwJJ/PTeMt5s"
+    "F9YwCBg3+cQQ+DE0BNm3ygUIPnzEGIkBE1GOBBn0+xDBr/fphD8mkS+SX8z+l/GgWkMrIh"
+    "lqgJPSyCX6/+V0XfTFob+Kcu/2z13rx7/xv5Stv1xg7pJIg0Xgmj7uk+KxFnBCQnrDiilx"
+    "PdkeHcIqgq6G10OAIJdLlHcDCjT1gFYNoQIRwNagoxhS6GZ0Nt9T8jeeju4wDe9rp/yZfq"
+    "uTRz7P+CkTeA3d5Vq6N8balKt3MuoVGoQ/N/Oh2Bi6XQsPSf2hTAsTdBf540c6Ry3+oRwZ"
+    "w0iWBsNDn9edsJepqkC8snIY9i4zvGtMlhvrIUtjKqI9QiHbLKAI64qzB2tcue3FLltj+G"
+    "tUApDiDp66st9a6vIWg6VyEJ+ixv7mqjiQ7HIWVb7l/2lFs8zrW72zbzROY3tfnMYJ7e6v"
+    "eVq05IqLuuOYZh712H659DjkJV1GuZ+zU0Mqcg/jt9Tbm57fZCGlczrZntkP5gxkYgBDM3"
+    "woFShD9DKcLfoBR4lin3LInujCbmE0vTk/tqt8fSoFHm2Q6mYXVF9EKszojeKkYbvlqMNn"
+    "y/GG1bvpaTtGitB4T2Rr65kHtaq93GNBawhsDRdMNg+nryTfee6XWAZT+x/V0klHDEUCIb"
+    "SSUYMatovubpEpqveZqp+XBXfA5bwNPxMpWcxX/1u510xcfycHP3DiIcvxnmyDuSpqbrfV"
+    "9iJgeLeDXUH/5q/M6W6/4zZcF7c9P6m8f18rp7wetJ/IALDuS5i2RfbHFhWA5xaYkM1WUB"
+    "izgOEa+4ER/HrI16PNMC6bjFOTnsjID1Lf2famLYQN9gdOH0JdAmOZiqyg1ae1o3t7FJjh"
+    "cO3NMkrS9c65v33MQPHyJ9UdQ/Jfyn9LXbkXlBhXTq1wZ+J33u2Rq0n/FSEik+2kqBecX+"
+    "18Mj4zjghqE+enzWHUNL9NhNO4s22WU1Lb5Fh/qYiAWDi1+TusNzsuYk3WTcfpTrIlOKMp"
+    "1j4aWW7aXa3izduM/QwD75jq355ZVGzLJ6v4RhxauByK56z5tVePlWCi/4yqGvX61Vl6+W"
+    "WL2qsnrFpoHvfBUXa4xRiHWnYiUvXxGb5NK2LAC9NLOEduVaJiOfaEuhewK9H+BgIu1oUI"
+    "sQe+nGC/oRLxgOcTRV8NPLWEsilroYMXlKRf5bzY9khDrlutu5ouR8eEOs03un0MU6vZdi"
+    "DV5eBNFWdUJoLqIYZnGuQ8RtZ+HtSmUOFgCWMKBj8zSJ3R+2A8wx/AxeEmlUDrHA/u1yWf"
+    "XKjraoNRKhoz+HxjCjhcKcHAG41b9steVG2pzdAH630ZPqC11cGS2GD8/DDWB3FzymqvN1"
+    "IW6MPoqB1pdVqXN3fd143Y2/ewOQ5US+L+Hv0q6jPH/X8om26O+ioeJ4GjH3hJdbupdL6j"
+    "yKBOlDhrp4uFwBxNnZMhUQZ2fZJRC4L26/sG+WgDI7XMCxrQRopSyYUiIGY9seT4GGFZE2"
+    "NeFjkcGaxlvPcXu2VM3iWU7R4lmyapFRtQlQ8932OGc9/faa+On0s3PjLwAaK8mR5RNS3L"
+    "UUZ2hSmSNzpkNsgLtJYWaX1KWwiso6TkRplXUiHr0HgUsRj95LsSbi0bTUcFh0p0WC8UBi"
+    "hiKYL2KsFYixRtNPhApTlFHFAoZ4o4k7MWeN1Jhh2HuUHzakdCVEDr8xtY7s9hsl2Hoqan"
+    "y3GEAUhaqFl2F2wBZbjjnOQ8QP74BLDwEu3jFKebcXAgwUYXLWNvxdfnRj3wC22jdK51zS"
+    "DcuEA9j90sGd9jMMmHdbje5vVV0V9oh7i8DPADSC7BaH/K3caSudq3MpIEHYX6rKvYzAxy"
+    "czgAHs3/UxEd536c5dTLbabstPS0jhU6YUPvFSELGKPXBqRaxiL8VapRr3ju2ZD+ZID4SR"
+    "MOJj/blmPGQoyy8BEMb6Noz1qu4jT2BaBWuTno6zitlDeXd9Okm3d6UpnXtFlclpFZoJn0"
+    "wP4HMmkI7EdlBQ4zOACBj1XBpNdI+eRnIn09NH5mAVC+jkeAkT6OQ4+6SdY94IOrSClVIS"
+    "/xZwXbR2JGHMLlZhWOoC5LYrVcRRKFtI2GKDMQnwhY1cex2mY0xZOHyHiKesgVvUOFoe1I"
+    "tu9zoG6oXCD807HFl4c0IQRkSmH1hWOqo482MfXQ/fo6yI7xFLcKX4HnwCLNv3YMOdwveo"
+    "v+9B/lvAbqP0m7E2FsNY+SpjNP8R2hlR2HQMGZaaVBdvwfh9BkMXr4kFcGRYaomjqHqvmy"
+    "8RHBL9ojkAHylADpfUX1ImvwIzcM55Aoe5CZfZtLaDMTzGv/N78+T0w+nHd+9PPyIS8iph"
+    "y4ccsWTauyJ/Un9rV+RP9kysRfMn7Dkt0Yk8XFAg4Pzjcw9M9YwFJ3n4T/WknFVZxkWfop"
+    "2aq+PAbAqtKQ7BDuY1cajlZu7XMj17ikiKU8+Ale3Ps3LZwk7i78F1FfjnTNc/Qhw8AXE7"
+    "xd67+sK5Es5VvnMV0wfJZSIvl8CzipyC8LH2zhgXPtZeilXspxP76cR+uor4akdiP11l9t"
+    "OJYBK/MpD7vdYDQUWPqDkCaBiRzR9wFFzWuR4abfq0l7rj4tnW0PVsuAlUVPqsmoFSZqyN"
+    "zJ2UQBudU9lRtnDilhxio8dmkjAbc4ZmsNeLbw5uHASJjsg/yHgS0fbwMejWHaxXedKxo8"
+    "8mmu0Y6GX5PgN9iS4OzBdHCYq4X1UtvK3F/Wq4jdWzDTs50xtqt91FEkOdA6h0tNte96on"
+    "9/vnkgk1pPzwrHUHsCffK/KXc8kBTyZ4HsB2tyOfS0aw1hbey3GyzF6Ok+y9HCf8YJ/p/j"
+    "VvyyoMSr9F/NfQslsoZQsWtwSE+TG5iGsDAblqaY0Kxd/oZ+fGVVnLJWlJm+PM6i6OsV4V"
+    "XZ+azXfvPjSP373/eHb64cPZx+OwtCvZlVfjdaFc4RRETHzJnMQTcNzU9TQTXYZjJWRX0j"
+    "Una+O6sUo5YnEXUMyUfouKGR5vTDWXYsiJRNgeZExEImwvxZoIatHwRMGEDsd2gEkwkUFc"
+    "Azw/mlX0tiiW6RBBE3dsbSL9GgZkEyAeXgKRU+MZ6UNxadTGLo0Kwvjro7dkjrG6Qy+mzZ"
+    "cYeCLzX1rmf2JODSSMrSS9qwNpqhm8gaxui1lf6qPYYmgMp/boMdgLIxL/PhwZqucgAcFZ"
+    "FZceTrEeHr3gUTVDo1AJBAuchV82LeIdsHYhUG30z7LoRc+rj+JdoSQkVKoZpSGs0s0vEd"
+    "Fiqn7Tx7N7wSpILgflj2QPukmdRkQgSjPKLM0IpL3KUU8cq4hcViwgTWZzsYnCsBxKJKQS"
+    "t43XCrGc2BFV79tx3itk8Bxx/iczkap2U3aFUcu6KjtELdtdL7vmlvFLMkysuOeywMjiy8"
+    "cX2lmNljSgjpY0fBk0JGCMwbn0Az/uhzTSIbQ9iVy+Ks2hZ06lHz6180MyXenBhKY7Acbb"
+    "BiewTT431+ILuFKMvljBcIxMmH5lmn6iDmEvzb5gBhW0Y+Jch2LKiIS1yL3u9hYB4aMtgV"
+    "iOxyHyrWvlW4XDtorDRo1UARxvOIgd6vt042sshZLh9rIplgVOL83uLOnxqhNAL+KT3tiO"
+    "NNVd5IkC6P0mGXPwO3YwJPpIyX6QdHIfzb8kG6J2+xnxOqQl6fNu9MniBPltmU3ZrqwvrB"
+    "VyGDHGerqyNXFd6Wfn+q54Dq4gRYZN7FvbsQhFVGkvo0rVcVTLvq9jg25qEattkU9GC19K"
+    "diy2hO76/timrdygzCrTyo3KsBZauUzxV1n1M3QbKp9NEaZm2aZmTbYMr7mQbXjXsOlqLt"
+    "Rn7sROMQsWnarLcopDdbljHgpeKrnBCyWr5eqUcqPkaKJDtGRQPVAA5yTnrhBn1Opwbk49"
+    "E7pv8Q+WpFnLkYPwKYRPcajJr0oUKFYqJiLqExehVuf6xOoma7LKE6uQponOSs3wYGOHqS"
+    "5wYeOHuG7pvFDyWAwpOfJTOLKlH8opVt+Cq280PAuaoTFGYYZWzAwVtWuiEms3lVi7MReI"
+    "HZZiJVD7LNs4wAZQ+SaBWPrLXvofTMf1OgWv4osxiXO5QzBx8VBRLFkeAWUIJbB0c1oEx5"
+    "BhMyCWnfzcAoQz3XWfbSdFU+Ydnh3xiNHIJK3ugWOiB6aAuSBnxTKKlJUI5h+AFyWOv90D"
+    "sYbHzyxZxrS769GqEyVO3d1gATRc4XhNOG78p9QfDvaG99XhWD4uUFE4whNztneJXkWRoA"
+    "Pj4IFgjtzagP7ck/MV2dGxy5sWqzxmdnPGYIUQKTtE2geuj29GqDTsP1oUMtVcllSETusc"
+    "OsXyVAoX4CgHlSSKH4X6gDonqv2YdoByzr1BHF8941KlXO0mAih74Gn7AZS1dgxtbrlrAc"
+    "ccTdIWuqAnd4nTI5rKrG2ZmzFSl7aUfRiBxHaaLdjIJowVdrJka+XsrSw1UcilJArw1CgA"
+    "YkBeTwBPjo+XABBRZV/2ivu4Fc2GXuq1HzkbLCIWsZeFX43oHoqdLi+v/wdNQXKN"
+)
@@ -0,0 +1,115 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "activity_rollups" (
+    "id" UUID NOT NULL PRIMARY KEY,
+    "org_id" UUID NOT NULL,
+    "project_id" UUID NOT NULL,
+    "day" DATE NOT NULL,
+    "action" VARCHAR(64) NOT NULL,
+    "count" INT NOT NULL DEFAULT 0,
+    CONSTRAINT "uid_activity_ro_org_id_faa611" UNIQUE ("org_id", "project_id", "day", "action")
+);
+CREATE INDEX IF NOT EXISTS "idx_activity_ro_org_id_f9ab48" ON "activity_rollups" ("org_id", "day");
+COMMENT ON TABLE "activity_rollups" IS 'Activity counts per organization, project, UTC day and action, kept current by the activity writer.';
+-- Backfill from the history still kept; task activities take the project of their task, so tasks deleted since are skipped
+INSERT INTO "activity_rollups" ("id", "org_id", "project_id", "day", "action", "count")
+SELECT gen_random_uuid(), a.org_id, p.project_id, (a.created_at AT TIME ZONE 'UTC')::date, k.action, sum(k.weight)
+FROM "activities" AS a
+CROSS JOIN LATERAL (
+    SELECT CASE WHEN a.entity_type = 'task' THEN (SELECT t.project_id FROM "tasks" AS t WHERE t.id = a.entity_id)
+                WHEN a.entity_type = 'project' THEN a.entity_id END AS project_id
+) AS p
+CROSS JOIN LATERAL (
+    SELECT CASE WHEN a.action = 'task_status_changed' THEN a.action || ':' || (a.metadata->>'new_status') ELSE a.action END AS action,
+           CASE WHEN a.action = 'tasks_imported' THEN COALESCE((a.metadata->>'tasks')::int, 0) ELSE 1 END AS weight
+) AS k
+WHERE p.project_id IS NOT NULL
+GROUP BY a.org_id, p.project_id, (a.created_at AT TIME ZONE 'UTC')::date, k.action;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "activity_rollups";"""
+
+
+MODELS_STATE = (
+    "eJztXf9z4rYS/1c8/NLrTHqT5JLcXd6bN0MCTd0mkAEn7fS48QmsgF9AprZJmte5//1Jsm"
+    "XL8hdswGCDfskd0q5sfyStdler1T+NmWXAqfO+OXLNF9N9a1wq/zQQmEH8n1jdkdIA83lY"
+    "QwpcMJxSYuBRmZAWg6Hj2rgI1zyBqQNxkQGdkW3OXdNCuBQtplNSaI0woYnGYdECmX8toO"
+    "5aY+hOoI0rvnzFxSYy4N+4cfzzS8Oyx7ppkAeNbAhcaOjAJb9wGabl6yFy8avr7tsc5iEn"
+    "X4HfL5GSvMX8WX8y4dSI4OSx0nLvQbjs4UFt/UwpyVcO9ZE1XcxQSD1/cycWCsgXC9N4T3"
+    "hI3RgiaJOHc+gRcHyoWZEHFC5w7QUMEDLCAgM+gcWU9EHj308LRD9NoU8if87+0yjQKyML"
+    "kR41kUu64J/v3leF30xLG+RR1780e+8+XPxIv9Jy3LFNKykije+UEbjAY6XdGQIpdFYU0e"
+    "sJsNtoMaOoqvhtABrBGLpCEwLM+BNWAZgVhAiHg5pBzKCL4NnQmv3fcH8A53mA7nvdX9vX"
+    "2qUyt63/wpE7QN3eTbOj/tnU1G7nUsGjECDzf4CNwOW90JiBv/UpRGN3gn+enGb0ymOzRz"
+    "vm5JR2jIUnpzdvO37NKa0i/RPrj2LjO8K0yWG+ci9sZVSHqIUyZJUBHHJXYezq1712U2u3"
+    "vDGs+0JxgGhdX2tqD30dQ9O5CUjwZ7kLRx9NABoHlK12/7qn3pNxrj/ct7gWuWfqi7nBtd"
+    "7s99WbTkAIHMcco6D2oSPUL5BAoanabVt4Gh6ZUxh9Tl9X7+67vYDG0c3Z3LJpvT9jQxD8"
+    "mRviwCiCxzCK4BmMgswy9ZEnAfZoYr7wNL12X+v2eBo8ylzLJjS8rAhfiJcZ4VtFaINXi9"
+    "AG7xehbbVv23FavNZDSnvXvrtq9/Rmq0VoZnA2hLYODIOr67Xvuo9crQ1n1gtf38WdEowY"
+    "RmThXvFHzCqS7/Qsh+Q7PUuVfKQqOodn0AVkmYrP4l/73U6y4ON5hLn7gDCOXwxz5B4pU9"
+    "Nxv+aYyf4iXg3xR76avPPMcf6a8uC9u2v+IeJ6fdu9EuUkaeBKAHnh4L4vtrhwLIe4tISK"
+    "al7AQo5DxCuqxEcxa+Ea15zBZNyinAJ2hs/6nv2nmhg28DcYXTR986VJBqaaeofXnubdfW"
+    "SSk4WD1JzS0jeh9N2FMPGDRpTfVe0XhfxU/ux22mJHBXTanw3yTmDhWjqyXslSEgo+VsqA"
+    "+U7sr6dnznAgBUMwen4FtqHHaqxTK402XjU7nYklAIEx7RYCLnlNwRzuWdPpYt7IMJh9iq"
+    "McZvMbWQMxcT7jucGeoIysBe5sZQ7tyJJ9xBSII+VBu1YM8KYAZCiebnmkPMO5q4wWto11"
+    "dWX4pmA7W2Evorzapgvt9+I6vI1nDlCfao+Kpws4CrCh9zho0Oe5wB5DV/F0TOXdDwka56"
+    "VhIfjDj0f04Z4q53htDBB5JtXxyNPxh3hzXMGzdkIaxw3Q18INhK9mW68UiwS3BO84YAqb"
+    "9wt/POdN+JrhvyCU0rNQumdBLpzFFs7ocM6LWZTrEHHzJ35c00gGzCfPUi9qhxZRDwp4RJ"
+    "KBqYwXJL+yFbFIL/JYpBfpFulFzCKlS1gcQhW5KQosoxcANL3SMgA8XgO9MXnIT6cnZx/P"
+    "Pn24OPuESeiLBCUfMwBVOxpGqyr64YKOgLhWSMqzdUFGUebmidQ1Stc13HkRUeeT11TO5R"
+    "Fz6VJOFHLEvaMWdgipB6tu+BZMc1X3RlN6N6ri3YhMA885X7xbI4yyW3farfTlK6KTXFuz"
+    "GURuklrCqjI1k5FHtKXQDs6fwkVi4EEtHSWlKy/4IS5MMjQ0+HeqpRGw1EWJyRIq7T+07J"
+    "2uQKbcdjs3jFzc/pLr9N4JdLlO72W3+i8vfcXSV7xd3HYW/lCpyJIlgMUU6Mg8jWP3s2VD"
+    "c4x+g2+xMDsBMV//7QpRl5UdbWFp2IU2eA2UYU4KBTFbFOBm/7rZajeS5uwG8LsPW6ovdF"
+    "FhtBw+Mg83gN2D30xV5+tS3Dh5FAGt39aUzsPtbeP7buzdO4g1J/p9MXuXVR1l2bszj2iL"
+    "9i4eKrarU3VPWrmlW7k0DriIkz5gqIuFKwTInp/niZA9P08PkSV1wl4392YxKNPdBQLbSo"
+    "BWSoMpxWMwtqzxFOpEEOlTEz0XGaxJvPUct+e5zrScZxxqOY+fauFEbQzUbLM9yllPu70m"
+    "djr77Ez/C0TGSv3I88le3HUvzvGkMkfmHCCigDvxzkw/cpHAKk9eCF2UdPJC+qP3wHEp/d"
+    "F72a0xfzQ7ijIsehI3xnggPkPpzJc+1gr4WMPpJ12FCcKoYg5DchDZmZiJB7q42qNstyGj"
+    "K8Fz+IWLdeTPXalG7ICRdCCW7UCUgaqFl2F+wBZbjgXOQ8SPZEhIdgEuzyjCeLfnAvQFYX"
+    "zWNrwsECzxwwA1W3dq51IBxsxEA9T9vUMqrVfkM+82Gt07WLoq7CH3FoGfQ2T4u1sC8vft"
+    "Tkvt3FwqPgnG/lpTH9uX3lFXOED9hz4hInk5nIVDyFbLxvE5Ry98Tu2Fz7GDT9JXUX+jVv"
+    "oq9rJbqxTj3rFc88kcAb8zYkp8pD5TjUccZfkhAFJZ34ayXtU8QzFMq6Bt0m9dUe1hvLvO"
+    "Xtft3ehq51HV2jSbmW6iF9OFJA8ZlpFED/JjfAYIA6NdkpQjLstW99Bm2ekWcBUN6OQ4hw"
+    "p0cpyeifFYVIIOLWCllI3/GXQcvHbEYUwPVuFY6gLktiNVZKq8LWzYEoUxDvCVhU17gJIx"
+    "ZiwCvkPMU9bALaoc5Qf1qtu9jYB6pYpD84F4Ft6dUIQxkek5lr3UEDIn3N6ZHp5FWRHbI7"
+    "LBlWB7iBtg6bYH7+6Utkf9bQ/6bwG9jdFvRttYDmPlo4zx/Mdop3hhkzHkWGoSXbwF5fcV"
+    "Dh3TLTQWOZZa4iij3utmS4TZUCFJKUCTj4O3hMmfmvYso4WVEqHtYAxvIBWa3D/ZS21X7p"
+    "/sWbcW3T/h87SEGXkEp4DP+fNvPTgFKQtOPPlP9Xo5LbJM8D6FJzVXx4E7FFpTHPwTzGvi"
+    "UMvD3N/LtOwZIglGPQdWuj3P98sWThJ/9a8zI48zHe+KGfgC5e1le2/qS+NKGlfZxlVEHs"
+    "SXiay9BJFV7ilIG2vvlHFpY+1lt8rzdPI8nTxPVxFb7Uiep6vMeTrpTBJXBno32HogaLiJ"
+    "miOAhxE9/IFG/mXu66HRYq291R0X15oNHddCm0BFY23VDJQyfW107iQ42ticSveyBRO3ZB"
+    "cbS5tJ3WxcDk3/rJdY7N9IDWMVoX2Q0hKV9ujZrwbk0sQY6dgG84lu2QZ+WbHOwF8CZMJ8"
+    "mUpQ+v2qquFtze9Xw2OsrmVY8Zne0LqtLu4xXDlAake/73Vveu1+/1IxkY6FH5m1zgD12o"
+    "9q+/dLxYYvJnwdoFa3075UDH+tLXyW4yTPWY6T9LMcJ+JgnwPvmre8AoPRbxH/NaTsFkLZ"
+    "/MUtBmG2Ty7k2oBDrlpSo0L+N/bZmX5VXnOJa9LmODW6S2CsV0TX59PTDx8+nh5/uPh0fv"
+    "bx4/mn4yC0K16VFeN1pd6QLYhI98X3JF6g7SSup6nochzbuzT0ZG1cNxYpRzXuAoKZ0W9R"
+    "MKPjjYnmUhQ5uRG2BzsmciNsL7s15tRi7omCGzoC2wFugskdxDXA87xZRW+L4pkOETR5x9"
+    "Ymtl8Dh2wMxMPbQBTEeMr2obw0amOXRvlu/PXRy7nHWN2hF5HmOQae3Pkvbed/Yk4N3Blb"
+    "2fSuDqSJavAGdnWb3PpSH8EWQWM4tUbP/lkYufHvwZEieg4SELKr4rDkFOvh0fObqhkahU"
+    "IgeOBm5GWTPN4+axdBzcJ/8qIXtlcfwbtCSEggVFNCQ3ihmx0iokdE/abTs7v+KkgvBxVT"
+    "svvVNE4jJJChGWWGZvi9vUqqJ4FVei4r5pCms7nYROFYDsUTUonbxmuFWIbviIn37RjvFV"
+    "J4jgT7k5tIVbspu8KopV2VHaCWbq6XHXPL2SUpKlbUclmiZInh40v1rEZTGTBDSxm+DRoK"
+    "NMbwUvlGmvumjABClqvQy1eVBXLNqfLNo7a/KaajPJnIdCbQeN8QOmyT7WZqfD5XgtIXCR"
+    "iOkEnVr0zVT8Yh7KXa58+ggnpMlOtQVBm5YS33Xnd7i4C00XIglmFxyP3WtfZbpcG2isHG"
+    "lFQJnKg4yBPq+3Tja2QLJcXs5bdYlhi9bHcnp8WrTSC7iE95Z9nKFDjYEoXI/VExFvAnYm"
+    "AorEnFelIAvY/mX4qFcLn1inltWhK3eTfasswgvy21Kd2U9TprhT2MCGM9TdmamK7sszNt"
+    "VzIHV+hFjk2eW9txF0qv0l56lapjqJZ9X8cGzdQiWtsym4wFvpRsWGwJ3fXtsU1ruX6YVa"
+    "qWG4ZhLdVyueCvsuJn2DFUcTdFqpplq5o1OTK85kK24VPDpqM7CMydiZWgFizLqstzyqS6"
+    "QpqHgpdKbvBCyWqZOqXcKDmaAISXDCYHCuAc59wV4pxYHS7MqWsi5z15YEmStZx+kDaFtC"
+    "kOdfOrEgGKlfKJyPjEZajVOT6xups1aeGJVdimCXOlpliwkWSqS0zYaBLXLeULpc0SSGnK"
+    "T2nIlp6UU66+BVffcHgWVEMjjFINrZgaKmPXZCTWbiKxdqMuUD0sQUtg+lm6ckAUoPJVAr"
+    "n0l730P5m243YKXsUXYZJ5uQMwSfBQUSx5HgllACWcAXNaBMeAYTMglr35uQUI58BxXi07"
+    "QVJmJc8OeeRo5DatHqFt4gYTwFyyZ8Uzyi0r6cw/ACtKpr/dg24N0s/kDGPa3fVo1fESJ5"
+    "5umEE8XNF4TTjuvFbqDwd/w/vqcOT3C1QUjiBjzvYu0asoEmxgHDwQXMqtDcjPPcmvyI+O"
+    "Xd60WOUxs5scgxVCpGwXaR86Hr4prtKg/miZy1R3eFLpOq2z65T0p1o4AEc9qE2iaCrUJ1"
+    "w50aznpATKGfcGCXz19EuVcrWbdKDsgaXtOVDWOjG0ueWuCW1zNEla6PyazCUOhDSVWdtS"
+    "D2MkLm0J5zD8HtvpbsFGDmGscJIlXSqnH2WpiUAuZaOATI0CIPrk9QTw5Pg4B4CYKv2yV1"
+    "InrGgWchOv/cg4YBGyyLMs4mrEzlDsdHn5/n93pMOv"
+)
@@ -0,0 +1,115 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "project_task_counters" (
+    "todo" INT NOT NULL DEFAULT 0,
+    "in_progress" INT NOT NULL DEFAULT 0,
+    "review" INT NOT NULL DEFAULT 0,
+    "done" INT NOT NULL DEFAULT 0,
+    "total" INT NOT NULL DEFAULT 0,
+    "updatedAt" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "project_id" UUID NOT NULL PRIMARY KEY REFERENCES "projects" ("id") ON DELETE CASCADE
+);
+COMMENT ON TABLE "project_task_counters" IS 'Number of tasks in a project per status, updated in the same transaction as every task write';
+INSERT INTO "project_task_counters" ("project_id", "todo", "in_progress", "review", "done", "total")
+SELECT project_id,
+       count(*) FILTER (WHERE status = 'todo'),
+       count(*) FILTER (WHERE status = 'in_progress'),
+       count(*) FILTER (WHERE status = 'review'),
+       count(*) FILTER (WHERE status = 'done'),
+       count(*)
+FROM "tasks"
+GROUP BY project_id;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "project_task_counters";"""
+
+
+MODELS_STATE = (
+    "eJztXW1z4jgS/isqvuxMFTuVZJLMTO7qqkhgs+wmkAKS3ZphyqNgBXwxMmubZLmt/PeTbM"
+    "uW5RdswGCDvmQGqVu2n9ZLd6vV+qc2NVSkWx8aI1t70exF7QL8U8Nwish/InV1UIOzWVBD"
+    "C2z4qDvE0KXSkFMMHy3bJEWk5gnqFiJFKrJGpjazNQOTUjzXdVpojAihhsdB0Rxrf82RYh"
+    "tjZE+QSSq+fSfFGlbR36Rx8vNbzTDHiqbSB41MBG2kKtCmv0gZoeXrEbbJqyv2YoaykNOv"
+    "IO8XS0nfYvasPGlIV0M4uaxOufsgUnZ/327+4lDSr3xURoY+n+KAerawJwb2yedzTf1AeW"
+    "jdGGFk0odz6FFwPKhZkQsUKbDNOfIRUoMCFT3BuU5lUPv30xw7nwacJ9E/p/+p5ZDKyMBU"
+    "ohq2qQj+eXO/Kvhmp7RGH3X1a6P37uP5e+crDcsem06lg0jtzWGENnRZHXEGQArCCiN6NY"
+    "FmC8+nDqpt8jYQj1AEXaEJAWbyCasAzAoChINOzSBm0IXwrA0a/d+JPKD1PMR3ve5vravB"
+    "BZiZxn/RyB7ibu+60Wl/bQza3c4FIL0QYu1/kPXA5VKoTeHfio7w2J6Qn8cnKVJ5aPQcwR"
+    "yfOIIxyOB0x23Hqzlxqqh8IvLI179DTJvs5itLYSu9OkAtmENW6cABdxn6rnLVazUGrabb"
+    "hxVvUhxip64/aAzu+wqBpnPtk5DPsueWMppAPPYpm63+Va99R/u5cn/X5FrknqnMZyrXeq"
+    "Pfb193fEJoWdoY+7X3HaF+jgWKQXtw0xKeRnqmjsLP6Svt27tuz6exFG06M0yn3huxAQje"
+    "yA1wYBT+YxiF/wxGQUdZ+4EngeZoor3wNL1Wf9Dt8TSkl9mGSWn4uSJ4IX7OCN4qROu/Wo"
+    "jWf78QbbN104rSkrUeObS3rdvLVk9pNJuUZoqmj8hUoKpydb3WbfeBqzXR1Hjh67tEKH6P"
+    "YUQGkYrXY1aZ+U5OM8x8J6eJMx+tCo/hKbIhXaaio/i3frcTP/HxPMLYvccEx2+qNrLrQN"
+    "cs+3uGkewt4uWY/uhX03eeWtZfOg/eu9vGnyKuVzfdS3GepA1cCiDPLSL7fIsLx3KIS0ug"
+    "qGYFLOA4RLzCSnwYsyapsbUpisctzClgp3qsH9h/yolhjXyD2sX6wptNUjAdtG/J2tO4vQ"
+    "sNcrpw0JoTp3QhlL47Fwa+3wj4oz34FdCf4Gu30xIF5dMNvtboO8G5bSjYeKVLSTDxsVIG"
+    "zBu1v56eOcOBFjzC0fMrNFUlUmOcGEm00arpyVQsgRiOHbFQcOlrCuZwz9D1+ayWYjB7FP"
+    "UMZvOCroGEOJvxXGNPACNjToQNZsgMLdl1pkDUwf3gCqhwASBWgatb1sEzmtlgNDdNoquD"
+    "xwUgdjZgLwJeTc1G5gdxHd7GM4e472iPwNUFLABN5D4Oqc7zbGiOkQ1cHRO8+ylG47xQDY"
+    "x+el93Hu6qcpbbxhDTZzo6Hn06+RB3jAMyaie0cdKA81qkgeDVTOPVwSLGLcE7DpjC5v4i"
+    "H895E76n+C8opfQsFO5ZkAtnvoUz3J2zYhbmOkTcvIEf1TTiAfPI09SLyqFF1YMcHpF4YE"
+    "rjBcmubIUs0vMsFul5skV6HrFInSUsCmEb2wkKLKMXANTc0iIAPFoDvTF9yM8nx6efTj9/"
+    "PD/9TEicF/FLPqUA2u4MCFpl0Q/nTg+IaoW0PF0XZBRFbp5IXaNwXcOe5ZnqPPKKznNZpr"
+    "nkWU6c5Kh7p53bIdQ+WHXDs2Aaq7o3GtK7URbvRmgYuM75/GINMUqx7lSszsuXRCe5MqZT"
+    "hO04tYRVpWomI5doS6EdnD+Fi8QgnVo6SgpXXshDbBRnaAzQ34mWhs9SFSUmbVJp/TlI3+"
+    "ny55SbbueakYvbX3Kd3rsJXa7TeylW7+Wlr1j6ireL287CH0oVWbIEsIgCHRqnUex+MUyk"
+    "jfHvaBEJsxMQ8/TfrhB1WdreFpQGIjThq68Mc7OQH7PlANzoXzWarVrcmN0AfndBS9WFLj"
+    "wZLYePjsMNYHfvNVPW8boUN24+CoHWbw1A5/7mpva2G3v3FhHNyfm+iL3Lqupp9u7UJdqi"
+    "vUu6imkrjronrdzCrVwnDjiPk95nqIqFKwTInp1liZA9O0sOkaV1wl4392YRKJPdBQLbSo"
+    "CWSoMpxGMwNoyxjhQ6ESm6hp/zdNY43mr227NMZ1rOUg61nEVPtXBTbQTUdLM9zFlNu70i"
+    "djr77FT/C8LqSnLk+aQUdy3FGRlU2kibQUwVcCsqzOQjFzGs8uSFIKK4kxfSH70Hjkvpj9"
+    "5LsUb80ewoymPek7gRxgPxGUpnvvSxlsDHGgw/6SqMmYxK5jCkB5GtiRZ7oIurrae7DRld"
+    "AZ7Db1ysI3/uqq1GDhhJB2LRDkQZqJp7GeY7bL7lWOA8RPxohoR4F+DyjCKMd3suQG8ijI"
+    "7ampsFgiV+GOJG87bduQBQnWp4iLt/dGil8Yo95t1Go7sHS1eFPeDeIvAzhFVvd0tA/q7V"
+    "abY71xfAIyHYXw3aD60L96grGuL+fZ8S0bwc1tyiZKtl4/iSQQpfEqXwJXLwSfoqqm/USl"
+    "/FXoq1TDHuHcPWnrQR9IQRUeJD9alqPOYoiw8BkMr6NpT1suYZimBaBm3T+dYV1R7Gu+vs"
+    "dd3etdLuPLQHLSebmaLhF81GNA8ZmSOpHuTF+AwxAWZwQVOO2Cxb3X2LZaebo1U0oOOjDC"
+    "rQ8VFyJsYjUQk6tICVQjb+p8iyyNoRhTE5WIVjqQqQ245UkanytrBhSxXGKMCXBjHtIY7H"
+    "mLEI+D4SnqI6bl7lKDuol93uTQjUy7bYNe+pZ+HdsYMwIdJcx7KbGkLmhNs708O1KEtie4"
+    "Q2uGJsD3EDLNn24N2d0vaovu3h/JtDb2P0m9E2lsNY+ihjMv4J2gle2HgMOZaKRBdvQfl9"
+    "RY+WZufqixxLJXGUUe9VsyWCbKiIphRwko/DRczgT0x7ltLCSonQdtCHN5AKTe6f7KW2K/"
+    "dP9kysefdP+DwtQUYewSngcf7yew/pMGHBiSb/KZ+UkyLLBO9TcFJzdRy4Q6EVxcE7wbwm"
+    "DpU8zP1WpGXPEIkx6jmwku15Xi5bOEn83bvOjD5Os9wrZtALkreX7b2pL40raVylG1eh+S"
+    "C6TKTtJYisck9B2lh7p4xLG2svxSrP08nzdPI8XUlstbo8T1ea83TSmSSuDM7dYOuBMCBN"
+    "VBwB0o2cwx945F3mvh4aTdbaouq42Mb00bINvAlUBqytioGSy9cm4Ofe5BeTOJGB18VoYJ"
+    "A/mR2VFMmroNXKTOZvq3kh+c9NdkgKoCz1TSq8cDJeQNmZ0/N7wHjy7lPUMIDs/kfnpkb3"
+    "9FsdeJYQJaBXK1rkjQkCEFvuDV8AWgC9IHPhtOPeA1kToC30YUNM74kkjWiGqo2gri+AiY"
+    "i8RppOGoJjIjTLBtzFkRS8D8CD2gKvGumec5u8kGm8ggl8QQAbLm3StZFZY7DKlle56GCi"
+    "YryytqEaOeIHGPnB3JoW8hBihXSfcXy8VSJkAtdBImeiFw295gAtYDhIvFRP88mIFiM/SK"
+    "xsw4Z6rinMoz9ItKTPdl98tmvF9mdIdc+sjYweozViI7akOW0kzf3mQiccV0iMmcJcJMmG"
+    "ie+HKThignUNJ2qC6yde6g6xGFqWNsYIRSqCqSOhJUcQ+NmrhiZ1k4mkYxPOJophquRlxT"
+    "qVfAmU95/JzPAyjKOsPp6thXFUMCsRM6oFJ9Kg2+wSiZHKIW53lLte97rX6vcvAGdRDnGv"
+    "9dBu/XEBXItpiJtEwbgAzCLIfTT/OMvR/OPko/nHYmefQffW7qwTBqPfIv5rzLJbOJnkLW"
+    "451fWAawO6erlmjRKp5uyzU8NkeM0lIsVLbZxoqQqM1Tqg8+Xk5OPHTydHH88/n51++nT2"
+    "+cg3XaNVaTbsZfuamrEh8UXt2hdkWrHraSK6HMf2PAHHa+O6OZ8czHdtCqPf4sSMjzY2NR"
+    "eiyMm4xj1wpsi4xr0UayRGgbkncm4YCmwHGNMoA0LXAM/1ZuXdpOaZDhG0km3tlxm3lGha"
+    "3yEbAfHw4kGFaTwhGlTeAbyxO4A9N/766GUMGS1v1wvN5hk6ngzkLiyQe6LpKhFGjBtm8z"
+    "HM5YE0Vg3eQJBug1tfqjOxhdB41I3Rs5faQMZxu3AkTD0HCQjdVbFYrsH18Oh5TVUMjRUj"
+    "2k00pS+7kWh2F72gvepMvCuEhPiTakJoCD/ppoeIKKGpftO3bdneKkhTwUdu2PKqnTiNgE"
+    "CGZhQZmuFJe5XMvQKr9FyWzCHtjOZ8A4VjORRPSMiFX+I7LcqDWIrviE3v2zHeS6Tw1AX7"
+    "kxtIy50ecytO4ynKaC8xatxgyhBHu7VE5IJdkqBihS2XJUqWeBp4+eHABhgyQws8LoY1gN"
+    "QxugA/aHM/wAhibNj0zJ5pgzm2NR38cKnNH0CzwJOGNWuCVOf4XOgc4AbbTdX4PK4YpS8U"
+    "MBwik6pfkaqfjEPYS7XPG0E59Zgw16GoMnLDWu697vZSOGmjZUAsxeKQ+61r7bdKg20Vg4"
+    "0pqRI4UXGQCce2vU9dtOHrb6EkmL38FssSo5ft7mS0eAcTxO5VB+8ME+jQIpYowvZ7oM7R"
+    "z9TAAKxJmscGOhli/gUMjJy8MTSJDS2J2rwbbVleCLYttSnZlHWFtcIeRoixmqZsRUxX9t"
+    "mptisdgytIkWOT59Z2LELpVdpLr1J5DNXyZkyLmKl5tLZlNlnOxCqrGhZlyaqy1B7btJbr"
+    "hVklarlBGNZSLZcL/ioqfoYdQxV3U6SqWbSqWZEjw2suZJvOgWgpFoYza2LEqAXLLknhOe"
+    "UdKUKaB9JNo4jSy+7j4WT0Ao73mHzdN1Ub2XWga5b9vZzdMgVT+skhTCNZYcQEMMLQpw2I"
+    "WWFGE4jJksHmgRw4Rzl3hTg3rT7ONd3WsPWBPrCgmbUYOUibQtoUh7r5VYoAxVL5RGR84j"
+    "LUqhyfWN7NmqTwxDJs0wRXXyRYsKG7MZaYsOE7ObaUL9RplkLqpPyUhmzhSTnl6ptz9Q26"
+    "Z041NMQo1dCSqaEydk1GYu0mEms36oKjh8VoCUw/S1YOqAJUvEogl/6il/4nzbTsTs6b1U"
+    "NMMi+3DyYNHsqLJc8jofShRFOoxVzKkoyjz7AZEIve/NwChDNoWa+GGTNTpiXPDnhkb+Q2"
+    "rR6QqZEGY8BcsmfFM8otK+nMPwArSqa/3QOx5r0iane3XZfHSxx7umGKSHfF4zXhuHVbqT"
+    "4cnjG8JhzZ/QIlhcPPmLO9O9FLigTrGAcPBJdyawPz557kV+R7RyRVxnro5MovWOY+s5sc"
+    "gyVCpGgXaR9ZLr4JrlK/vr7MZapYPKl0nVbZdUrl2c4dgNM+qE2icCrUJ1I5GRjPcQmUU+"
+    "4NEviq6Zcq5Go36UDZA0vbdaCsdWJoc8tdA5naaBK30Hk1qUscDGhKs7YlHsaIXdpizmF4"
+    "EtvpbsFGDmGscJIleVZOPspSkQm5kI0COjRygOiRVxPA46OjDAASquTLXmmdsKIZ2I699i"
+    "PlgEXAIs+yiKsRO0Ox0+Xl7f/iuECx"
+)
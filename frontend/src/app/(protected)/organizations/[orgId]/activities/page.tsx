@@ -41,6 +41,7 @@ const ACTION_LABELS: Record<string, string> = {
   task_assigned: "assigned task",
   task_unassigned: "unassigned task",
   task_title_updated: "renamed task",
+  tasks_imported: "imported tasks into",
   project_created: "created project",
   project_updated: "updated project",
   project_archived: "archived project",